@@ -16,9 +16,11 @@ Workflow definition for the test suite
 from __future__ import annotations
 
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from copy import deepcopy
+from itertools import islice
 from logging import Logger
-from typing import List, Optional, cast
+from typing import Dict, Iterable, List, Optional, cast
 
 from pydantic import BaseModel, ValidationError
 
@@ -27,11 +29,14 @@ from metadata.data_quality.api.models import (
     TestCaseDefinition,
     TestSuiteProcessorConfig,
 )
+from metadata.data_quality.runner.models import TestCaseResultResponse
+from metadata.data_quality.source.base_test_suite_source import SharedEngines
 from metadata.data_quality.source.test_suite_source_factory import (
     test_suite_source_factory,
 )
 from metadata.generated.schema.api.tests.createTestCase import CreateTestCaseRequest
 from metadata.generated.schema.api.tests.createTestSuite import CreateTestSuiteRequest
+from metadata.generated.schema.entity.data.database import Database
 from metadata.generated.schema.entity.data.table import Table
 from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
     OpenMetadataConnection,
@@ -57,6 +62,7 @@ from metadata.ingestion.api.parser import parse_workflow_config_gracefully
 from metadata.ingestion.api.processor import ProcessorStatus
 from metadata.ingestion.ometa.client_utils import create_ometa_client
 from metadata.utils import entity_link
+from metadata.utils.custom_thread_pool import CustomThreadPoolExecutor
 from metadata.utils.fqn import split
 from metadata.utils.importer import get_sink
 from metadata.utils.logger import test_suite_logger
@@ -118,6 +124,7 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
         self.table_entity: Optional[Table] = self._get_table_entity(
             self.source_config.entityFullyQualifiedName.__root__
         )
+        self.engines = SharedEngines()
 
         if self.config.sink:
             self.sink = get_sink(
@@ -186,14 +193,63 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
             fields=["tableProfilerConfig", "testSuite"],
         )
 
-    def create_or_return_test_suite_entity(self) -> Optional[TestSuite]:
+    def get_table_entities(self) -> Iterable[Table]:
+        """
+        Tables to test. `entityFullyQualifiedName` is either a table,
+        or a service, database or schema whose tables are all tested.
+        Test cases from the processor config can only be added to a table.
+        """
+        fully_qualified_name = self.source_config.entityFullyQualifiedName.__root__
+        if self.table_entity:
+            yield self.table_entity
+            return
+
+        fqn_parts = split(fully_qualified_name)
+        if len(fqn_parts) > 3 or self.processor_config.testCases:
+            raise ValueError(
+                f"Could not retrieve table entity for {fully_qualified_name}. "
+                "Make sure the table exists in OpenMetadata and/or the JWT Token provided is valid."
+            )
+
+        # Tables can only be listed by database or schema
+        if len(fqn_parts) == 1:
+            tables_params = [
+                {"database": database.fullyQualifiedName.__root__}
+                for database in self.metadata.list_all_entities(
+                    entity=Database, params={"service": fully_qualified_name}
+                )
+            ]
+        elif len(fqn_parts) == 2:
+            tables_params = [{"database": fully_qualified_name}]
+        else:
+            tables_params = [{"databaseSchema": fully_qualified_name}]
+
+        service_name = fqn_parts[0]
+        for params in tables_params:
+            for table in self.metadata.list_all_entities(
+                entity=Table,
+                fields=["tableProfilerConfig", "testSuite"],
+                params=params,
+            ):
+                # Tables of other services can't be tested with this connection
+                if not table.service or table.service.name != service_name:
+                    logger.debug(
+                        f"Skipping table {table.fullyQualifiedName.__root__}"
+                        f" not belonging to service {service_name}"
+                    )
+                    continue
+                yield table
+
+    def create_or_return_test_suite_entity(
+        self, table_entity: Optional[Table] = None
+    ) -> Optional[TestSuite]:
         """
         try to get test suite name from source.servicName.
         In the UI workflow we'll write the entity name (i.e. the test suite)
         to source.serviceName.
         """
-        self.table_entity = cast(Table, self.table_entity)  # satisfy type checker
-        test_suite = self.table_entity.testSuite
+        table_entity = cast(Table, table_entity or self.table_entity)
+        test_suite = table_entity.testSuite
         if test_suite and not test_suite.executable:
             logger.debug(
                 f"Test suite {test_suite.fullyQualifiedName.__root__} is not executable."
@@ -382,30 +438,28 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
 
         return test_cases
 
-    def run_test_suite(self):
-        """Main logic to run the tests"""
-        if not self.table_entity:
-            logger.debug(traceback.format_exc())
-            raise ValueError(
-                f"Could not retrieve table entity for {self.source_config.entityFullyQualifiedName.__root__}. "
-                "Make sure the table exists in OpenMetadata and/or the JWT Token provided is valid."
-            )
+    def run_table_tests(self, table_entity: Table) -> List[TestCaseResultResponse]:
+        """Run the test cases of the executable test suite of a table
 
-        test_suite = self.create_or_return_test_suite_entity()
+        Args:
+            table_entity: table to test
+        """
+        table_fqn = table_entity.fullyQualifiedName.__root__
+        test_suite = self.create_or_return_test_suite_entity(table_entity)
         if not test_suite:
             logger.debug(
-                f"No test suite found for table {self.source_config.entityFullyQualifiedName.__root__} "
+                f"No test suite found for table {table_fqn} "
                 "or test suite is not executable."
             )
-            return
+            return []
 
         test_cases = self.get_test_cases_from_test_suite(test_suite)
         if not test_cases:
             logger.debug(
-                f"No test cases found for table {self.source_config.entityFullyQualifiedName.__root__}"
+                f"No test cases found for table {table_fqn}"
                 f"and test suite {test_suite.fullyQualifiedName.__root__}"
             )
-            return
+            return []
 
         openmetadata_test_cases = self.filter_for_om_test_cases(test_cases)
 
@@ -413,25 +467,100 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
             self.service.serviceType.value.lower(),
             self.config,
             self.metadata,
-            self.table_entity,
+            table_entity,
+            engines=self.engines,
         ).get_data_quality_runner()
 
-        for test_case in openmetadata_test_cases:
-            try:
-                test_result = test_suite_runner.run_and_handle(test_case)
-                if not test_result:
+        try:
+            test_suite_runner.prepare(openmetadata_test_cases)
+        except Exception as exc:
+            # The test cases will run one by one
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Could not prepare the test cases to run together: {exc}")
+
+        test_results = []
+        try:
+            for test_case in openmetadata_test_cases:
+                try:
+                    test_result = test_suite_runner.run_and_handle(test_case)
+                    if not test_result:
+                        continue
+                    test_results.append(test_result)
+                    logger.debug(
+                        f"Successfully ran test case {test_case.name.__root__}"
+                    )
+                    self.status.processed(test_case.fullyQualifiedName.__root__)
+                except Exception as exc:
+                    error = f"Could not run test case {test_case.name.__root__}: {exc}"
+                    logger.debug(traceback.format_exc())
+                    logger.error(error)
+                    self.status.failed(
+                        test_case.name.__root__, error, traceback.format_exc()
+                    )
+        finally:
+            test_suite_runner.close()
+
+        return test_results
+
+    def _table_failed(self, name: str, exc: Exception) -> None:
+        """Record the failure of a table, the other tables keep running"""
+        error = f"Could not run the tests of table [{name}]: {exc}"
+        logger.debug(traceback.format_exc())
+        logger.error(error)
+        self.status.failed(name, error, traceback.format_exc())
+
+    def run_tables(
+        self, tables: Iterable[Table]
+    ) -> Iterable[List[TestCaseResultResponse]]:
+        """
+        Run the tests of the tables and yield their results as they are ready.
+
+        With more than one table thread, the tables are tested in a pool
+        sharing the engines of their databases, and the results of each
+        table are handed over as soon as it is done, so that the sink
+        writes them from the main thread while the pool keeps testing.
+        """
+        threads = self.source_config.tableThreadCount or 1
+        if threads <= 1:
+            for table_entity in tables:
+                try:
+                    test_results = self.run_table_tests(table_entity)
+                except Exception as exc:
+                    self._table_failed(table_entity.fullyQualifiedName.__root__, exc)
                     continue
-                if hasattr(self, "sink"):
+                yield test_results
+            return
+
+        tables = iter(tables)
+        pool = CustomThreadPoolExecutor(max_workers=threads)
+        futures: Dict[Future, str] = {}
+        try:
+            while True:
+                # Only queue a few tables ahead of the pool
+                for table_entity in islice(tables, 2 * threads - len(futures)):
+                    future = pool.submit(self.run_table_tests, table_entity)
+                    futures[future] = table_entity.fullyQualifiedName.__root__
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    try:
+                        test_results = future.result()
+                    except Exception as exc:
+                        self._table_failed(name, exc)
+                        continue
+                    yield test_results
+        finally:
+            pool.shutdown39(wait=False, cancel_futures=True)
+
+    def run_test_suite(self):
+        """Main logic to run the tests"""
+        for test_results in self.run_tables(self.get_table_entities()):
+            if hasattr(self, "sink"):
+                for test_result in test_results:
                     self.sink.write_record(test_result)
-                logger.debug(f"Successfully ran test case {test_case.name.__root__}")
-                self.status.processed(test_case.fullyQualifiedName.__root__)
-            except Exception as exc:
-                error = f"Could not run test case {test_case.name.__root__}: {exc}"
-                logger.debug(traceback.format_exc())
-                logger.error(error)
-                self.status.failed(
-                    test_case.name.__root__, error, traceback.format_exc()
-                )
 
     def _retrieve_service_connection(self) -> None:
         """
@@ -501,4 +630,5 @@ class TestSuiteWorkflow(WorkflowStatusMixin):
         """
         Close all connections
         """
+        self.engines.dispose()
         self.metadata.close()
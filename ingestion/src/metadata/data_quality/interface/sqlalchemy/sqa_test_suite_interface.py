@@ -15,12 +15,15 @@ supporting sqlalchemy abstraction layer
 """
 
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
+from uuid import UUID
 
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy.orm.util import AliasedClass
 
 from metadata.data_quality.interface.test_suite_interface import TestSuiteInterface
+from metadata.data_quality.runner.fused_metrics import FusedMetrics
 from metadata.data_quality.validations.validator import Validator
 from metadata.generated.schema.entity.data.table import Table
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
@@ -53,12 +56,14 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
         service_connection_config: DatabaseConnection,
         ometa_client: OpenMetadata,
         table_entity: Table = None,
+        engine: Optional[Engine] = None,
     ):
         self.ometa_client = ometa_client
         self.table_entity = table_entity
         self.service_connection_config = service_connection_config
+        # Tables tested in the same run can share the engine of their database
         self.session = create_and_bind_session(
-            get_connection(self.service_connection_config)
+            engine or get_connection(self.service_connection_config)
         )
         self.set_session_tag(self.session)
         self.set_catalog(self.session)
@@ -74,6 +79,11 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
         self._sampler = self._create_sampler()
         self._runner = self._create_runner()
 
+        self.fused_metrics = FusedMetrics(self.runner)
+        # Results of the test cases validated while computing their metrics
+        self._prepared_results: Dict[str, Union[TestCaseResult, Exception]] = {}
+        self._test_definition_types: Dict[UUID, str] = {}
+
     @property
     def sample(self) -> Union[DeclarativeMeta, AliasedClass]:
         """_summary_
@@ -139,6 +149,42 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
             )
         )
 
+    def _validate(self, test_case: TestCase) -> TestCaseResult:
+        """Validate the test case, sharing the metrics of the table"""
+        # Test cases can be validated in several rounds
+        definition_id = test_case.testDefinition.id.__root__
+        if definition_id not in self._test_definition_types:
+            self._test_definition_types[definition_id] = self.ometa_client.get_by_id(
+                TestDefinition, test_case.testDefinition.id
+            ).entityType.value
+
+        TestHandler = import_test_case_class(  # pylint: disable=invalid-name
+            self._test_definition_types[definition_id],
+            "sqlalchemy",
+            test_case.testDefinition.fullyQualifiedName,
+        )
+
+        test_handler = TestHandler(
+            self.runner,
+            test_case=test_case,
+            execution_date=datetime.now(tz=timezone.utc).timestamp(),
+        )
+        test_handler.fused_metrics = self.fused_metrics
+
+        return Validator(validator_obj=test_handler).validate()
+
+    def prepare_test_cases(self, test_cases: List[TestCase]) -> None:
+        """Validate the test cases in rounds, computing the metrics
+        they ask for in each round together. See `FusedMetrics`.
+
+        Args:
+            test_cases: test cases of the table
+        """
+        for test_case, result in self.fused_metrics.run_in_rounds(
+            test_cases, self._validate
+        ):
+            self._prepared_results[test_case.fullyQualifiedName.__root__] = result
+
     def run_test_case(
         self,
         test_case: TestCase,
@@ -153,23 +199,21 @@ class SQATestSuiteInterface(SQAInterfaceMixin, TestSuiteInterface):
         """
 
         try:
-            TestHandler = import_test_case_class(  # pylint: disable=invalid-name
-                self.ometa_client.get_by_id(
-                    TestDefinition, test_case.testDefinition.id
-                ).entityType.value,
-                "sqlalchemy",
-                test_case.testDefinition.fullyQualifiedName,
+            result = self._prepared_results.pop(
+                test_case.fullyQualifiedName.__root__, None
             )
+            if isinstance(result, Exception):
+                raise result
+            if result is not None:
+                return result
 
-            test_handler = TestHandler(
-                self.runner,
-                test_case=test_case,
-                execution_date=datetime.now(tz=timezone.utc).timestamp(),
-            )
-
-            return Validator(validator_obj=test_handler).validate()
+            return self._validate(test_case)
         except Exception as err:
             logger.error(
                 f"Error executing {test_case.testDefinition.fullyQualifiedName} - {err}"
             )
             raise RuntimeError(err)
+
+    def close(self) -> None:
+        """Give the connection of the session back to the pool"""
+        self.session.close()
@@ -15,7 +15,7 @@ supporting sqlalchemy abstraction layer
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from metadata.generated.schema.entity.data.table import Table
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
@@ -46,6 +46,14 @@ class TestSuiteInterface(ABC):
         """run column data quality tests"""
         raise NotImplementedError
 
+    def prepare_test_cases(self, test_cases: List[TestCase]) -> None:
+        """Share the work of the test cases of the table before running
+        them one by one. By default, each test case runs on its own.
+        """
+
+    def close(self) -> None:
+        """Release the resources of the table once its tests have run"""
+
     def _get_sample_query(self) -> Optional[str]:
         """Get the sampling query for the data quality tests
 
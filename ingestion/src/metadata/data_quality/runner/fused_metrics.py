@@ -0,0 +1,176 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Compute the metrics of the test cases of a table together.
+
+Each SQA validator asks for its metrics one at a time, so a table with
+40 column tests used to be scanned 40 times. Instead, the test cases of
+a table run in rounds: the metrics they ask for are recorded and the
+validation is postponed. At the end of the round, the recorded metrics
+are computed in a few wide SELECTs, and the validators run again with
+their values. Validators needing several metrics take one round each.
+"""
+import traceback
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy import Column, label
+from sqlalchemy.sql.elements import Label
+
+from metadata.profiler.metrics.core import StaticMetric
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.processor.runner import QueryRunner
+from metadata.utils.helpers import batched
+from metadata.utils.logger import test_suite_logger
+
+logger = test_suite_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MAX_FUSED_METRICS = 50
+
+# Dialects might not support regular expressions. Keep them in their own
+# query, so that the other metrics are not computed one by one if it fails.
+REGEX_METRICS = {Metrics.REGEX_COUNT.name, Metrics.NOT_REGEX_COUNT.name}
+
+
+class MetricPending(Exception):
+    """The metric will be computed at the end of the round"""
+
+
+def is_fusable(metric: Metrics) -> bool:
+    """Aggregates over the sample can share a SELECT, window functions cannot"""
+    return (
+        issubclass(metric.value, StaticMetric)
+        and not metric.value.is_window_metric()
+    )
+
+
+def get_metric_key(
+    metric: Metrics, column: Optional[Column], **kwargs: Optional[Any]
+) -> Hashable:
+    """Identify the metric of a column, with its props"""
+    return (
+        metric.name,
+        column.name if column is not None else None,
+        repr(sorted(kwargs.items())),
+    )
+
+
+class FusedMetrics:
+    """
+    Values of the metrics of a table, shared by its test cases.
+
+    While `planning`, metrics without a value are recorded and
+    MetricPending is raised to postpone the validation.
+    Metrics that could not be computed together are left to the
+    validators, which run their own query as usual.
+    """
+
+    def __init__(self, runner: QueryRunner):
+        self.runner = runner
+        self.planning = False
+        self.results: Dict[Hashable, Any] = {}
+        self.pending: Dict[Hashable, Label] = {}
+        self.failed: Set[Hashable] = set()
+
+    def get(self, metric: Metrics, key: Hashable, metric_fn: Label) -> Any:
+        """Value of the metric, if it has been computed
+
+        Raises:
+            MetricPending: if the metric is recorded to be computed
+            KeyError: if the validator needs to compute it
+        """
+        if key in self.results:
+            return self.results[key]
+        if (
+            self.planning
+            and key not in self.failed
+            and is_fusable(metric)
+            and isinstance(metric_fn, Label)
+        ):
+            self.pending[key] = metric_fn
+            raise MetricPending(key)
+        raise KeyError(key)
+
+    def run_in_rounds(
+        self, items: List[T], run: Callable[[T], R]
+    ) -> List[Tuple[T, Union[R, Exception]]]:
+        """Run each item until it no longer waits for pending metrics,
+        computing the metrics recorded in a round at its end.
+
+        Returns:
+            the result, or the error, of each item
+        """
+        results = []
+        remaining = list(items)
+        self.planning = True
+        try:
+            while remaining:
+                postponed = []
+                for item in remaining:
+                    try:
+                        results.append((item, run(item)))
+                    except MetricPending:
+                        postponed.append(item)
+                    except Exception as exc:  # pylint: disable=broad-except
+                        results.append((item, exc))
+                self.compute_pending()
+                remaining = postponed
+        finally:
+            self.planning = False
+        return results
+
+    def compute_pending(self) -> None:
+        """Compute the recorded metrics, a batch of them per query"""
+        groups = defaultdict(list)
+        for key, metric_fn in self.pending.items():
+            groups[key[0] in REGEX_METRICS].append((key, metric_fn))
+        self.pending = {}
+
+        for group in groups.values():
+            for batch in batched(group, MAX_FUSED_METRICS):
+                self._compute_batch(batch)
+
+    def _compute_batch(self, batch) -> None:
+        try:
+            row = self.runner.dispatch_query_select_first(
+                *[
+                    label(f"metric_{idx}", metric_fn.element)
+                    for idx, (_, metric_fn) in enumerate(batch)
+                ]
+            )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.info(
+                f"Could not compute {len(batch)} metrics together, "
+                f"computing them one by one: {exc}"
+            )
+            self.runner._session.rollback()  # pylint: disable=protected-access
+            self.failed.update(key for key, _ in batch)
+            return
+
+        values = dict(row) if row else {}
+        for idx, (key, _) in enumerate(batch):
+            self.results[key] = values.get(f"metric_{idx}")
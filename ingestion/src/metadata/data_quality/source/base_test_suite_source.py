@@ -12,8 +12,11 @@
 """
 Base source for the data quality used to instantiate a data quality runner with its interface
 """
+import threading
 from copy import deepcopy
-from typing import Optional, cast
+from typing import Dict, Optional, cast
+
+from sqlalchemy.engine import Engine
 
 from metadata.data_quality.interface.test_suite_interface import TestSuiteInterface
 from metadata.data_quality.interface.test_suite_interface_factory import (
@@ -21,12 +24,42 @@ from metadata.data_quality.interface.test_suite_interface_factory import (
 )
 from metadata.data_quality.runner.core import DataTestsRunner
 from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.database.datalakeConnection import (
+    DatalakeConnection,
+)
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
 from metadata.generated.schema.metadataIngestion.workflow import (
     OpenMetadataWorkflowConfig,
 )
 from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.source.connections import get_connection
+
+
+class SharedEngines:
+    """
+    Engines of the databases of a service, shared by the tables
+    tested in the same run so that they reuse the connections
+    of its pool instead of creating an engine per table.
+    """
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, service_connection_config: DatabaseConnection) -> Engine:
+        """Engine for the connection, created the first time it is needed"""
+        with self._lock:
+            if key not in self._engines:
+                self._engines[key] = get_connection(service_connection_config)
+            return self._engines[key]
+
+    def dispose(self) -> None:
+        """Close the connections of all the engines"""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines = {}
 
 
 class BaseTestSuiteSource:
@@ -37,9 +70,11 @@ class BaseTestSuiteSource:
         config: OpenMetadataWorkflowConfig,
         ometa_client: OpenMetadata,
         entity: Table,
+        engines: Optional[SharedEngines] = None,
     ):
         self._interface = None
         self.entity = entity
+        self.engines = engines
         self.service_conn_config = self._copy_service_config(config, self.entity.database)  # type: ignore
         self.ometa_client = ometa_client
 
@@ -85,9 +120,17 @@ class BaseTestSuiteSource:
         Returns:
             TestSuiteInterface: a data quality interface
         """
+        kwargs = {}
+        # Pandas interfaces read the files of the table, they have no engine
+        if self.engines is not None and not isinstance(
+            self.service_conn_config, DatalakeConnection
+        ):
+            database_id = str(self.entity.database.id.__root__)  # type: ignore
+            kwargs["engine"] = self.engines.get(database_id, self.service_conn_config)
+
         data_quality_interface: TestSuiteInterface = (
             test_suite_interface_factory.create(
-                self.service_conn_config, self.ometa_client, self.entity
+                self.service_conn_config, self.ometa_client, self.entity, **kwargs
             )
         )
         self.interface = data_quality_interface
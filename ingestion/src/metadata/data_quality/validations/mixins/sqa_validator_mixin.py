@@ -18,6 +18,7 @@ from typing import Any, List, Optional
 from sqlalchemy import Column
 from sqlalchemy.exc import SQLAlchemyError
 
+from metadata.data_quality.runner.fused_metrics import FusedMetrics, get_metric_key
 from metadata.profiler.metrics.core import add_props
 from metadata.profiler.metrics.registry import Metrics
 from metadata.profiler.processor.runner import QueryRunner
@@ -30,6 +31,9 @@ logger = test_suite_logger()
 class SQAValidatorMixin:
     """Validator mixin for SQA test cases"""
 
+    # Metrics shared by the test cases of the table, if computed together
+    fused_metrics: Optional[FusedMetrics] = None
+
     def get_column_name(self, entity_link: str, columns: List) -> Column:
         """Given a column name get the column object
 
@@ -72,10 +76,17 @@ class SQAValidatorMixin:
         metric_fn = metric_obj(column).fn() if column is not None else metric_obj().fn()
 
         try:
-            value = dict(runner.dispatch_query_select_first(metric_fn))  # type: ignore
-            res = value.get(metric.name)
-        except Exception as exc:
-            raise SQLAlchemyError(exc)
+            if self.fused_metrics is None:
+                raise KeyError(metric.name)
+            res = self.fused_metrics.get(
+                metric, get_metric_key(metric, column, **kwargs), metric_fn
+            )
+        except KeyError:
+            try:
+                value = dict(runner.dispatch_query_select_first(metric_fn))  # type: ignore
+                res = value.get(metric.name)
+            except Exception as exc:
+                raise SQLAlchemyError(exc)
 
         if res is None:
             raise ValueError(
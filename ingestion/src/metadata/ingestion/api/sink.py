@@ -13,7 +13,7 @@ Abstract Sink definition to build a Workflow
 """
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Generic, List
+from typing import Any, Callable, Generic, List, Optional
 
 from pydantic import Field
 
@@ -43,6 +43,7 @@ class Sink(Closeable, Generic[Entity], metaclass=ABCMeta):
 
     def __init__(self):
         self.status = SinkStatus()
+        self.ack_callbacks: List[Callable[[Entity, Optional[Any]], None]] = []
 
     @classmethod
     @abstractmethod
@@ -56,6 +57,28 @@ class Sink(Closeable, Generic[Entity], metaclass=ABCMeta):
         # must call callback when done.
         pass
 
+    def register_ack_callback(
+        self, callback: Callable[[Entity, Optional[Any]], None]
+    ) -> None:
+        """
+        Register a function to be called with each record
+        and the Entity the sink got back after writing it
+        """
+        self.ack_callbacks.append(callback)
+
+    def ack(self, record: Entity, entity: Optional[Any]) -> None:
+        """
+        Hand the Entity written from a record back to the callbacks
+        """
+        for callback in self.ack_callbacks:
+            callback(record, entity)
+
+    def flush(self) -> None:
+        """
+        Write any record the sink is buffering. Called by the
+        workflow when the source needs the records to be in OM.
+        """
+
     def get_status(self) -> SinkStatus:
         return self.status
 
@@ -0,0 +1,121 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Pipelined execution of the Sink.
+
+The Source keeps producing records in the workflow thread
+while a pool of worker threads drains a bounded queue and
+writes the records to the Sink.
+"""
+import traceback
+from queue import Queue
+from threading import Lock, Thread
+from typing import List, Optional, Type
+
+from metadata.ingestion.api.common import Entity
+from metadata.ingestion.api.sink import Sink
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+_STOP = object()
+
+
+class SinkPipelineException(Exception):
+    """
+    Raised in the workflow thread when a sink worker
+    failed with an unhandled exception
+    """
+
+
+class SinkPipeline:
+    """
+    Bounded queue + worker threads writing records to a Sink.
+
+    Records that depend on each other are kept in order:
+    - Records of different types are not written concurrently, e.g., a Table
+      is never in flight while its tags or its schema are being written.
+    - `wait` blocks until all the queued records have been written. The workflow
+      calls it when the source needs a record to be acknowledged before going on.
+    """
+
+    def __init__(self, sink: Sink, thread_count: int, queue_size: int):
+        self.sink = sink
+        self.queue: Queue = Queue(maxsize=max(queue_size, 1))
+        self.threads: List[Thread] = [
+            Thread(target=self._consume, name=f"SinkWorker-{idx}", daemon=True)
+            for idx in range(thread_count)
+        ]
+        self._last_type: Optional[Type] = None
+        self._error: Optional[Exception] = None
+        self._error_lock = Lock()
+
+    def __enter__(self) -> "SinkPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        for thread in self.threads:
+            thread.start()
+
+    def put(self, record: Entity) -> None:
+        """
+        Queue a record to be written by the sink workers.
+        Blocks if the queue is full.
+        """
+        if self._last_type is not None and type(record) is not self._last_type:
+            self.wait()
+        self._last_type = type(record)
+        self._raise_on_error()
+        self.queue.put(record)
+
+    def wait(self) -> None:
+        """
+        Block until all the queued records have been written
+        """
+        self.queue.join()
+        self._raise_on_error()
+
+    def stop(self) -> None:
+        """
+        Let the workers finish the pending records and stop them
+        """
+        for _ in self.threads:
+            self.queue.put(_STOP)
+        for thread in self.threads:
+            thread.join()
+
+    def _raise_on_error(self) -> None:
+        with self._error_lock:
+            if self._error:
+                raise SinkPipelineException(
+                    f"Error writing records to the sink: {self._error}"
+                ) from self._error
+
+    def _consume(self) -> None:
+        while True:
+            record = self.queue.get()
+            try:
+                if record is _STOP:
+                    return
+                # Keep draining the queue after a failure so that the workflow thread is not blocked
+                if not self._error:
+                    self.sink.write_record(record)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.error(f"Unhandled error in sink worker: {exc}")
+                with self._error_lock:
+                    self._error = self._error or exc
+            finally:
+                self.queue.task_done()
@@ -13,7 +13,8 @@ Abstract Source definition to build a Workflow
 """
 import time
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Generic, Iterable, List
+from datetime import datetime
+from typing import Any, Dict, Generic, Iterable, List, Optional
 
 from pydantic import Field
 
@@ -94,6 +95,34 @@ class Source(Closeable, Generic[Entity], metaclass=ABCMeta):
     def get_status(self) -> SourceStatus:
         return self.status
 
+    def is_ack_pending(self) -> bool:
+        """
+        Flag if the last record yielded by `next_record` needs to
+        be written by the sink before the source can continue, e.g.,
+        because the source will read it back from the API.
+        """
+        return False
+
+    def ack(self, record: Entity, entity: Optional[Any]) -> None:
+        """
+        Receive the Entity the sink wrote from one of our records.
+        Sources that need the created Entities back can keep them
+        instead of reading them from the API.
+        """
+
+    def is_incremental(self) -> bool:
+        """
+        Flag if the source only extracts what changed since
+        the watermark informed with `set_watermark`
+        """
+        return False
+
+    def set_watermark(self, watermark: Optional[datetime]) -> None:
+        """
+        Receive the start of the last successful run of the workflow.
+        None means that there is no previous run to compare against.
+        """
+
     @abstractmethod
     def test_connection(self) -> None:
         pass
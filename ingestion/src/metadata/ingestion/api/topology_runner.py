@@ -13,7 +13,11 @@ Mixin to be used by service sources to dynamically
 generate the next_record based on their topology.
 """
 import traceback
-from typing import Any, Generic, Iterable, List, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from queue import Queue
+from threading import Event
+from typing import Any, Generic, Iterable, List, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -53,6 +57,10 @@ class TopologyRunnerMixin(Generic[C]):
     context: TopologyContext
     metadata: OpenMetadata
 
+    # ack_sink request waiting to be written by the sink, and the Entity the sink handed back
+    ack_request: Optional[Any] = None
+    acked_entity: Optional[Any] = None
+
     def process_nodes(self, nodes: List[TopologyNode]) -> Iterable[Entity]:
         """
         Given a list of nodes, either roots or children,
@@ -72,30 +80,15 @@ class TopologyRunnerMixin(Generic[C]):
                 else []
             )
 
-            for element in node_producer() or []:
-                for stage in node.stages:
-                    logger.debug(f"Processing stage: {stage}")
-
-                    stage_fn = getattr(self, stage.processor)
-                    for entity_request in stage_fn(element) or []:
-                        try:
-                            # yield and make sure the data is updated
-                            yield from self.sink_request(
-                                stage=stage, entity_request=entity_request
-                            )
-                        except ValueError as err:
-                            logger.debug(traceback.format_exc())
-                            logger.warning(
-                                f"Unexpected value error when processing stage: [{stage}]: {err}"
-                            )
-
-                # processing for all stages completed now cleaning the cache if applicable
-                for stage in node.stages:
-                    if stage.clear_cache:
-                        self.clear_context(stage=stage)
-
-                # process all children from the node being run
-                yield from self.process_nodes(child_nodes)
+            if node.threads and self.get_threads() > 1:
+                yield from self.process_elements_in_threads(
+                    node=node, elements=node_producer() or [], child_nodes=child_nodes
+                )
+            else:
+                for element in node_producer() or []:
+                    yield from self.process_element(
+                        node=node, element=element, child_nodes=child_nodes
+                    )
 
             if node.post_process:
                 logger.debug(f"Post processing node {node}")
@@ -108,6 +101,130 @@ class TopologyRunnerMixin(Generic[C]):
                             f"Could not run Post Process `{process}` from Topology Runner -- {exc}"
                         )
 
+    def process_element(
+        self, node: TopologyNode, element: Any, child_nodes: List[TopologyNode]
+    ) -> Iterable[Entity]:
+        """
+        Run the node stages over an element produced by the node
+        and process the children nodes.
+
+        :param node: Topology Node being processed
+        :param element: Result from the node producer
+        :param child_nodes: Children of the node
+        """
+        for stage in node.stages:
+            logger.debug(f"Processing stage: {stage}")
+
+            stage_fn = getattr(self, stage.processor)
+            for entity_request in stage_fn(element) or []:
+                try:
+                    # yield and make sure the data is updated
+                    yield from self.sink_request(
+                        stage=stage, entity_request=entity_request
+                    )
+                except ValueError as err:
+                    logger.debug(traceback.format_exc())
+                    logger.warning(
+                        f"Unexpected value error when processing stage: [{stage}]: {err}"
+                    )
+
+        # processing for all stages completed now cleaning the cache if applicable
+        for stage in node.stages:
+            if stage.clear_cache:
+                self.clear_context(stage=stage)
+
+        # process all children from the node being run
+        yield from self.process_nodes(child_nodes)
+
+    def process_elements_in_threads(
+        self,
+        node: TopologyNode,
+        elements: Iterable[Any],
+        child_nodes: List[TopologyNode],
+    ) -> Iterable[Entity]:
+        """
+        Process the subtree of each element in a pool of threads.
+
+        Each thread works on its own copy of the source, see `get_worker_source`.
+        The records are handed over to this generator one at a time: a thread
+        waits until its record has been consumed - and acknowledged by the sink,
+        if needed - before resuming its subtree.
+
+        :param node: Topology Node being processed
+        :param elements: Results from the node producer
+        :param child_nodes: Children of the node
+        """
+        records: Queue = Queue()
+        cancelled = Event()
+
+        def _process_element(element: Any) -> None:
+            if cancelled.is_set():
+                return
+            worker = self.get_worker_source()
+            try:
+                for record in worker.process_element(
+                    node=node, element=element, child_nodes=child_nodes
+                ):
+                    consumed = Event()
+                    records.put((record, worker, consumed))
+                    while not consumed.wait(timeout=1):
+                        if cancelled.is_set():
+                            return
+            finally:
+                self.close_worker_source(worker)
+
+        with ThreadPoolExecutor(max_workers=self.get_threads()) as pool:
+            futures = [pool.submit(_process_element, element) for element in elements]
+            for future in futures:
+                future.add_done_callback(lambda _: records.put(None))
+
+            pending = len(futures)
+            try:
+                while pending:
+                    item = records.get()
+                    if item is None:
+                        pending -= 1
+                        continue
+                    record, worker, consumed = item
+                    self.ack_request = worker.ack_request
+                    try:
+                        yield record
+                        worker.acked_entity = self.acked_entity
+                    finally:
+                        self.ack_request, self.acked_entity = None, None
+                        consumed.set()
+            finally:
+                # If the workflow stopped consuming, let the threads finish
+                cancelled.set()
+
+            # Raise any unexpected error from the threads
+            for future in futures:
+                future.result()
+
+    def get_threads(self) -> int:
+        """
+        Number of threads to process the subtrees of nodes flagged with `threads`
+        """
+        return 1
+
+    def get_worker_source(self) -> "TopologyRunnerMixin":
+        """
+        Copy of the source to be used by a thread. It shares everything
+        with the source but the context, which is copied on write:
+        updating the context in the thread does not affect other threads.
+        Sources holding connections should override this to give each
+        thread its own.
+        """
+        worker = copy(self)
+        worker.context = self.context.copy()
+        worker.ack_request, worker.acked_entity = None, None
+        return worker
+
+    def close_worker_source(self, worker: "TopologyRunnerMixin") -> None:
+        """
+        Release any resource acquired in `get_worker_source`
+        """
+
     def check_context_and_handle(self, post_process: str):
         """Based on the post_process step, check context and
         evaluate if we can run it based on available class attributes
@@ -131,6 +248,35 @@ class TopologyRunnerMixin(Generic[C]):
         """
         yield from self.process_nodes(get_topology_root(self.topology))
 
+    def is_ack_pending(self) -> bool:
+        """
+        The last yielded request comes from an ack_sink stage:
+        it needs to be in OM before we can resume the topology
+        """
+        return self.ack_request is not None
+
+    def ack(self, record: Any, entity: Optional[Any]) -> None:
+        """
+        Keep the Entity the sink created from the ack_sink request,
+        so that we do not need to GET it back from the API
+        """
+        if record is self.ack_request:
+            self.acked_entity = entity
+
+    def get_acked_entity(self, stage: NodeStage, entity_request: C, entity_fqn: str):
+        """
+        Pick up the Entity handed back by the sink for the request.
+        If the sink did not hand it back, fetch it from the API.
+        """
+        entity, self.acked_entity = self.acked_entity, None
+        if entity is None:
+            entity = self.metadata.get_by_name(
+                entity=stage.type_,
+                fqn=entity_fqn,
+                fields=["*"],  # Get all the available data from the Entity
+            )
+        return entity
+
     def update_context(self, key: str, value: Any) -> None:
         """
         Update the key of the context with the given value
@@ -147,6 +293,15 @@ class TopologyRunnerMixin(Generic[C]):
         """
         self.context.__dict__[key].append(value)
 
+    def index_context(self, key: str, value: Any) -> None:
+        """
+        Add the value to the key of the context, indexed by its FQN
+        :param key: element to update from the source context
+        :param value: value to index, with an `fqn` attribute
+        """
+        value_fqn = value.fqn.__root__ if value.fqn else None
+        self.context.__dict__[key].setdefault(value_fqn, []).append(value)
+
     def clear_context(self, stage: NodeStage) -> None:
         """
         Clear the available context
@@ -206,12 +361,13 @@ class TopologyRunnerMixin(Generic[C]):
                 if entity is None:
                     tries = 3
                     while not entity and tries > 0:
+                        self.ack_request = entity_request
                         yield entity_request
-                        # Improve validation logic
-                        entity = self.metadata.get_by_name(
-                            entity=stage.type_,
-                            fqn=entity_fqn,
-                            fields=["*"],  # Get all the available data from the Entity
+                        self.ack_request = None
+                        entity = self.get_acked_entity(
+                            stage=stage,
+                            entity_request=entity_request,
+                            entity_fqn=entity_fqn,
                         )
                         tries -= 1
 
@@ -227,9 +383,11 @@ class TopologyRunnerMixin(Generic[C]):
             else:
                 yield entity
 
-            if stage.context and not stage.cache_all:
+            if stage.context and stage.cache_by_fqn:
+                self.index_context(key=stage.context, value=entity)
+            elif stage.context and not stage.cache_all:
                 self.update_context(key=stage.context, value=entity)
-            if stage.context and stage.cache_all:
+            elif stage.context and stage.cache_all:
                 self.append_context(key=stage.context, value=entity)
 
     def _is_force_overwrite_enabled(self) -> bool:
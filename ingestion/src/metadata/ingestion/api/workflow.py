@@ -32,12 +32,14 @@ from metadata.ingestion.api.bulk_sink import BulkSink
 from metadata.ingestion.api.parser import parse_workflow_config_gracefully
 from metadata.ingestion.api.processor import Processor
 from metadata.ingestion.api.sink import Sink
+from metadata.ingestion.api.sink_pipeline import SinkPipeline
 from metadata.ingestion.api.source import Source
 from metadata.ingestion.api.stage import Stage
 from metadata.ingestion.models.custom_types import ServiceWithConnectionType
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.timer.repeated_timer import RepeatedTimer
 from metadata.timer.workflow_reporter import get_ingestion_status_timer
+from metadata.utils.catalog_index import close_catalog_index, create_catalog_index
 from metadata.utils.class_helper import (
     get_service_class_from_service_type,
     get_service_type_from_source_type,
@@ -114,6 +116,17 @@ class Workflow(WorkflowStatusMixin):
 
         logger.info(f"Service type:{service_type},{source_type} configured")
 
+        if (
+            self.config.workflowConfig.catalogSnapshot
+            and service_type == ServiceType.Database
+        ):
+            create_catalog_index(
+                self.metadata,
+                self.config.source.serviceName,
+                path=self.config.workflowConfig.catalogSnapshotPath,
+                max_age=self.config.workflowConfig.catalogSnapshotMaxAge,
+            )
+
         source_class = (
             import_from_module(
                 self.config.source.serviceConnection.__root__.config.sourcePythonClass
@@ -129,6 +142,15 @@ class Workflow(WorkflowStatusMixin):
         self.source.prepare()
         logger.debug(f"Source type:{source_type},{source_class}  prepared")
 
+        if self.source.is_incremental():
+            watermark = self.get_last_successful_run_start()
+            logger.info(
+                f"Incremental extraction of the changes since [{watermark}]"
+                if watermark
+                else "No previous successful run found. Extracting all the metadata."
+            )
+            self.source.set_watermark(watermark)
+
         if self.config.processor:
             processor_type = self.config.processor.type
             processor_class = import_processor_class(processor_type=processor_type)
@@ -156,6 +178,7 @@ class Workflow(WorkflowStatusMixin):
             sink_class = import_sink_class(sink_type=sink_type)
             sink_config = self.config.sink.dict().get("config", {})
             self.sink: Sink = sink_class.create(sink_config, metadata_config)
+            self.sink.register_ack_callback(self.source.ack)
             logger.debug(f"Sink type:{self.config.sink.type},{sink_class} configured")
 
         if self.config.bulkSink:
@@ -193,15 +216,17 @@ class Workflow(WorkflowStatusMixin):
         self.timer.trigger()
 
         try:
-            for record in self.source.next_record():
-                if hasattr(self, "processor"):
-                    processed_record = self.processor.process(record)
-                else:
-                    processed_record = record
-                if hasattr(self, "stage"):
-                    self.stage.stage_record(processed_record)
-                if hasattr(self, "sink"):
-                    self.sink.write_record(processed_record)
+            if hasattr(self, "sink") and self._sink_thread_count() > 1:
+                self._execute_pipelined()
+            else:
+                for record in self.source.next_record():
+                    processed_record = self._process_and_stage(record)
+                    if hasattr(self, "sink"):
+                        self.sink.write_record(processed_record)
+                        if self.source.is_ack_pending():
+                            self.sink.flush()
+            if hasattr(self, "sink"):
+                self.sink.flush()
             if hasattr(self, "bulk_sink"):
                 self.stage.close()
                 self.bulk_sink.write_records()
@@ -218,6 +243,42 @@ class Workflow(WorkflowStatusMixin):
         finally:
             self.stop()
 
+    def _process_and_stage(self, record: T) -> T:
+        """
+        Run the processor and the stage, if any, over a source record
+        """
+        if hasattr(self, "processor"):
+            processed_record = self.processor.process(record)
+        else:
+            processed_record = record
+        if hasattr(self, "stage"):
+            self.stage.stage_record(processed_record)
+        return processed_record
+
+    def _sink_thread_count(self) -> int:
+        return self.config.workflowConfig.sinkThreadCount or 1
+
+    def _execute_pipelined(self) -> None:
+        """
+        Source -> (Processor) -> Sink, letting the source produce the next
+        records while a pool of threads writes the previous ones.
+
+        If the source needs a record to be in OM before going on, e.g., a schema
+        read back from the API before yielding its tables, we wait for the
+        sink to write all the queued records before resuming the source.
+        """
+        with SinkPipeline(
+            sink=self.sink,
+            thread_count=self._sink_thread_count(),
+            queue_size=self.config.workflowConfig.sinkQueueSize,
+        ) as pipeline:
+            for record in self.source.next_record():
+                pipeline.put(self._process_and_stage(record))
+                if self.source.is_ack_pending():
+                    pipeline.wait()
+                    self.sink.flush()
+            pipeline.wait()
+
     def stop(self):
         if hasattr(self, "processor"):
             self.processor.close()
@@ -227,6 +288,7 @@ class Workflow(WorkflowStatusMixin):
             self.sink.close()
 
         self.source.close()
+        close_catalog_index(self.config.source.serviceName)
         self.timer.stop()
 
     def _get_source_success(self):
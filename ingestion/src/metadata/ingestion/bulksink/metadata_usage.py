@@ -17,7 +17,6 @@ as well as populating JOIN information.
 It picks up the information from reading the files
 produced by the stage. At the end, the path is removed.
 """
-import json
 import os
 import shutil
 import traceback
@@ -96,6 +95,9 @@ class MetadataUsageBulkSink(BulkSink):
         """
         Method Either initialise the map data or
         update existing data with information from new queries on the same table
+
+        The joins and queries of the table are gathered as well,
+        so that they are published once per table and date
         """
         if not self.table_usage_map.get(table_entity.id.__root__):
             self.table_usage_map[table_entity.id.__root__] = {
@@ -104,11 +106,17 @@ class MetadataUsageBulkSink(BulkSink):
                 "usage_date": table_usage.date,
                 "database": table_usage.databaseName,
                 "database_schema": table_usage.databaseSchema,
+                "column_joins": {},
+                "sql_queries": list(table_usage.sqlQueries or []),
             }
         else:
-            self.table_usage_map[table_entity.id.__root__][
-                "usage_count"
-            ] += table_usage.count
+            value_dict = self.table_usage_map[table_entity.id.__root__]
+            value_dict["usage_count"] += table_usage.count
+            value_dict["sql_queries"].extend(table_usage.sqlQueries or [])
+        self.__update_column_joins(
+            self.table_usage_map[table_entity.id.__root__]["column_joins"],
+            table_usage,
+        )
 
     def __publish_usage_records(self) -> None:
         """
@@ -143,6 +151,42 @@ class MetadataUsageBulkSink(BulkSink):
                 logger.debug(traceback.format_exc())
                 logger.warning(error)
                 self.status.failed(name, error, traceback.format_exc())
+            self.__publish_joins_and_queries(value_dict)
+
+    def __publish_joins_and_queries(self, value_dict: dict) -> None:
+        """
+        Method to publish the joins and SQL Queries gathered for a table
+        """
+        table_entity = value_dict["table_entity"]
+        try:
+            table_join_request = self.__get_table_joins(
+                table_entity=table_entity,
+                column_joins_dict=value_dict["column_joins"],
+                start_date=value_dict["usage_date"],
+            )
+            logger.debug(f"table join request {table_join_request}")
+
+            if table_join_request.columnJoins:
+                self.metadata.publish_frequently_joined_with(
+                    table_entity, table_join_request
+                )
+
+            if value_dict["sql_queries"]:
+                self.metadata.ingest_entity_queries_data(
+                    entity=table_entity, queries=value_dict["sql_queries"]
+                )
+        except APIError as err:
+            name = table_entity.fullyQualifiedName.__root__
+            error = f"Failed to update query join for {name}: {err}"
+            logger.debug(traceback.format_exc())
+            logger.warning(error)
+            self.status.failed(name, error, traceback.format_exc())
+        except Exception as exc:
+            name = table_entity.name.__root__
+            error = f"Error getting usage and join information for {name}: {exc}"
+            logger.debug(traceback.format_exc())
+            logger.warning(error)
+            self.status.failed(name, error, traceback.format_exc())
 
     def iterate_files(self):
         """
@@ -161,9 +205,9 @@ class MetadataUsageBulkSink(BulkSink):
     def write_records(self) -> None:
         for file_handler in self.iterate_files():
             self.table_usage_map = {}
-            for usage_record in file_handler.readlines():
-                record = json.loads(usage_record)
-                table_usage = TableUsageCount(**json.loads(record))
+            # Read the file line by line, aggregating the usage as we go
+            for usage_record in file_handler:
+                table_usage = TableUsageCount.parse_raw(usage_record)
 
                 self.service_name = table_usage.serviceName
                 table_entities = None
@@ -195,38 +239,16 @@ class MetadataUsageBulkSink(BulkSink):
         self, table_entities: List[Table], table_usage: TableUsageCount
     ):
         """
-        For the list of tables, compute usage with already existing seen
-        tables and publish the join information.
+        For the list of tables, add the usage, joins and queries to the
+        ones already seen for the same tables. They are published once
+        the whole staging file has been read.
         """
         for table_entity in table_entities:
             if table_entity is not None:
-                table_join_request = None
                 try:
                     self.__populate_table_usage_map(
                         table_usage=table_usage, table_entity=table_entity
                     )
-                    table_join_request = self.__get_table_joins(
-                        table_entity=table_entity, table_usage=table_usage
-                    )
-                    logger.debug(f"table join request {table_join_request}")
-
-                    if (
-                        table_join_request is not None
-                        and len(table_join_request.columnJoins) > 0
-                    ):
-                        self.metadata.publish_frequently_joined_with(
-                            table_entity, table_join_request
-                        )
-
-                    if table_usage.sqlQueries:
-                        self.metadata.ingest_entity_queries_data(
-                            entity=table_entity, queries=table_usage.sqlQueries
-                        )
-                except APIError as err:
-                    error = f"Failed to update query join for {table_usage}: {err}"
-                    logger.debug(traceback.format_exc())
-                    logger.warning(error)
-                    self.status.failed(table_usage.table, error, traceback.format_exc())
                 except Exception as exc:
                     name = table_entity.name.__root__
                     error = (
@@ -242,16 +264,12 @@ class MetadataUsageBulkSink(BulkSink):
                 )
                 self.status.warning(f"Table: {table_usage.table}")
 
-    def __get_table_joins(
-        self, table_entity: Table, table_usage: TableUsageCount
-    ) -> TableJoins:
+    def __update_column_joins(
+        self, column_joins_dict: dict, table_usage: TableUsageCount
+    ) -> None:
         """
-        Method to get Table Joins
+        Method to add the joins of the usage to the column joins of the table
         """
-        table_joins: TableJoins = TableJoins(
-            columnJoins=[], directTableJoins=[], startDate=table_usage.date
-        )
-        column_joins_dict = {}
         for column_join in table_usage.joins:
             joined_with = {}
             if column_join.tableColumn is None or len(column_join.joinedWith) == 0:
@@ -280,6 +298,16 @@ class MetadataUsageBulkSink(BulkSink):
                     )
             column_joins_dict[column_join.tableColumn.column] = joined_with
 
+    @staticmethod
+    def __get_table_joins(
+        table_entity: Table, column_joins_dict: dict, start_date: str
+    ) -> TableJoins:
+        """
+        Method to get Table Joins
+        """
+        table_joins: TableJoins = TableJoins(
+            columnJoins=[], directTableJoins=[], startDate=start_date
+        )
         for key, value in column_joins_dict.items():
             key_name = get_column_fqn(table_entity=table_entity, column=key)
             if not key_name:
@@ -12,7 +12,9 @@
 Models related to lineage parsing
 """
 from enum import Enum
-from typing import Dict
+from typing import Dict, List, Tuple
+
+from pydantic import BaseModel
 
 from metadata.generated.schema.entity.services.connections.database.athenaConnection import (
     AthenaType,
@@ -59,6 +61,7 @@ from metadata.generated.schema.entity.services.connections.database.snowflakeCon
 from metadata.generated.schema.entity.services.connections.database.sqliteConnection import (
     SQLiteType,
 )
+from metadata.generated.schema.type.tableUsageCount import TableColumnJoin
 
 
 class Dialect(Enum):
@@ -122,3 +125,24 @@ class ConnectionTypeDialectMapper:
         Returns: a dialect
         """
         return MAP_CONNECTION_TYPE_DIALECT.get(connection_type, Dialect.ANSI)
+
+
+class QueryLineage(BaseModel):
+    """
+    Tables and column lineage parsed from a query, as plain names.
+    Column lineage maps target table -> source table -> (target, source) columns.
+    """
+
+    source_tables: List[str]
+    target_tables: List[str]
+    intermediate_tables: List[str]
+    column_lineage: Dict[str, Dict[str, List[Tuple[str, str]]]]
+
+
+class QueryTables(BaseModel):
+    """
+    Tables and joins parsed from a query, for usage
+    """
+
+    tables: List[str]
+    joins: Dict[str, List[TableColumnJoin]]
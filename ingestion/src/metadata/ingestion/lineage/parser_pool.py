@@ -0,0 +1,123 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Pool of processes to parse queries.
+
+Parsing SQL is pure CPU work, so the lineage and usage workflows
+spread it over several processes. The functions run in the pool
+need to be picklable: module level functions or partials of them.
+
+The workers are spawned rather than forked: the pool is created once
+the workflow threads are running, and forking a process while other
+threads hold locks, e.g., the logging ones, can deadlock the workers.
+"""
+import multiprocessing
+import traceback
+from multiprocessing.pool import Pool
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from metadata.ingestion.lineage.parser import LINEAGE_PARSING_TIMEOUT
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Leave time for the sqlfluff parser to time out and for the sqlparse fallback
+PARSER_POOL_TIMEOUT = 3 * LINEAGE_PARSING_TIMEOUT
+
+
+class ParserPool:
+    """
+    Run a function over batches of queries in a pool of processes,
+    getting the results back in order.
+
+    Each query has `timeout_seconds` to be parsed once its turn to be
+    collected comes. A worker stuck on a query cannot be stopped alone,
+    so the pool is replaced and the rest of the batch runs in the new one.
+
+    With a single process, the function runs in the current process.
+    """
+
+    def __init__(self, processes: int, timeout_seconds: int = PARSER_POOL_TIMEOUT):
+        self.processes = processes
+        self.timeout_seconds = timeout_seconds
+        self._pool: Optional[Pool] = None
+
+    @property
+    def pool(self) -> Pool:
+        if self._pool is None:
+            context = multiprocessing.get_context("spawn")
+            self._pool = context.Pool(  # pylint: disable=consider-using-with
+                self.processes
+            )
+        return self._pool
+
+    def map(self, fn: Callable[[T], R], items: Sequence[T]) -> List[Optional[R]]:
+        """
+        Results of `fn` for each item, in order.
+        Items failing or timing out get None.
+        """
+        if self.processes <= 1:
+            return [fn(item) for item in items]
+
+        results: List[Optional[R]] = [None] * len(items)
+        pending = list(range(len(items)))
+        while pending:
+            async_results = [
+                (index, self.pool.apply_async(fn, (items[index],)))
+                for index in pending
+            ]
+            pending = []
+            for position, (index, async_result) in enumerate(async_results):
+                try:
+                    results[index] = async_result.get(timeout=self.timeout_seconds)
+                except multiprocessing.TimeoutError:
+                    logger.warning(
+                        f"Parsing took more than {self.timeout_seconds} seconds."
+                        " Skipping it."
+                    )
+                    logger.debug(f"Skipped item: {items[index]}")
+                    for later_index, later_result in async_results[position + 1 :]:
+                        if later_result.ready():
+                            results[later_index] = self._get_result(later_result)
+                        else:
+                            pending.append(later_index)
+                    self.terminate()
+                    break
+                except Exception as exc:
+                    logger.debug(traceback.format_exc())
+                    logger.warning(f"Unexpected error parsing in the pool: {exc}")
+        return results
+
+    @staticmethod
+    def _get_result(async_result) -> Optional[R]:
+        try:
+            return async_result.get()
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Unexpected error parsing in the pool: {exc}")
+        return None
+
+    def terminate(self) -> None:
+        """Stop the workers right away"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def close(self) -> None:
+        """Let the workers finish and stop them"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
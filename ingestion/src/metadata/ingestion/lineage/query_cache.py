@@ -0,0 +1,231 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Cache of parsed queries by query shape.
+
+Query logs are mostly the same queries run again and again with
+different literals: dashboards refreshing, ETL jobs... Literals do
+not change the tables, joins or lineage of a query, so we only parse
+each shape once: its fingerprint strips literals, comments and
+whitespace.
+"""
+import hashlib
+import re
+import sqlite3
+import traceback
+from functools import partial
+from threading import Lock
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from metadata.ingestion.lineage.models import Dialect
+from metadata.ingestion.lineage.parser_pool import ParserPool
+from metadata.utils.logger import ingestion_logger
+from metadata.utils.lru_cache import LRUCache
+
+logger = ingestion_logger()
+
+M = TypeVar("M", bound=BaseModel)
+
+LRU_CACHE_SIZE = 10000
+# Bump it when the parsing changes, to discard the stored results
+QUERY_CACHE_VERSION = "2"
+
+QUERY_TOKENS_PATTERN = r"""
+    (?P<space>(?:\s+|--[^\n]*|/\*.*?\*/)+)
+    |(?P<string>'(?:{string_chars}|'')*')
+    |(?P<identifier>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+    |(?P<number>(?<![\w$.])\d+(?:\.\d*)?(?:[eE][-+]?\d+)?(?![\w$]))
+    """
+# Numbers within identifiers, e.g., `db.2023_sales`, are not literals.
+# Only some dialects escape quotes with backslashes in strings: in
+# standard SQL, 'x\' is a whole string.
+QUERY_TOKENS = re.compile(
+    QUERY_TOKENS_PATTERN.format(string_chars=r"[^']"), re.VERBOSE | re.DOTALL
+)
+BACKSLASH_QUERY_TOKENS = re.compile(
+    QUERY_TOKENS_PATTERN.format(string_chars=r"[^'\\]|\\."),
+    re.VERBOSE | re.DOTALL,
+)
+BACKSLASH_ESCAPE_DIALECTS = {
+    Dialect.BIGQUERY,
+    Dialect.CLICKHOUSE,
+    Dialect.DATABRICKS,
+    Dialect.HIVE,
+    Dialect.IMPALA,
+    Dialect.MYSQL,
+    Dialect.SNOWFLAKE,
+    Dialect.SPARKSQL,
+}
+LITERAL_LISTS = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def _normalize_token(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind in ("string", "number"):
+        return "?"
+    if kind == "space":
+        return " "
+    return match.group()
+
+
+def _parse_query(
+    parse: Callable[[str], Optional[M]], query: str
+) -> Optional[Tuple[Optional[M]]]:
+    """
+    Wrap the result of `parse`, so that it can be told from the None
+    the parser pool gives for failures and timeouts, which are not cached.
+    """
+    try:
+        return (parse(query),)
+    except Exception as exc:
+        logger.debug(traceback.format_exc())
+        logger.warning(f"Unexpected error parsing query [{query}]: {exc}")
+    return None
+
+
+def normalize_query(query: str, dialect: Optional[Dialect] = None) -> str:
+    """
+    Shape of the query: literals are replaced by `?`, lists
+    of literals by a single `?`, and comments and whitespace
+    by a single space. Quoted identifiers are kept as they are.
+    """
+    query_tokens = (
+        BACKSLASH_QUERY_TOKENS if dialect in BACKSLASH_ESCAPE_DIALECTS else QUERY_TOKENS
+    )
+    shape = query_tokens.sub(_normalize_token, query)
+    return LITERAL_LISTS.sub("?", shape).strip()
+
+
+def get_query_cache_key(
+    query: str,
+    dialect: Dialect,
+    database_name: Optional[str] = None,
+    schema_name: Optional[str] = None,
+) -> str:
+    """
+    Fingerprint of the query shape, parsed with the dialect
+    in the default database and schema
+    """
+    key = "\x00".join(
+        [
+            QUERY_CACHE_VERSION,
+            dialect.value,
+            database_name or "",
+            schema_name or "",
+            normalize_query(query, dialect),
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ParsedQueryCache(Generic[M]):
+    """
+    LRU cache of the results of parsing query shapes.
+    Queries without tables are cached as None. Queries failing or
+    timing out in the parser pool are not cached: they are parsed
+    again the next time they come.
+
+    With a `path`, the results are also kept in a local sqlite
+    file and reused by the next runs.
+    """
+
+    def __init__(
+        self,
+        model: Type[M],
+        path: Optional[str] = None,
+        capacity: int = LRU_CACHE_SIZE,
+    ):
+        self.model = model
+        self.lock = Lock()
+        self._cache = LRUCache(capacity)
+        self.connection = None
+        if path:
+            self.connection = sqlite3.connect(
+                path, check_same_thread=False, isolation_level=None
+            )
+            self.connection.execute("PRAGMA synchronous = OFF")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_queries ("
+                "model TEXT, key TEXT, result TEXT, PRIMARY KEY (model, key))"
+            )
+
+    def _lookup(self, key: str) -> Dict[str, Optional[M]]:
+        """Cached result of the key, if any, as {key: result}"""
+        with self.lock:
+            if key in self._cache:
+                return {key: self._cache.get(key)}
+            if self.connection is None:
+                return {}
+            row = self.connection.execute(
+                "SELECT result FROM parsed_queries WHERE model = ? AND key = ?",
+                (self.model.__name__, key),
+            ).fetchone()
+            if row is None:
+                return {}
+            result = self.model.parse_raw(row[0]) if row[0] else None
+            self._cache.put(key, result)
+            return {key: result}
+
+    def put(self, key: str, result: Optional[M]) -> None:
+        with self.lock:
+            self._cache.put(key, result)
+            if self.connection is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO parsed_queries VALUES (?, ?, ?)",
+                    (self.model.__name__, key, result.json() if result else None),
+                )
+
+    def parse(
+        self,
+        parser_pool: ParserPool,
+        parse: Callable[[str], Optional[M]],
+        queries: Sequence[str],
+        keys: Sequence[str],
+    ) -> List[Optional[M]]:
+        """
+        Results of `parse` for each query, given the cache key of each.
+        Only the shapes missing from the cache are parsed, once each,
+        in the parser pool.
+        """
+        results: Dict[str, Optional[M]] = {}
+        missing: Dict[str, str] = {}
+        for key, query in zip(keys, queries):
+            if key not in results and key not in missing:
+                results.update(self._lookup(key))
+                if key not in results:
+                    missing[key] = query
+
+        parsed = parser_pool.map(partial(_parse_query, parse), list(missing.values()))
+        for key, result in zip(missing, parsed):
+            if result is None:
+                results[key] = None
+                continue
+            self.put(key, result[0])
+            results[key] = result[0]
+
+        return [results[key] for key in keys]
+
+    def close(self) -> None:
+        if self.connection is not None:
+            with self.lock:
+                self.connection.close()
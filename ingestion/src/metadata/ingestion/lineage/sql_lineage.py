@@ -22,10 +22,11 @@ from metadata.generated.schema.type.entityLineage import (
     LineageDetails,
 )
 from metadata.generated.schema.type.entityReference import EntityReference
-from metadata.ingestion.lineage.models import Dialect
+from metadata.ingestion.lineage.models import Dialect, QueryLineage
 from metadata.ingestion.lineage.parser import LineageParser
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils import fqn
+from metadata.utils.catalog_index import get_catalog_index
 from metadata.utils.fqn import build_es_fqn_search_string
 from metadata.utils.logger import utils_logger
 from metadata.utils.lru_cache import LRUCache
@@ -76,6 +77,14 @@ def search_table_entities(
     Returns:
         A list of Table entities, otherwise, None
     """
+    # The snapshot misses the tables created after it was taken:
+    # look them up as usual
+    catalog_index = get_catalog_index(service_name)
+    if catalog_index:
+        table_entities = catalog_index.search(database, database_schema, table)
+        if table_entities:
+            return table_entities
+
     search_tuple = (service_name, database, database_schema, table)
     if search_tuple in search_cache:
         return search_cache.get(search_tuple)
@@ -335,6 +344,25 @@ def populate_column_lineage_map(raw_column_lineage):
     return lineage_map
 
 
+def get_query_lineage(query: str, dialect: Dialect) -> QueryLineage:
+    """
+    Parse the source, target and intermediate tables and the column
+    lineage of a query. It is only CPU work, without calls to the API,
+    so that it can run in a ParserPool. Parsing errors are raised,
+    so that they are not cached.
+    """
+    logger.debug(f"Running lineage with query: {query}")
+    lineage_parser = LineageParser(query, dialect)
+    return QueryLineage(
+        source_tables=[str(table) for table in lineage_parser.source_tables],
+        target_tables=[str(table) for table in lineage_parser.target_tables],
+        intermediate_tables=[
+            str(table) for table in lineage_parser.intermediate_tables
+        ],
+        column_lineage=populate_column_lineage_map(lineage_parser.column_lineage),
+    )
+
+
 def get_lineage_by_query(
     metadata: OpenMetadata,
     service_name: str,
@@ -342,55 +370,53 @@ def get_lineage_by_query(
     schema_name: Optional[str],
     query: str,
     dialect: Dialect,
+    query_lineage: Optional[QueryLineage] = None,
 ) -> Optional[Iterator[AddLineageRequest]]:
     """
     This method parses the query to get source, target and intermediate table names to create lineage,
     and returns True if target table is found to create lineage otherwise returns False.
+    The query is not parsed again if its `query_lineage` is given.
     """
-    column_lineage = {}
-
     try:
-        logger.debug(f"Running lineage with query: {query}")
-        lineage_parser = LineageParser(query, dialect)
-
-        raw_column_lineage = lineage_parser.column_lineage
-        column_lineage.update(populate_column_lineage_map(raw_column_lineage))
+        query_lineage = query_lineage or get_query_lineage(query, dialect)
+        if not query_lineage:
+            return
 
-        for intermediate_table in lineage_parser.intermediate_tables:
-            for source_table in lineage_parser.source_tables:
+        for intermediate_table in query_lineage.intermediate_tables:
+            for source_table in query_lineage.source_tables:
                 yield from _create_lineage_by_table_name(
                     metadata,
-                    from_table=str(source_table),
-                    to_table=str(intermediate_table),
+                    from_table=source_table,
+                    to_table=intermediate_table,
                     service_name=service_name,
                     database_name=database_name,
                     schema_name=schema_name,
                     query=query,
-                    column_lineage_map=column_lineage,
+                    column_lineage_map=query_lineage.column_lineage,
                 )
-            for target_table in lineage_parser.target_tables:
+            for target_table in query_lineage.target_tables:
                 yield from _create_lineage_by_table_name(
                     metadata,
-                    from_table=str(intermediate_table),
-                    to_table=str(target_table),
+                    from_table=intermediate_table,
+                    to_table=target_table,
                     service_name=service_name,
                     database_name=database_name,
                     schema_name=schema_name,
                     query=query,
-                    column_lineage_map=column_lineage,
+                    column_lineage_map=query_lineage.column_lineage,
                 )
-        if not lineage_parser.intermediate_tables:
-            for target_table in lineage_parser.target_tables:
-                for source_table in lineage_parser.source_tables:
+        if not query_lineage.intermediate_tables:
+            for target_table in query_lineage.target_tables:
+                for source_table in query_lineage.source_tables:
                     yield from _create_lineage_by_table_name(
                         metadata,
-                        from_table=str(source_table),
-                        to_table=str(target_table),
+                        from_table=source_table,
+                        to_table=target_table,
                         service_name=service_name,
                         database_name=database_name,
                         schema_name=schema_name,
                         query=query,
-                        column_lineage_map=column_lineage,
+                        column_lineage_map=query_lineage.column_lineage,
                     )
     except Exception as exc:
         logger.debug(traceback.format_exc())
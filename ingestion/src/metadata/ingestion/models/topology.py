@@ -12,7 +12,7 @@
 Defines the topology for ingesting sources
 """
 
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel, Extra, create_model
 
@@ -39,6 +39,7 @@ class NodeStage(BaseModel, Generic[T]):
     cache_all: bool = (
         False  # If we need to cache all values being yielded in the context
     )
+    cache_by_fqn: bool = False  # Cache all values in the context in a dict of lists keyed by their `fqn`
     clear_cache: bool = False  # If we need to clean cache values in the context for each produced element
     overwrite: bool = True  # If we want to overwrite existing data from OM
     consumer: Optional[
@@ -69,6 +70,7 @@ class TopologyNode(BaseModel):
     post_process: Optional[
         List[str]
     ] = None  # Method to be run after the node has been fully processed
+    threads: bool = False  # The subtrees of each produced element are independent and can run concurrently
 
 
 class ServiceTopology(BaseModel):
@@ -125,12 +127,15 @@ def get_topology_root(topology: ServiceTopology) -> List[TopologyNode]:
     return [node for node in nodes if node_has_no_consumers(node)]
 
 
-def get_ctx_default(stage: NodeStage) -> Optional[List[Any]]:
+def get_ctx_default(stage: NodeStage) -> Optional[Union[List[Any], Dict[str, Any]]]:
     """
-    If we cache all, default value is an empty list
+    If we cache all, default value is an empty list.
+    If we cache by FQN, an empty dict.
     :param stage: Node Stage
-    :return: None or []
+    :return: None, [] or {}
     """
+    if stage.cache_by_fqn:
+        return {}
     return [] if stage.cache_all else None
 
 
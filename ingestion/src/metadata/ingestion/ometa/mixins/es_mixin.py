@@ -13,11 +13,11 @@ Mixin class containing Lineage specific methods
 
 To be used by OpenMetadata class
 """
-import functools
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generic, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from metadata.generated.schema.api.createEventPublisherJob import (
     CreateEventPublisherJob,
@@ -26,11 +26,16 @@ from metadata.generated.schema.system.eventPublisherJob import EventPublisherRes
 from metadata.ingestion.ometa.client import REST, APIError
 from metadata.utils.elasticsearch import ES_INDEX_MAP
 from metadata.utils.logger import ometa_logger
+from metadata.utils.ttl_cache import TTLCache
 
 logger = ometa_logger()
 
 T = TypeVar("T", bound=BaseModel)
 
+ES_CACHE_SIZE = 512
+ES_CACHE_TTL_SECONDS = 300
+ES_FETCH_WORKERS = 10
+
 
 class ESMixin(Generic[T]):
     """
@@ -43,33 +48,120 @@ class ESMixin(Generic[T]):
 
     fqdn_search = "/search/query?q=fullyQualifiedName:{fqn}&from={from_}&size={size}&index={index}"
 
-    @functools.lru_cache(maxsize=512)
+    _es_cache: Optional[TTLCache] = None
+
+    @property
+    def es_cache(self) -> TTLCache:
+        """
+        Results of the ES searches of this client. Entries expire
+        so that we pick up the changes made during long runs.
+        """
+        if self._es_cache is None:
+            self._es_cache = TTLCache(ES_CACHE_SIZE, ES_CACHE_TTL_SECONDS)
+        return self._es_cache
+
     def _search_es_entity(
         self,
         entity_type: Type[T],
         query_string: str,
         fields: Optional[List[str]] = None,
+        from_source: bool = False,
     ) -> Optional[List[T]]:
         """
-        Run the ES query and return a list of entities that match. It does an extra query to the OM API with the
-        requested fields per each entity found in ES.
+        Run the ES query and return a list of entities that match.
+
+        By default, the entities found in ES are fetched from the OM API with the
+        requested fields, all of them at the same time. With `from_source`, the
+        entities are built from the ES documents, only falling back to the API
+        for the documents that are not valid entities.
         :param entity_type: Entity to look for
         :param query_string: Query to run
+        :param fields: Fields to be returned
+        :param from_source: Build the entities from the ES documents
         :return: List of Entities or None
         """
+        key = (
+            entity_type,
+            query_string,
+            tuple(fields) if fields is not None else None,
+            from_source,
+        )
+        try:
+            return self.es_cache.get(key)
+        except KeyError:
+            pass
+
+        if from_source:
+            query_string += "".join(
+                f"&include_source_fields={field}"
+                for field in _get_source_fields(entity_type, fields)
+            )
         response = self.client.get(query_string)
 
+        entities = None
         if response:
+            hits = [hit["_source"] for hit in response["hits"]["hits"]]
+            entities = (
+                self._get_entities_from_source(entity_type, hits, fields)
+                if from_source
+                else self._get_entities_by_name(
+                    entity_type, [hit["fullyQualifiedName"] for hit in hits], fields
+                )
+            ) or None
+
+        self.es_cache.put(key, entities)
+        return entities
+
+    def _get_entities_by_name(
+        self, entity_type: Type[T], fqns: List[str], fields: Optional[List[str]]
+    ) -> List[T]:
+        """
+        The API can't fetch several entities by name in one call,
+        so we send the requests at the same time
+        """
+        if len(fqns) <= 1:
             return [
-                self.get_by_name(
-                    entity=entity_type,
-                    fqn=hit["_source"]["fullyQualifiedName"],
-                    fields=fields,
+                self.get_by_name(entity=entity_type, fqn=fqn, fields=fields)
+                for fqn in fqns
+            ]
+        with ThreadPoolExecutor(max_workers=min(ES_FETCH_WORKERS, len(fqns))) as pool:
+            return list(
+                pool.map(
+                    lambda fqn: self.get_by_name(
+                        entity=entity_type, fqn=fqn, fields=fields
+                    ),
+                    fqns,
                 )
-                for hit in response["hits"]["hits"]
-            ] or None
+            )
 
-        return None
+    def _get_entities_from_source(
+        self, entity_type: Type[T], hits: List[dict], fields: Optional[List[str]]
+    ) -> List[T]:
+        """
+        Build the entities from the ES documents. ES documents have
+        extra search fields that are not part of the entity.
+        """
+        entity_fields = {field.alias for field in entity_type.__fields__.values()}
+        entities, missing = [], []
+        for hit in hits:
+            try:
+                entities.append(
+                    entity_type.parse_obj(
+                        {
+                            key: value
+                            for key, value in hit.items()
+                            if key in entity_fields
+                        }
+                    )
+                )
+            except ValidationError as exc:
+                logger.debug(
+                    f"Could not build {entity_type.__name__} from the ES document"
+                    f" of [{hit.get('fullyQualifiedName')}], fetching it: {exc}"
+                )
+                missing.append(hit["fullyQualifiedName"])
+
+        return entities + self._get_entities_by_name(entity_type, missing, fields)
 
     def es_search_from_fqn(
         self,
@@ -78,6 +170,7 @@ class ESMixin(Generic[T]):
         from_count: int = 0,
         size: int = 10,
         fields: Optional[List[str]] = None,
+        from_source: bool = False,
     ) -> Optional[List[T]]:
         """
         Given a service_name and some filters, search for entities using ES
@@ -87,6 +180,8 @@ class ESMixin(Generic[T]):
         :param from_count: Records to expect
         :param size: Number of records
         :param fields: Fields to be returned
+        :param from_source: Build the entities from the ES documents instead of
+            fetching them from the API. Faster, but the documents may lag behind
         :return: List of entities
         """
         query_string = self.fqdn_search.format(
@@ -98,7 +193,10 @@ class ESMixin(Generic[T]):
 
         try:
             response = self._search_es_entity(
-                entity_type=entity_type, query_string=query_string, fields=fields
+                entity_type=entity_type,
+                query_string=query_string,
+                fields=fields,
+                from_source=from_source,
             )
             return response
         except KeyError as err:
@@ -139,3 +237,18 @@ class ESMixin(Generic[T]):
             logger.debug(traceback.format_exc())
             logger.debug(f"Failed to fetch reindex job status due to {err}")
             return None
+
+
+def _get_source_fields(
+    entity_type: Type[BaseModel], fields: Optional[List[str]]
+) -> List[str]:
+    """
+    Fields to read from the ES documents: the required ones plus the
+    requested ones, or all of the entity fields if none are requested
+    """
+    if fields is None:
+        return [field.alias for field in entity_type.__fields__.values()]
+    required = [
+        field.alias for field in entity_type.__fields__.values() if field.required
+    ]
+    return list(dict.fromkeys([*required, "fullyQualifiedName", *fields]))
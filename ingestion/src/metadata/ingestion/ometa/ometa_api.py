@@ -15,6 +15,7 @@ models from the JSON schemas and provides a typed approach to
 working with OpenMetadata entities.
 """
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union
 
 try:
@@ -116,6 +117,9 @@ logger = ometa_logger()
 T = TypeVar("T", bound=BaseModel)
 C = TypeVar("C", bound=BaseModel)
 
+# Requests in flight when sending a list of CreateEntity requests
+DEFAULT_BULK_WORKERS = 10
+
 # Helps us dynamically load the Entity class path in the
 # generated module.
 MODULE_PATH = {
@@ -577,6 +581,33 @@ class OpenMetadata(
             )
         return entity_class(**resp)
 
+    def create_or_update_many(
+        self, data: List[C], max_workers: int = DEFAULT_BULK_WORKERS
+    ) -> List[Union[T, Exception]]:
+        """
+        PUT a list of CreateEntity requests.
+
+        The server does not offer a bulk endpoint for the entities,
+        so we send the requests concurrently from a pool of threads.
+
+        :param data: CreateEntity requests to send
+        :param max_workers: Number of requests in flight at the same time
+        :return: For each request, in the same order, the Entity or the exception raised
+        """
+
+        def _create_or_update(request: C) -> Union[T, Exception]:
+            try:
+                return self.create_or_update(request)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                return exc
+
+        if len(data) <= 1:
+            return [_create_or_update(request) for request in data]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(data))) as pool:
+            return list(pool.map(_create_or_update, data))
+
     def get_by_name(
         self,
         entity: Type[T],
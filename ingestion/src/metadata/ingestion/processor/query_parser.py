@@ -14,6 +14,7 @@ Query parser implementation
 
 import datetime
 import traceback
+from functools import partial
 from typing import Optional
 
 from metadata.config.common import ConfigModel
@@ -23,22 +24,54 @@ from metadata.generated.schema.entity.services.connections.metadata.openMetadata
 from metadata.generated.schema.type.queryParserData import ParsedData, QueryParserData
 from metadata.generated.schema.type.tableQuery import TableQueries, TableQuery
 from metadata.ingestion.api.processor import Processor
-from metadata.ingestion.lineage.models import ConnectionTypeDialectMapper, Dialect
+from metadata.ingestion.lineage.models import (
+    ConnectionTypeDialectMapper,
+    Dialect,
+    QueryTables,
+)
 from metadata.ingestion.lineage.parser import LineageParser
+from metadata.ingestion.lineage.parser_pool import ParserPool
+from metadata.ingestion.lineage.query_cache import (
+    ParsedQueryCache,
+    get_query_cache_key,
+)
 from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
 
 
-def parse_sql_statement(record: TableQuery, dialect: Dialect) -> Optional[ParsedData]:
+def parse_query_tables(query: str, dialect: Dialect) -> Optional[QueryTables]:
     """
-    Use the lineage parser and work with the tokens
-    to convert a RAW SQL statement into
-    QueryParserData.
-    :param record: TableQuery from usage
+    Use the lineage parser to get the tables and joins of a query.
+    It is only CPU work, so that it can run in a ParserPool.
+    Parsing errors are raised, so that they are not cached.
+    :param query: RAW SQL statement
     :param dialect: dialect used to compute lineage
+    :return: QueryTables, if the query involves any table
+    """
+    lineage_parser = LineageParser(query, dialect=dialect)
+
+    if not lineage_parser.involved_tables:
+        return None
+
+    return QueryTables(
+        tables=lineage_parser.clean_table_list,
+        joins=lineage_parser.table_joins,
+    )
+
+
+def parse_sql_statement(
+    record: TableQuery, query_tables: Optional[QueryTables]
+) -> Optional[ParsedData]:
+    """
+    Convert a RAW SQL statement and its parsed tables
+    into QueryParserData.
+    :param record: TableQuery from usage
+    :param query_tables: tables and joins parsed from the query
     :return: QueryParserData
     """
+    if not query_tables:
+        return None
 
     start_date = record.analysisDate
     if isinstance(record.analysisDate, str):
@@ -46,14 +79,9 @@ def parse_sql_statement(record: TableQuery, dialect: Dialect) -> Optional[Parsed
             str(record.analysisDate), "%Y-%m-%d %H:%M:%S"
         ).date()
 
-    lineage_parser = LineageParser(record.query, dialect=dialect)
-
-    if not lineage_parser.involved_tables:
-        return None
-
     return ParsedData(
-        tables=lineage_parser.clean_table_list,
-        joins=lineage_parser.table_joins,
+        tables=query_tables.tables,
+        joins=query_tables.joins,
         databaseName=record.databaseName,
         databaseSchema=record.databaseSchema,
         sql=record.query,
@@ -64,6 +92,13 @@ def parse_sql_statement(record: TableQuery, dialect: Dialect) -> Optional[Parsed
     )
 
 
+class QueryParserProcessorConfig(ConfigModel):
+    # Number of processes parsing the queries
+    processes: int = 1
+    # Local file keeping the parsed query shapes across runs
+    cache_path: Optional[str] = None
+
+
 class QueryParserProcessor(Processor):
     """
     Extension of the `Processor` class
@@ -74,11 +109,11 @@ class QueryParserProcessor(Processor):
         connection_type (str):
     """
 
-    config: ConfigModel
+    config: QueryParserProcessorConfig
 
     def __init__(
         self,
-        config: ConfigModel,
+        config: QueryParserProcessorConfig,
         metadata_config: OpenMetadataConnection,
         connection_type: str,
     ):
@@ -86,12 +121,14 @@ class QueryParserProcessor(Processor):
         self.config = config
         self.metadata_config = metadata_config
         self.connection_type = connection_type
+        self.parser_pool = ParserPool(self.config.processes)
+        self.query_cache = ParsedQueryCache(QueryTables, path=self.config.cache_path)
 
     @classmethod
     def create(
         cls, config_dict: dict, metadata_config: OpenMetadataConnection, **kwargs
     ):
-        config = ConfigModel.parse_obj(config_dict)
+        config = QueryParserProcessorConfig.parse_obj(config_dict)
         connection_type = kwargs.pop("connection_type", "")
         return cls(config, metadata_config, connection_type)
 
@@ -99,13 +136,26 @@ class QueryParserProcessor(Processor):
         self, queries: TableQueries
     ) -> Optional[QueryParserData]:
         if queries and queries.queries:
+            dialect = ConnectionTypeDialectMapper.dialect_of(self.connection_type)
+            parsed_queries = self.query_cache.parse(
+                self.parser_pool,
+                partial(parse_query_tables, dialect=dialect),
+                queries=[record.query for record in queries.queries],
+                keys=[
+                    get_query_cache_key(
+                        record.query,
+                        dialect,
+                        record.databaseName,
+                        record.databaseSchema,
+                    )
+                    for record in queries.queries
+                ],
+            )
             data = []
-            for record in queries.queries:
+            # Each query still counts for usage, even when its shape was cached
+            for record, query_tables in zip(queries.queries, parsed_queries):
                 try:
-                    parsed_sql = parse_sql_statement(
-                        record,
-                        ConnectionTypeDialectMapper.dialect_of(self.connection_type),
-                    )
+                    parsed_sql = parse_sql_statement(record, query_tables)
                     if parsed_sql:
                         data.append(parsed_sql)
                 except Exception as exc:
@@ -116,4 +166,5 @@ class QueryParserProcessor(Processor):
         return None
 
     def close(self):
-        pass
+        self.parser_pool.close()
+        self.query_cache.close()
@@ -17,9 +17,12 @@ We disable unexpected-keyword-arg as we get a false positive for request_timeout
 
 import json
 import ssl
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import singledispatch
-from typing import Any, List, Optional, Tuple
+from threading import Lock
+from typing import Any, List, Optional, Tuple, Type
 
 import boto3
 from requests_aws4auth import AWS4Auth
@@ -47,6 +50,7 @@ from metadata.generated.schema.entity.services.connections.metadata.openMetadata
 )
 from metadata.generated.schema.entity.teams.team import Team
 from metadata.generated.schema.entity.teams.user import User
+from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.generated.schema.type.entityReferenceList import EntityReferenceList
 from metadata.ingestion.api.common import Entity
 from metadata.ingestion.api.sink import Sink
@@ -110,9 +114,15 @@ from metadata.ingestion.sink.elasticsearch_mapping.web_analytic_user_activity_re
 )
 from metadata.utils.elasticsearch import ES_INDEX_MAP
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.lru_cache import LRUCache
 
 logger = ingestion_logger()
 
+LRU_CACHE_SIZE = 4096
+
+# Names of the parent entities (database, schema...) of the indexed documents
+parent_name_cache = LRUCache(LRU_CACHE_SIZE)
+
 
 class ElasticSearchConfig(ConfigModel):
     """
@@ -148,6 +158,13 @@ class ElasticSearchConfig(ConfigModel):
     use_AWS_credentials: Optional[bool] = False
     region_name: Optional[str] = None
 
+    # Buffer up to bulk_size documents and index them with a single _bulk request
+    bulk_size: int = 1
+    # Max seconds a document can wait in the buffer
+    bulk_flush_interval: float = 5.0
+    # _bulk requests in flight
+    bulk_threads: int = 1
+
 
 class ElasticsearchSink(Sink[Entity]):
     """
@@ -289,6 +306,16 @@ class ElasticsearchSink(Sink[Entity]):
                 QUERY_ELASTICSEARCH_INDEX_MAPPING,
             )
 
+        # Documents waiting to be indexed in bulk, as their name for the
+        # status and their _bulk action and source lines
+        self.bulk_buffer: List[Tuple[str, str, str]] = []
+        self.bulk_buffer_start: Optional[float] = None
+        self.bulk_lock = Lock()
+        self.bulk_requests: List[Future] = []
+        self._bulk_pool: Optional[ThreadPoolExecutor] = None
+        # Guards the bulk pool and the requests in flight
+        self.bulk_requests_lock = Lock()
+
         # Prepare write record dispatching
         self._write_record = singledispatch(self._write_record)
         self._write_record.register(Classification, self._write_classification)
@@ -343,14 +370,9 @@ class ElasticsearchSink(Sink[Entity]):
         Default implementation for the single dispatch
         """
 
+        # Documents are reported as written once they are indexed
         try:
             self._write_record(record)
-            self.status.records_written(
-                record.name.__root__
-                if hasattr(record, "name")
-                else type(record).__name__
-            )
-
         except Exception as exc:
             logger.debug(traceback.format_exc())
             logger.error(f"Failed to index due to {exc} - Entity: {record}")
@@ -362,32 +384,132 @@ class ElasticsearchSink(Sink[Entity]):
         Default implementation for the single dispatch
         """
         es_record = create_record_document(record, self.metadata)
-        self.elasticsearch_client.index(
+        self._index(
             index=ES_INDEX_MAP[type(record).__name__],
-            id=str(es_record.id),
+            doc_id=str(es_record.id),
             body=es_record.json(),
-            request_timeout=self.config.timeout,
+            name=es_record.name,
         )
-        self.status.records_written(es_record.name)
 
     def _write_report_data(self, record: ReportData) -> None:
-        self.elasticsearch_client.index(
+        self._index(
             index=DataInsightEsIndex[record.data.__class__.__name__].value,
-            id=record.id,
+            # Report data has no id, Elasticsearch generates one
+            doc_id=str(record.id) if record.id is not None else None,
             body=record.json(),
-            request_timeout=self.config.timeout,
+            name=type(record.data).__name__,
         )
 
     def _write_classification(self, record: Classification) -> None:
         es_record = create_record_document(record, self.metadata)
         for es_record_elem in es_record:
-            self.elasticsearch_client.index(
+            self._index(
                 index=ES_INDEX_MAP[Tag.__name__],
-                id=str(es_record_elem.id),
+                doc_id=str(es_record_elem.id),
                 body=es_record_elem.json(),
+                name=es_record_elem.name,
+            )
+
+    def _index(
+        self, index: str, doc_id: Optional[str], body: str, name: str
+    ) -> None:
+        """
+        Index the document right away, or keep it in the bulk buffer
+        if bulk indexing is enabled
+        """
+        if self.config.bulk_size <= 1:
+            self.elasticsearch_client.index(
+                index=index,
+                id=doc_id,
+                body=body,
                 request_timeout=self.config.timeout,
             )
-            self.status.records_written(es_record_elem.name)
+            self.status.records_written(name)
+            return
+
+        action = {"_index": index}
+        if doc_id is not None:
+            action["_id"] = doc_id
+        with self.bulk_lock:
+            self.bulk_buffer.append((name, json.dumps({"index": action}), body))
+            if self.bulk_buffer_start is None:
+                self.bulk_buffer_start = time.time()
+            if (
+                len(self.bulk_buffer) < self.config.bulk_size
+                and time.time() - self.bulk_buffer_start
+                < self.config.bulk_flush_interval
+            ):
+                return
+            docs = self.bulk_buffer
+            self.bulk_buffer, self.bulk_buffer_start = [], None
+
+        self._send_bulk(docs)
+
+    def _send_bulk(self, docs: List[Tuple[str, str, str]]) -> None:
+        """
+        Send a _bulk request in the background. We wait for the
+        oldest request if there are already bulk_threads in flight.
+        """
+        with self.bulk_requests_lock:
+            if self._bulk_pool is None:
+                self._bulk_pool = ThreadPoolExecutor(
+                    max_workers=max(self.config.bulk_threads, 1)
+                )
+            while len(self.bulk_requests) >= max(self.config.bulk_threads, 1):
+                self._wait_bulk(self.bulk_requests.pop(0))
+            self.bulk_requests.append(self._bulk_pool.submit(self._write_bulk, docs))
+
+    def _write_bulk(self, docs: List[Tuple[str, str, str]]) -> None:
+        """
+        Index the documents of a _bulk request and report each
+        of them as written or failed from the response
+        """
+        try:
+            response = self.elasticsearch_client.bulk(
+                body="".join(f"{action}\n{source}\n" for _, action, source in docs),
+                request_timeout=self.config.timeout,
+            )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.error(f"Failed to index {len(docs)} documents in bulk due to {exc}")
+            for name, _, _ in docs:
+                self.status.failed(name, str(exc), traceback.format_exc())
+            return
+
+        # Items come in the order of the actions
+        for (name, _, _), item in zip(docs, response["items"]):
+            result = item.get("index", {})
+            if result.get("error"):
+                error = (
+                    f"Failed to index document {result.get('_id')}: {result['error']}"
+                )
+                logger.error(error)
+                self.status.failed(name, error)
+            else:
+                self.status.records_written(name)
+
+    def _wait_bulk(self, request: Future) -> None:
+        try:
+            request.result()
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.error(f"Failed to index documents in bulk due to {exc}")
+            self.status.failed("bulk", str(exc), traceback.format_exc())
+
+    def flush(self) -> None:
+        """
+        Index the buffered documents and wait for the
+        _bulk requests in flight
+        """
+        with self.bulk_lock:
+            docs = self.bulk_buffer
+            self.bulk_buffer, self.bulk_buffer_start = [], None
+
+        if docs:
+            self._send_bulk(docs)
+        with self.bulk_requests_lock:
+            while self.bulk_requests:
+                self._wait_bulk(self.bulk_requests.pop(0))
 
     @staticmethod
     def _write_policy(_: Policy) -> None:
@@ -417,6 +539,10 @@ class ElasticsearchSink(Sink[Entity]):
         return self.elasticsearch_client.bulk(body=body)
 
     def close(self):
+        self.flush()
+        with self.bulk_requests_lock:
+            if self._bulk_pool is not None:
+                self._bulk_pool.shutdown()
         self.elasticsearch_client.close()
 
 
@@ -523,6 +649,23 @@ def _build_suggest_of(
     return suggest_list
 
 
+def get_parent_name(
+    metadata: OpenMetadata, entity: Type[Entity], reference: EntityReference
+) -> str:
+    """
+    Name of the parent entity of a document. References usually come
+    with the name, otherwise we fetch the entity once and keep its name.
+    """
+    if reference.name:
+        return reference.name
+
+    key = (entity.__name__, str(reference.id.__root__))
+    if key not in parent_name_cache:
+        parent = metadata.get_by_id(entity=entity, entity_id=key[1])
+        parent_name_cache.put(key, parent.name.__root__)
+    return parent_name_cache.get(key)
+
+
 @singledispatch
 def create_record_document(record: Entity, _: OpenMetadata) -> Any:
     """
@@ -552,11 +695,9 @@ def _(record: Table, metadata: OpenMetadata) -> TableESDocument:
         tags=tags,
     )
 
-    database_entity = metadata.get_by_id(
-        entity=Database, entity_id=str(record.database.id.__root__)
-    )
-    database_schema_entity = metadata.get_by_id(
-        entity=DatabaseSchema, entity_id=str(record.databaseSchema.id.__root__)
+    database_name = get_parent_name(metadata, Database, record.database)
+    database_schema_name = get_parent_name(
+        metadata, DatabaseSchema, record.databaseSchema
     )
 
     return TableESDocument(
@@ -579,10 +720,8 @@ def _(record: Table, metadata: OpenMetadata) -> TableESDocument:
         serviceType=str(record.serviceType.name),
         suggest=suggest,
         service_suggest=[ESSuggest(input=record.service.name, weight=5)],
-        database_suggest=[ESSuggest(input=database_entity.name.__root__, weight=5)],
-        schema_suggest=[
-            ESSuggest(input=database_schema_entity.name.__root__, weight=5)
-        ],
+        database_suggest=[ESSuggest(input=database_name, weight=5)],
+        schema_suggest=[ESSuggest(input=database_schema_name, weight=5)],
         column_suggest=[ESSuggest(input=column, weight=5) for column in column_names],
         description=record.description.__root__ if record.description else "",
         tier=tier,
@@ -0,0 +1,144 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Fingerprints of the create requests written by the sink.
+
+If a source sends the same request as in the last successful
+write of that Entity, there is nothing to update in OpenMetadata.
+The Entity written is kept with the fingerprint, so that it can
+still be handed back to the source.
+"""
+import hashlib
+import sqlite3
+import time
+from functools import singledispatch
+from threading import Lock
+from typing import Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.utils.fqn import FQN_SEPARATOR, quote_name
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@singledispatch
+def get_fingerprint_key(request: BaseModel) -> Optional[str]:
+    """
+    FQN of the Entity a create request will write.
+    Requests without a key are always written.
+    """
+    return None
+
+
+@get_fingerprint_key.register
+def _(request: CreateTableRequest) -> Optional[str]:
+    return FQN_SEPARATOR.join(
+        [request.databaseSchema.__root__, quote_name(request.name.__root__)]
+    )
+
+
+def get_fingerprint(request: BaseModel) -> str:
+    """
+    Hash of the canonical JSON of the request
+    """
+    return hashlib.sha256(request.json(sort_keys=True).encode()).hexdigest()
+
+
+class FingerprintStore:
+    """
+    Keeps in a local sqlite file the fingerprint of the last
+    request written for each Entity FQN, and the Entity written.
+
+    Fingerprints older than `max_age` seconds are ignored, so that
+    the Entities are still written from time to time and any change
+    made in OpenMetadata outside of the ingestion gets overwritten.
+    """
+
+    def __init__(self, path: str, max_age: float):
+        self.max_age = max_age
+        self.lock = Lock()
+        # Losing the latest fingerprints only means writing those Entities again
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA synchronous = OFF")
+        columns = {
+            row[1]
+            for row in self.connection.execute("PRAGMA table_info(fingerprints)")
+        }
+        if columns and "entity" not in columns:
+            # Stores from older versions do not have the Entities to hand back
+            self.connection.execute("DROP TABLE fingerprints")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "fqn TEXT PRIMARY KEY, fingerprint TEXT NOT NULL,"
+            " written_at REAL NOT NULL, entity TEXT NOT NULL)"
+        )
+
+    def get_unchanged_entity(
+        self, request: BaseModel, entity_type: Type[T]
+    ) -> Optional[T]:
+        """
+        Entity written from the last request of its FQN,
+        if the request matches that one
+        """
+        key = get_fingerprint_key(request)
+        if key is None:
+            return None
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT fingerprint, written_at, entity FROM fingerprints"
+                " WHERE fqn = ?",
+                (key,),
+            ).fetchone()
+        if (
+            row is None
+            or time.time() - row[1] >= self.max_age
+            or row[0] != get_fingerprint(request)
+        ):
+            return None
+        return entity_type.parse_raw(row[2])
+
+    def save(self, request: BaseModel, entity: BaseModel) -> None:
+        """
+        Keep the fingerprint of a request that was successfully
+        written, and the Entity written from it
+        """
+        key = get_fingerprint_key(request)
+        if key is None:
+            return
+        fingerprint = get_fingerprint(request)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)",
+                (key, fingerprint, time.time(), entity.json()),
+            )
+
+    def remove(self, fqn: str, recursive: bool = False) -> None:
+        """
+        Forget an Entity, e.g., after deleting it, so that
+        the next request for it is always written. With `recursive`,
+        the Entities under it, e.g., the tables of a schema, as well.
+        """
+        prefix = fqn + FQN_SEPARATOR
+        with self.lock:
+            self.connection.execute("DELETE FROM fingerprints WHERE fqn = ?", (fqn,))
+            if recursive:
+                self.connection.execute(
+                    "DELETE FROM fingerprints WHERE substr(fqn, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
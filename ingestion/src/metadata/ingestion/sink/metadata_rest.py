@@ -13,9 +13,12 @@ This is the main used sink for all OM Workflows.
 It picks up the generated Entities and send them
 to the OM API.
 """
+import time
 import traceback
+from collections import defaultdict
 from functools import singledispatch
-from typing import Optional, TypeVar
+from threading import Lock
+from typing import Dict, List, Optional, Set, Type, TypeVar, Union
 
 from pydantic import BaseModel, ValidationError
 from requests.exceptions import HTTPError
@@ -50,7 +53,8 @@ from metadata.ingestion.models.tests_data import (
 )
 from metadata.ingestion.models.user import OMetaUserProfile
 from metadata.ingestion.ometa.client import APIError
-from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.ometa.ometa_api import DEFAULT_BULK_WORKERS, OpenMetadata
+from metadata.ingestion.sink.fingerprint import FingerprintStore
 from metadata.ingestion.source.dashboard.dashboard_service import DashboardUsage
 from metadata.ingestion.source.database.database_service import DataModelLink
 from metadata.utils.helpers import calculate_execution_time
@@ -64,6 +68,16 @@ T = TypeVar("T", bound=BaseModel)
 
 class MetadataRestSinkConfig(ConfigModel):
     api_endpoint: Optional[str] = None
+    # Buffer up to bulk_size create requests per Entity type and send them together
+    bulk_size: int = 1
+    # Max seconds a create request can wait in the buffer
+    bulk_flush_interval: float = 5.0
+    # Requests in flight when sending a buffer
+    bulk_threads: int = DEFAULT_BULK_WORKERS
+    # sqlite file with the fingerprints of the written requests to skip unchanged ones
+    fingerprint_store: Optional[str] = None
+    # Days after which an Entity is written again even if its request did not change
+    fingerprint_max_age_days: float = 7
 
 
 class MetadataRestSink(Sink[Entity]):
@@ -89,6 +103,24 @@ class MetadataRestSink(Sink[Entity]):
         self.role_entities = {}
         self.team_entities = {}
 
+        # Create requests waiting to be sent in bulk, by request type
+        self.bulk_buffer: Dict[Type[BaseModel], List[BaseModel]] = defaultdict(list)
+        self.bulk_buffer_start: Dict[Type[BaseModel], float] = {}
+        self.bulk_lock = Lock()
+
+        self.fingerprints: Optional[FingerprintStore] = (
+            FingerprintStore(
+                path=self.config.fingerprint_store,
+                max_age=self.config.fingerprint_max_age_days * 24 * 60 * 60,
+            )
+            if self.config.fingerprint_store
+            else None
+        )
+        # Ids of the tables in OpenMetadata, by schema FQN, to check that
+        # the tables skipped by their fingerprint were not deleted
+        self.existing_tables: Dict[str, Set[str]] = {}
+        self.existing_tables_lock = Lock()
+
         # Prepare write record dispatching
         self.write_record = singledispatch(self.write_record)
         self.write_record.register(AddLineageRequest, self.write_lineage)
@@ -112,11 +144,27 @@ class MetadataRestSink(Sink[Entity]):
         )
         self.write_record.register(OMetaTopicSampleData, self.write_topic_sample_data)
 
+        # The other records are only written once the buffered creates are sent
+        self._dispatch_record = self.write_record
+        self.write_record = self._write_after_buffered_requests
+
     @classmethod
     def create(cls, config_dict: dict, metadata_config: OpenMetadataConnection):
         config = MetadataRestSinkConfig.parse_obj(config_dict)
         return cls(config, metadata_config)
 
+    def _write_after_buffered_requests(self, record: Entity) -> None:
+        """
+        Records other than create requests, e.g., lineage, constraints or
+        deletes, can depend on the Entities of the buffered create requests.
+        Send those first, so that they are not overtaken.
+        """
+        if self.bulk_buffer and self._dispatch_record.dispatch(
+            type(record)
+        ) is not self._dispatch_record.dispatch(object):
+            self.flush()
+        self._dispatch_record(record)
+
     @calculate_execution_time
     def write_record(self, record: Entity) -> None:
         """
@@ -124,17 +172,124 @@ class MetadataRestSink(Sink[Entity]):
         """
 
         logger.debug(f"Processing Create request {type(record)}")
-        self.write_create_request(record)
+        unchanged_entity = self.get_unchanged_entity(record)
+        if unchanged_entity is not None:
+            logger.debug(
+                f"Skipping {type(record).__name__} [{record.name.__root__}]"
+                " as it did not change since it was last written"
+            )
+            self.ack(record, unchanged_entity)
+            return
+        if self.config.bulk_size > 1:
+            self.buffer_create_request(record)
+        else:
+            self.write_create_request(record)
+
+    def get_unchanged_entity(self, entity_request) -> Optional[BaseModel]:
+        """
+        Entity written from the same request in a previous run, if it
+        is still in OpenMetadata. Only table requests have fingerprints.
+        """
+        if not self.fingerprints:
+            return None
+        try:
+            entity = self.fingerprints.get_unchanged_entity(
+                entity_request,
+                self.metadata.get_entity_from_create(type(entity_request)),
+            )
+            if entity is None:
+                return None
+            schema_fqn = entity_request.databaseSchema.__root__
+            with self.existing_tables_lock:
+                if schema_fqn not in self.existing_tables:
+                    self.existing_tables[schema_fqn] = {
+                        str(table.id.__root__)
+                        for table in self.metadata.list_all_entities(
+                            entity=Table, params={"databaseSchema": schema_fqn}
+                        )
+                    }
+                existing_tables = self.existing_tables[schema_fqn]
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not check if [{entity_request.name.__root__}] changed,"
+                f" writing it: {exc}"
+            )
+            return None
+        return entity if str(entity.id.__root__) in existing_tables else None
+
+    def buffer_create_request(self, entity_request) -> None:
+        """
+        Keep the request in the buffer of its type and send the
+        buffer if it is full or has been waiting for too long
+        """
+        request_type = type(entity_request)
+        with self.bulk_lock:
+            self.bulk_buffer[request_type].append(entity_request)
+            self.bulk_buffer_start.setdefault(request_type, time.time())
+            if (
+                len(self.bulk_buffer[request_type]) < self.config.bulk_size
+                and time.time() - self.bulk_buffer_start[request_type]
+                < self.config.bulk_flush_interval
+            ):
+                return
+            requests = self.bulk_buffer.pop(request_type)
+            self.bulk_buffer_start.pop(request_type)
+
+        self.write_create_requests(requests)
+
+    def flush(self) -> None:
+        """
+        Send all the buffered create requests
+        """
+        with self.bulk_lock:
+            buffers = list(self.bulk_buffer.values())
+            self.bulk_buffer.clear()
+            self.bulk_buffer_start.clear()
+
+        for requests in buffers:
+            if requests:
+                self.write_create_requests(requests)
+
+    def write_create_requests(self, entity_requests: List[BaseModel]) -> None:
+        """
+        Send to OM a list of create requests and report each of them
+        :param entity_requests: Create Entity requests
+        """
+        results = self.metadata.create_or_update_many(
+            entity_requests, max_workers=self.config.bulk_threads
+        )
+        for entity_request, result in zip(entity_requests, results):
+            self._handle_create_result(entity_request, result)
 
     def write_create_request(self, entity_request) -> None:
         """
         Send to OM the request creation received as is.
         :param entity_request: Create Entity request
         """
-        log = f"{type(entity_request).__name__} [{entity_request.name.__root__}]"
         try:
             created = self.metadata.create_or_update(entity_request)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            created = exc
+        self._handle_create_result(entity_request, created)
+
+    def _handle_create_result(
+        self, entity_request, created: Union[BaseModel, Exception, None]
+    ) -> None:
+        """
+        Update the status with the result of a create request
+        :param entity_request: Create Entity request
+        :param created: Entity created, or the exception raised while creating it
+        """
+        log = f"{type(entity_request).__name__} [{entity_request.name.__root__}]"
+        try:
+            if isinstance(created, Exception):
+                raise created
             if created:
+                if self.fingerprints:
+                    self.fingerprints.save(entity_request, created)
+                self.ack(entity_request, created)
                 self.status.records_written(
                     f"{type(created).__name__}: {created.fullyQualifiedName.__root__}"
                 )
@@ -333,6 +488,11 @@ class MetadataRestSink(Sink[Entity]):
                 entity_id=record.entity.id,
                 recursive=record.mark_deleted_entities,
             )
+            if self.fingerprints:
+                self.fingerprints.remove(
+                    record.entity.fullyQualifiedName.__root__,
+                    recursive=bool(record.mark_deleted_entities),
+                )
             logger.debug(
                 f"{record.entity.name} doesn't exist in source state, marking it as deleted"
             )
@@ -488,4 +648,6 @@ class MetadataRestSink(Sink[Entity]):
             )
 
     def close(self):
-        pass
+        self.flush()
+        if self.fingerprints:
+            self.fingerprints.close()
@@ -14,7 +14,7 @@ Generic source to build SQL connectors.
 import traceback
 from abc import ABC
 from copy import deepcopy
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
 
 from pydantic import BaseModel
 from sqlalchemy.engine import Connection
@@ -50,6 +50,10 @@ from metadata.ingestion.models.table_metadata import OMetaTableConstraints
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.ingestion.source.connections import get_connection
 from metadata.ingestion.source.database.database_service import DatabaseServiceSource
+from metadata.ingestion.source.database.schema_reflection import (
+    SchemaInspector,
+    SchemaReflector,
+)
 from metadata.ingestion.source.database.sql_column_handler import SqlColumnHandlerMixin
 from metadata.ingestion.source.database.sqlalchemy_source import SqlAlchemySource
 from metadata.ingestion.source.models import TableView
@@ -80,6 +84,9 @@ class CommonDbSourceService(
     - fetch_column_tags implemented at SqlColumnHandler. Sources should override this when needed
     """
 
+    # Fetches the tables information of a whole schema with bulkReflection
+    schema_reflector: SchemaReflector = SchemaReflector()
+
     def __init__(
         self,
         config: WorkflowSource,
@@ -103,6 +110,7 @@ class CommonDbSourceService(
         self.test_connection()
 
         self._connection = None  # Lazy init as well
+        self._schema_inspector: Optional[SchemaInspector] = None
         self.table_constraints = None
         self.database_source_state = set()
         self.context.table_views = []
@@ -123,6 +131,44 @@ class CommonDbSourceService(
         self.inspector = inspect(self.engine)
         self._connection = None  # Lazy init as well
 
+    def get_worker_source(self) -> "CommonDbSourceService":
+        """
+        Give each thread its own inspector and connection
+        from the engine of the database being processed
+        """
+        worker = super().get_worker_source()
+        worker.inspector = inspect(self.engine)
+        worker._connection = None  # pylint: disable=protected-access
+        return worker
+
+    def close_worker_source(self, worker: "CommonDbSourceService") -> None:
+        if worker._connection is not None:  # pylint: disable=protected-access
+            worker._connection.close()  # pylint: disable=protected-access
+
+    @property
+    def schema_inspector(self) -> Inspector:
+        """
+        Inspector to reflect the tables of the schema being processed.
+
+        With bulkReflection, the tables information is fetched once
+        for the whole schema and kept until we move to the next one.
+        """
+        if not self.source_config.bulkReflection:
+            return self.inspector
+
+        schema_name = self.context.database_schema.name.__root__
+        if (
+            self._schema_inspector is None
+            or self._schema_inspector.inspector is not self.inspector
+            or self._schema_inspector.schema != schema_name
+        ):
+            self._schema_inspector = SchemaInspector(
+                inspector=self.inspector,
+                schema=schema_name,
+                reflector=self.schema_reflector,
+            )
+        return self._schema_inspector
+
     def get_database_names(self) -> Iterable[str]:
         """
         Default case with a single database.
@@ -238,6 +284,10 @@ class CommonDbSourceService(
         """
         try:
             schema_name = self.context.database_schema.name.__root__
+            changed_tables = self._get_changed_table_names(schema_name)
+            existing_tables = (
+                self._get_existing_table_fqns() if changed_tables is not None else set()
+            )
             if self.source_config.includeTables:
                 for table_and_type in self.query_table_names_and_types(schema_name):
                     table_name = self.standardize_table_name(
@@ -263,11 +313,15 @@ class CommonDbSourceService(
                             "Table Filtered Out",
                         )
                         continue
+                    if self._is_unchanged_table(
+                        table_and_type.name, table_fqn, changed_tables, existing_tables
+                    ):
+                        continue
                     yield table_name, table_and_type.type_
 
             if self.source_config.includeViews:
-                for view_name in self.inspector.get_view_names(schema_name):
-                    view_name = self.standardize_table_name(schema_name, view_name)
+                for raw_view_name in self.inspector.get_view_names(schema_name):
+                    view_name = self.standardize_table_name(schema_name, raw_view_name)
                     view_fqn = fqn.build(
                         self.metadata,
                         entity_type=Table,
@@ -288,6 +342,10 @@ class CommonDbSourceService(
                             "Table Filtered Out",
                         )
                         continue
+                    if self._is_unchanged_table(
+                        raw_view_name, view_fqn, changed_tables, existing_tables
+                    ):
+                        continue
                     yield view_name, TableType.View
         except Exception as err:
             logger.warning(
@@ -295,6 +353,75 @@ class CommonDbSourceService(
             )
             logger.debug(traceback.format_exc())
 
+    def get_changed_table_names(  # pylint: disable=unused-argument
+        self, schema_name: str
+    ) -> Optional[Set[str]]:
+        """
+        Names of the tables and views of the schema that changed in the
+        source after the watermark, as returned by the inspector.
+
+        Returning None means that the source cannot tell, and all
+        the tables of the schema will be processed.
+        """
+        return None
+
+    def _get_changed_table_names(self, schema_name: str) -> Optional[Set[str]]:
+        if not self.watermark:
+            return None
+        try:
+            return self.get_changed_table_names(schema_name)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not fetch the changed tables of schema [{schema_name}],"
+                f" processing all of them: {exc}"
+            )
+        return None
+
+    def _get_existing_table_fqns(self) -> Set[str]:
+        """
+        FQNs of the tables of the current schema in OpenMetadata. Tables
+        missing from it, e.g., newly included by the filters or deleted,
+        are processed even if they did not change in the source.
+        """
+        schema_fqn = self.context.database_schema.fullyQualifiedName.__root__
+        try:
+            return {
+                table.fullyQualifiedName.__root__
+                for table in self.metadata.list_all_entities(
+                    entity=Table, params={"databaseSchema": schema_fqn}
+                )
+            }
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not list the tables of schema [{schema_fqn}],"
+                f" processing all of them: {exc}"
+            )
+        return set()
+
+    def _is_unchanged_table(
+        self,
+        table_name: str,
+        table_fqn: str,
+        changed_tables: Optional[Set[str]],
+        existing_tables: Set[str],
+    ) -> bool:
+        """
+        Skip the tables that did not change since the watermark and already
+        exist in OpenMetadata, but keep them in the source state so that
+        they are not marked as deleted
+        """
+        if (
+            changed_tables is None
+            or table_name in changed_tables
+            or table_fqn not in existing_tables
+        ):
+            return False
+        self.database_source_state.add(table_fqn)
+        logger.debug(f"Skipping [{table_fqn}] as it did not change since the last run")
+        return True
+
     def get_view_definition(
         self, table_type: str, table_name: str, schema_name: str, inspector: Inspector
     ) -> Optional[str]:
@@ -349,6 +476,7 @@ class CommonDbSourceService(
         """
         table_name, table_type = table_name_and_type
         schema_name = self.context.database_schema.name.__root__
+        inspector = self.schema_inspector
         try:
             (
                 columns,
@@ -358,14 +486,14 @@ class CommonDbSourceService(
                 schema_name=schema_name,
                 table_name=table_name,
                 db_name=self.context.database.name.__root__,
-                inspector=self.inspector,
+                inspector=inspector,
             )
 
             view_definition = self.get_view_definition(
                 table_type=table_type,
                 table_name=table_name,
                 schema_name=schema_name,
-                inspector=self.inspector,
+                inspector=inspector,
             )
 
             table_request = CreateTableRequest(
@@ -374,7 +502,7 @@ class CommonDbSourceService(
                 description=self.get_table_description(
                     schema_name=schema_name,
                     table_name=table_name,
-                    inspector=self.inspector,
+                    inspector=inspector,
                 ),
                 columns=columns,
                 viewDefinition=view_definition,
@@ -391,7 +519,7 @@ class CommonDbSourceService(
             )
 
             is_partitioned, partition_details = self.get_table_partition_details(
-                table_name=table_name, schema_name=schema_name, inspector=self.inspector
+                table_name=table_name, schema_name=schema_name, inspector=inspector
             )
             if is_partitioned:
                 table_request.tableType = TableType.Partitioned.value
@@ -12,7 +12,8 @@
 Base class for ingesting database services
 """
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from pydantic import BaseModel
 from sqlalchemy.engine import Inspector
@@ -61,6 +62,8 @@ from metadata.utils.tag_utils import get_tag_label
 
 logger = ingestion_logger()
 
+INCREMENTAL_SAFETY_MARGIN = timedelta(hours=1)
+
 
 class DataModelLink(BaseModel):
     """
@@ -115,7 +118,7 @@ class DatabaseServiceTopology(ServiceTopology):
                 processor="yield_tag_details",
                 ack_sink=False,
                 nullable=True,
-                cache_all=True,
+                cache_by_fqn=True,
             ),
             NodeStage(
                 type_=DatabaseSchema,
@@ -126,6 +129,7 @@ class DatabaseServiceTopology(ServiceTopology):
         ],
         children=["table"],
         post_process=["mark_tables_as_deleted"],
+        threads=True,
     )
     table = TopologyNode(
         producer="get_tables_name_and_type",
@@ -157,12 +161,31 @@ class DatabaseServiceSource(
     # When processing the database, the source will update the inspector if needed
     inspector: Inspector
 
+    # With incremental extraction, only the tables changed after it are processed
+    watermark: Optional[datetime] = None
+
     topology = DatabaseServiceTopology()
     context = create_source_context(topology)
 
+    def __init__(self):
+        super().__init__()
+        # Tag labels resolved by (classification, tag) name
+        self.tag_labels: Dict[Tuple[str, str], TagLabel] = {}
+
     def prepare(self):
         pass
 
+    def get_threads(self) -> int:
+        return self.source_config.threads or 1
+
+    def is_incremental(self) -> bool:
+        return bool(self.source_config.incremental)
+
+    def set_watermark(self, watermark: Optional[datetime]) -> None:
+        # Leave some room for clock differences with the source and
+        # for the changes committed while the last run was starting
+        self.watermark = watermark - INCREMENTAL_SAFETY_MARGIN if watermark else None
+
     def get_services(self) -> Iterable[WorkflowSource]:
         yield self.config
 
@@ -267,17 +290,34 @@ class DatabaseServiceSource(
         """
 
         tag_labels = []
-        for tag_and_category in self.context.tags or []:
-            if tag_and_category.fqn.__root__ == entity_fqn:
-                tag_label = get_tag_label(
-                    metadata=self.metadata,
-                    tag_name=tag_and_category.tag_request.name.__root__,
-                    classification_name=tag_and_category.classification_request.name.__root__,
-                )
-                if tag_label:
-                    tag_labels.append(tag_label)
+        for tag_and_category in (self.context.tags or {}).get(entity_fqn, []):
+            tag_label = self.get_tag_label(
+                classification_name=tag_and_category.classification_request.name.__root__,
+                tag_name=tag_and_category.tag_request.name.__root__,
+            )
+            if tag_label:
+                tag_labels.append(tag_label)
         return tag_labels or None
 
+    def get_tag_label(
+        self, classification_name: str, tag_name: str
+    ) -> Optional[TagLabel]:
+        """
+        Tag label of the classification tag, only resolved once.
+        Missing tags are looked up again, as they can be created later.
+        """
+        key = (classification_name, tag_name)
+        if key not in self.tag_labels:
+            tag_label = get_tag_label(
+                metadata=self.metadata,
+                tag_name=tag_name,
+                classification_name=classification_name,
+            )
+            if tag_label is None:
+                return None
+            self.tag_labels[key] = tag_label
+        return self.tag_labels[key]
+
     def get_tag_labels(self, table_name: str) -> Optional[List[TagLabel]]:
         """
         This will only get executed if the tags context
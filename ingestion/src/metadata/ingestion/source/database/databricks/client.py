@@ -14,7 +14,7 @@ Client to interact with databricks apis
 import json
 import traceback
 from datetime import timedelta
-from typing import List
+from typing import Iterable, List
 
 import requests
 
@@ -66,11 +66,11 @@ class DatabricksClient:
         if res.status_code != 200:
             raise APIError(res.json)
 
-    def list_query_history(self, start_date=None, end_date=None) -> List[dict]:
+    def list_query_history(self, start_date=None, end_date=None) -> Iterable[dict]:
         """
-        Method returns List the history of queries through SQL warehouses
+        Method yields the history of queries through SQL warehouses,
+        page by page
         """
-        query_details = []
         try:
             next_page_token = None
             has_next_page = None
@@ -106,7 +106,7 @@ class DatabricksClient:
 
                 while True:
                     if result:
-                        query_details.extend(result)
+                        yield from result
 
                         next_page_token = response.get("next_page_token", None)
                         has_next_page = response.get("has_next_page", None)
@@ -132,8 +132,6 @@ class DatabricksClient:
             logger.debug(traceback.format_exc())
             logger.error(exc)
 
-        return query_details
-
     def is_query_valid(self, row) -> bool:
         query_text = row.get("query_text")
         return not (
@@ -20,6 +20,7 @@ from metadata.ingestion.source.database.databricks.query_parser import (
     DatabricksQueryParserSource,
 )
 from metadata.ingestion.source.database.usage_source import UsageSource
+from metadata.utils.helpers import batched
 from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
@@ -32,33 +33,34 @@ class DatabricksUsageSource(DatabricksQueryParserSource, UsageSource):
 
     def yield_table_queries(self) -> Optional[Iterable[TableQuery]]:
         """
-        Method to yield TableQueries
+        Method to yield TableQueries, in batches of `queryBatchSize` queries
         """
-        queries = []
         data = self.client.list_query_history(
             start_date=self.start,
             end_date=self.end,
         )
-        for row in data:
-            try:
-                if self.client.is_query_valid(row):
-                    queries.append(
-                        TableQuery(
-                            query=row.get("query_text"),
-                            userName=row.get("user_name"),
-                            startTime=row.get("query_start_time_ms"),
-                            endTime=row.get("execution_end_time_ms"),
-                            analysisDate=datetime.now(),
-                            serviceName=self.config.serviceName,
-                            duration=row.get("duration") / 1000
-                            if row.get("duration")
-                            else None,
+        for rows in batched(data, self.source_config.queryBatchSize):
+            queries = []
+            for row in rows:
+                try:
+                    if self.client.is_query_valid(row):
+                        queries.append(
+                            TableQuery(
+                                query=row.get("query_text"),
+                                userName=row.get("user_name"),
+                                startTime=row.get("query_start_time_ms"),
+                                endTime=row.get("execution_end_time_ms"),
+                                analysisDate=datetime.now(),
+                                serviceName=self.config.serviceName,
+                                duration=row.get("duration") / 1000
+                                if row.get("duration")
+                                else None,
+                            )
                         )
+                except Exception as err:
+                    logger.debug(traceback.format_exc())
+                    logger.warning(
+                        f"Failed to process query {row.get('query_text')} due to: {err}"
                     )
-            except Exception as err:
-                logger.debug(traceback.format_exc())
-                logger.warning(
-                    f"Failed to process query {row.get('query_text')} due to: {err}"
-                )
 
-        yield TableQueries(queries=queries)
+            yield TableQueries(queries=queries)
@@ -60,6 +60,7 @@ from metadata.ingestion.source.database.datalake.models import (
 )
 from metadata.utils import fqn
 from metadata.utils.constants import COMPLEX_COLUMN_SEPARATOR, DEFAULT_DATABASE
+from metadata.utils.datalake.common import SCHEMA_SAMPLE_ROWS
 from metadata.utils.datalake.datalake_utils import (
     SupportedTypes,
     clean_dataframe,
@@ -385,8 +386,9 @@ class DatalakeSource(DatabaseServiceSource):
                     bucket_name=schema_name,
                 ),
                 connection_kwargs=connection_args,
+                nrows=SCHEMA_SAMPLE_ROWS,
             )
-            columns = self.get_columns(data_frame[0])
+            columns = self.get_columns(next(iter(data_frame)))
             if columns:
                 table_request = CreateTableRequest(
                     name=table_name,
@@ -13,7 +13,7 @@ DBT source methods.
 """
 import traceback
 from datetime import datetime
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional
 
 from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
 from metadata.generated.schema.api.tests.createTestCase import CreateTestCaseRequest
@@ -84,6 +84,7 @@ from metadata.ingestion.source.database.dbt.dbt_utils import (
     get_dbt_raw_query,
 )
 from metadata.utils import fqn
+from metadata.utils.catalog_index import get_catalog_index
 from metadata.utils.elasticsearch import get_entity_from_es_result
 from metadata.utils.logger import ingestion_logger
 from metadata.utils.tag_utils import get_ometa_tag_and_classification, get_tag_labels
@@ -408,14 +409,7 @@ class DbtSource(DbtServiceSource):
                         table_name=model_name,
                     )
 
-                    table_entity: Optional[
-                        Union[Table, List[Table]]
-                    ] = get_entity_from_es_result(
-                        entity_list=self.metadata.es_search_from_fqn(
-                            entity_type=Table, fqn_search_string=table_fqn
-                        ),
-                        fetch_multiple_entities=False,
-                    )
+                    table_entity: Optional[Table] = self._search_table(table_fqn)
 
                     if table_entity:
                         data_model_link = DataModelLink(
@@ -497,13 +491,8 @@ class DbtSource(DbtServiceSource):
 
                         # check if the parent table exists in OM before adding it to the upstream list
                         # TODO: Change to get_by_name once the postgres case sensitive calls is fixed
-                        parent_table_entity: Optional[
-                            Union[Table, List[Table]]
-                        ] = get_entity_from_es_result(
-                            entity_list=self.metadata.es_search_from_fqn(
-                                entity_type=Table, fqn_search_string=parent_fqn
-                            ),
-                            fetch_multiple_entities=False,
+                        parent_table_entity: Optional[Table] = self._search_table(
+                            parent_fqn
                         )
                         if parent_table_entity:
                             upstream_nodes.append(parent_fqn)
@@ -567,6 +556,27 @@ class DbtSource(DbtServiceSource):
 
         return columns
 
+    def _search_table(self, table_fqn: str) -> Optional[Table]:
+        """
+        Find the table from the catalog snapshot, if the workflow
+        took one, or from ES if it is missing from the snapshot
+        """
+        if not table_fqn:
+            return None
+        entity_list = None
+        catalog_index = get_catalog_index(self.config.serviceName)
+        fqn_parts = fqn.split(table_fqn)
+        if catalog_index and len(fqn_parts) == 4:
+            _, database_name, schema_name, table_name = fqn_parts
+            entity_list = catalog_index.search(database_name, schema_name, table_name)
+        if not entity_list:
+            entity_list = self.metadata.es_search_from_fqn(
+                entity_type=Table, fqn_search_string=table_fqn
+            )
+        return get_entity_from_es_result(
+            entity_list=entity_list, fetch_multiple_entities=False
+        )
+
     def create_dbt_lineage(
         self, data_model_link: DataModelLink
     ) -> Iterable[AddLineageRequest]:
@@ -580,15 +590,7 @@ class DbtSource(DbtServiceSource):
 
         for upstream_node in data_model_link.datamodel.upstream:
             try:
-                from_es_result = self.metadata.es_search_from_fqn(
-                    entity_type=Table,
-                    fqn_search_string=upstream_node,
-                )
-                from_entity: Optional[
-                    Union[Table, List[Table]]
-                ] = get_entity_from_es_result(
-                    entity_list=from_es_result, fetch_multiple_entities=False
-                )
+                from_entity: Optional[Table] = self._search_table(upstream_node)
                 if from_entity and to_entity:
                     yield AddLineageRequest(
                         edge=EntitiesEdge(
@@ -14,17 +14,34 @@ Lineage Source Module
 import csv
 import traceback
 from abc import ABC
-from typing import Iterable, Iterator, Optional
+from functools import partial
+from typing import Iterable, Iterator, Optional, Set
 
 from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
 from metadata.generated.schema.type.tableQuery import TableQuery
-from metadata.ingestion.lineage.models import ConnectionTypeDialectMapper
-from metadata.ingestion.lineage.sql_lineage import get_lineage_by_query
+from metadata.ingestion.lineage.models import (
+    ConnectionTypeDialectMapper,
+    Dialect,
+    QueryLineage,
+)
+from metadata.ingestion.lineage.parser_pool import ParserPool
+from metadata.ingestion.lineage.query_cache import (
+    ParsedQueryCache,
+    get_query_cache_key,
+)
+from metadata.ingestion.lineage.sql_lineage import (
+    get_lineage_by_query,
+    get_query_lineage,
+)
 from metadata.ingestion.source.database.query_parser_source import QueryParserSource
+from metadata.utils.helpers import batched
 from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
 
+# Queries sent at once to the parser pool
+PARSING_BATCH_SIZE = 1000
+
 
 class LineageSource(QueryParserSource, ABC):
     """
@@ -36,8 +53,15 @@ class LineageSource(QueryParserSource, ABC):
     - service
     - database
     - schema
+
+    Queries are parsed in a pool of `parsingProcesses` processes, once
+    per query shape: queries only differing in their literals share
+    the same lineage.
     """
 
+    _parser_pool: Optional[ParserPool] = None
+    _query_cache: Optional[ParsedQueryCache[QueryLineage]] = None
+
     def yield_table_queries_from_logs(self) -> Optional[Iterator[TableQuery]]:
         """
         Method to handle the usage from query logs
@@ -98,6 +122,62 @@ class LineageSource(QueryParserSource, ABC):
                     logger.debug(traceback.format_exc())
                     logger.warning(f"Error processing query_dict {query_dict}: {exc}")
 
+    @property
+    def parser_pool(self) -> ParserPool:
+        if self._parser_pool is None:
+            self._parser_pool = ParserPool(self.source_config.parsingProcesses or 1)
+        return self._parser_pool
+
+    @property
+    def query_cache(self) -> ParsedQueryCache[QueryLineage]:
+        if self._query_cache is None:
+            self._query_cache = ParsedQueryCache(
+                QueryLineage, path=self.source_config.parsedQueryCachePath
+            )
+        return self._query_cache
+
+    def yield_lineage(
+        self, table_queries: Iterable[TableQuery], dialect: Dialect
+    ) -> Iterable[AddLineageRequest]:
+        """
+        Parse the queries in batches with the parser pool
+        and prepare their lineage, once per query shape
+        """
+        parse = partial(get_query_lineage, dialect=dialect)
+        processed_keys: Set[str] = set()
+        for batch in batched(table_queries, PARSING_BATCH_SIZE):
+            keys = [
+                get_query_cache_key(
+                    table_query.query,
+                    dialect,
+                    table_query.databaseName,
+                    table_query.databaseSchema,
+                )
+                for table_query in batch
+            ]
+            query_lineages = self.query_cache.parse(
+                self.parser_pool,
+                parse,
+                queries=[table_query.query for table_query in batch],
+                keys=keys,
+            )
+            for table_query, key, query_lineage in zip(batch, keys, query_lineages):
+                if not query_lineage or key in processed_keys:
+                    continue
+                processed_keys.add(key)
+                lineages = get_lineage_by_query(
+                    self.metadata,
+                    query=table_query.query,
+                    service_name=table_query.serviceName,
+                    database_name=table_query.databaseName,
+                    schema_name=table_query.databaseSchema,
+                    dialect=dialect,
+                    query_lineage=query_lineage,
+                )
+
+                for lineage_request in lineages or []:
+                    yield lineage_request
+
     def next_record(self) -> Iterable[AddLineageRequest]:
         """
         Based on the query logs, prepare the lineage
@@ -105,15 +185,11 @@ class LineageSource(QueryParserSource, ABC):
         """
         connection_type = str(self.service_connection.type.value)
         dialect = ConnectionTypeDialectMapper.dialect_of(connection_type)
-        for table_query in self.get_table_query():
-            lineages = get_lineage_by_query(
-                self.metadata,
-                query=table_query.query,
-                service_name=table_query.serviceName,
-                database_name=table_query.databaseName,
-                schema_name=table_query.databaseSchema,
-                dialect=dialect,
-            )
+        yield from self.yield_lineage(self.get_table_query(), dialect)
 
-            for lineage_request in lineages or []:
-                yield lineage_request
+    def close(self):
+        if self._parser_pool is not None:
+            self._parser_pool.close()
+        if self._query_cache is not None:
+            self._query_cache.close()
+        super().close()
@@ -9,6 +9,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 """Mysql source module"""
+import traceback
+from typing import Optional, Set
+
+from sqlalchemy import sql
 from sqlalchemy.dialects.mysql.base import ischema_names
 from sqlalchemy.dialects.mysql.reflection import MySQLTableDefinitionParser
 
@@ -23,7 +27,18 @@ from metadata.generated.schema.metadataIngestion.workflow import (
 )
 from metadata.ingestion.api.source import InvalidSourceException
 from metadata.ingestion.source.database.common_db_source import CommonDbSourceService
-from metadata.ingestion.source.database.mysql.utils import col_type_map, parse_column
+from metadata.ingestion.source.database.mysql.queries import (
+    MYSQL_DISABLE_STATS_CACHE,
+    MYSQL_GET_CHANGED_TABLE_NAMES,
+)
+from metadata.ingestion.source.database.mysql.utils import (
+    MysqlSchemaReflector,
+    col_type_map,
+    parse_column,
+)
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
 
 ischema_names.update(col_type_map)
 
@@ -39,6 +54,8 @@ class MysqlSource(CommonDbSourceService):
     Database metadata from Mysql Source
     """
 
+    schema_reflector = MysqlSchemaReflector()
+
     @classmethod
     def create(cls, config_dict, metadata_config: OpenMetadataConnection):
         config: WorkflowSource = WorkflowSource.parse_obj(config_dict)
@@ -48,3 +65,19 @@ class MysqlSource(CommonDbSourceService):
                 f"Expected MysqlConnection, but got {connection}"
             )
         return cls(config, metadata_config)
+
+    def get_changed_table_names(self, schema_name: str) -> Optional[Set[str]]:
+        """
+        MySQL 8 caches the table timestamps in information_schema.
+        Ask for fresh ones, if the server supports it.
+        """
+        try:
+            self.connection.execute(MYSQL_DISABLE_STATS_CACHE)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            logger.debug(f"Could not disable the information_schema cache: {exc}")
+        result = self.connection.execute(
+            sql.text(MYSQL_GET_CHANGED_TABLE_NAMES),
+            {"schema": schema_name, "since": self.watermark.timestamp()},
+        )
+        return {row.table_name for row in result}
@@ -0,0 +1,83 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+SQL Queries used during ingestion
+"""
+
+import textwrap
+
+MYSQL_SCHEMA_COLUMNS = textwrap.dedent(
+    """
+    SELECT
+        TABLE_NAME AS table_name,
+        COLUMN_NAME AS column_name,
+        COLUMN_TYPE AS column_type,
+        IS_NULLABLE AS is_nullable,
+        COLUMN_DEFAULT AS column_default,
+        COLUMN_COMMENT AS column_comment,
+        EXTRA AS extra
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = :schema
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """
+)
+
+MYSQL_SCHEMA_CONSTRAINTS = textwrap.dedent(
+    """
+    SELECT
+        kcu.TABLE_NAME AS table_name,
+        kcu.CONSTRAINT_NAME AS constraint_name,
+        tc.CONSTRAINT_TYPE AS constraint_type,
+        kcu.COLUMN_NAME AS column_name,
+        kcu.REFERENCED_TABLE_SCHEMA AS referred_schema,
+        kcu.REFERENCED_TABLE_NAME AS referred_table,
+        kcu.REFERENCED_COLUMN_NAME AS referred_column
+    FROM information_schema.KEY_COLUMN_USAGE kcu
+    JOIN information_schema.TABLE_CONSTRAINTS tc
+        ON tc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA
+        AND tc.TABLE_NAME = kcu.TABLE_NAME
+        AND tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+    WHERE kcu.TABLE_SCHEMA = :schema
+    ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+    """
+)
+
+MYSQL_SCHEMA_TABLE_COMMENTS = textwrap.dedent(
+    """
+    SELECT TABLE_NAME AS table_name, TABLE_COMMENT AS table_comment
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = :schema
+    """
+)
+
+MYSQL_SCHEMA_VIEW_DEFINITIONS = textwrap.dedent(
+    """
+    SELECT TABLE_NAME AS view_name, VIEW_DEFINITION AS view_definition
+    FROM information_schema.VIEWS
+    WHERE TABLE_SCHEMA = :schema
+    """
+)
+
+# Views do not keep any timestamp, so they are always processed
+MYSQL_GET_CHANGED_TABLE_NAMES = textwrap.dedent(
+    """
+    SELECT TABLE_NAME AS table_name
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = :schema
+    AND (
+        TABLE_TYPE = 'VIEW'
+        OR UNIX_TIMESTAMP(CREATE_TIME) >= :since
+        OR UNIX_TIMESTAMP(UPDATE_TIME) >= :since
+    )
+    """
+)
+
+MYSQL_DISABLE_STATS_CACHE = "SET SESSION information_schema_stats_expiry = 0"
@@ -13,13 +13,27 @@
 MySQL SQLAlchemy Helper Methods
 """
 # pylint: disable=protected-access,too-many-branches,too-many-statements,too-many-locals
-from sqlalchemy import util
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import sql, util
 from sqlalchemy.dialects.mysql.enumerated import ENUM, SET
-from sqlalchemy.dialects.mysql.reflection import _strip_values
+from sqlalchemy.dialects.mysql.reflection import ReflectedState, _strip_values
 from sqlalchemy.dialects.mysql.types import DATETIME, TIME, TIMESTAMP
+from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.sql import sqltypes
 
 from metadata.ingestion.source.database.column_type_parser import create_sqlalchemy_type
+from metadata.ingestion.source.database.mysql.queries import (
+    MYSQL_SCHEMA_COLUMNS,
+    MYSQL_SCHEMA_CONSTRAINTS,
+    MYSQL_SCHEMA_TABLE_COMMENTS,
+    MYSQL_SCHEMA_VIEW_DEFINITIONS,
+)
+from metadata.ingestion.source.database.schema_reflection import (
+    SchemaReflector,
+    constraints_from_key_column_usage,
+)
 from metadata.utils.sqlalchemy_utils import get_display_datatype
 
 col_type_map = {
@@ -151,3 +165,65 @@ def parse_column(self, line, state):
     }
     col_d.update(col_kw)
     state.columns.append(col_d)
+
+
+class MysqlSchemaReflector(SchemaReflector):
+    """
+    Read the tables of a schema from information_schema instead
+    of running a SHOW CREATE TABLE for each of them.
+    """
+
+    def get_schema_columns(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, List[Dict]]]:
+        rows = inspector.bind.execute(
+            sql.text(MYSQL_SCHEMA_COLUMNS), {"schema": schema}
+        ).fetchall()
+        parser = inspector.dialect._tabledef_parser
+        columns = defaultdict(list)
+        for row in rows:
+            # Build the column line as in SHOW CREATE TABLE
+            # and let the dialect parse the type
+            name = row.column_name.replace("`", "``")
+            line = f"  `{name}` {row.column_type}"
+            if row.is_nullable == "NO":
+                line += " NOT NULL"
+            if "auto_increment" in (row.extra or "").lower():
+                line += " AUTO_INCREMENT"
+            state = ReflectedState()
+            parser._parse_column(line, state)
+            for column in state.columns:
+                column["default"] = row.column_default
+                column["comment"] = row.column_comment or None
+                columns[row.table_name].append(column)
+        return dict(columns)
+
+    def get_schema_constraints(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        rows = inspector.bind.execute(
+            sql.text(MYSQL_SCHEMA_CONSTRAINTS), {"schema": schema}
+        ).fetchall()
+        return constraints_from_key_column_usage(rows)
+
+    def get_schema_table_comments(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        rows = inspector.bind.execute(
+            sql.text(MYSQL_SCHEMA_TABLE_COMMENTS), {"schema": schema}
+        ).fetchall()
+        return {row.table_name: row.table_comment or None for row in rows}
+
+    def get_schema_view_definitions(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        rows = inspector.bind.execute(
+            sql.text(MYSQL_SCHEMA_VIEW_DEFINITIONS), {"schema": schema}
+        ).fetchall()
+        return {
+            row.view_name: (
+                f"CREATE VIEW `{schema}`.`{row.view_name}` AS {row.view_definition}"
+            )
+            for row in rows
+            if row.view_definition
+        }
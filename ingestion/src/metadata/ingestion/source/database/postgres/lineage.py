@@ -15,7 +15,6 @@ from typing import Iterable
 
 from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
 from metadata.ingestion.lineage.models import Dialect
-from metadata.ingestion.lineage.sql_lineage import get_lineage_by_query
 from metadata.ingestion.source.database.lineage_source import LineageSource
 from metadata.ingestion.source.database.postgres.queries import POSTGRES_SQL_STATEMENT
 from metadata.ingestion.source.database.postgres.query_parser import (
@@ -45,16 +44,11 @@ class PostgresLineageSource(PostgresQueryParserSource, LineageSource):
         Based on the query logs, prepare the lineage
         and send it to the sink
         """
-        for table_queries in self.get_table_query():
-            for table_query in table_queries.queries:
-                lineages = get_lineage_by_query(
-                    self.metadata,
-                    query=table_query.query,
-                    service_name=table_query.serviceName,
-                    database_name=table_query.databaseName,
-                    schema_name=table_query.databaseSchema,
-                    dialect=Dialect.POSTGRES,
-                )
-
-                for lineage_request in lineages or []:
-                    yield lineage_request
+        yield from self.yield_lineage(
+            (
+                table_query
+                for table_queries in self.get_table_query()
+                for table_query in table_queries.queries
+            ),
+            Dialect.POSTGRES,
+        )
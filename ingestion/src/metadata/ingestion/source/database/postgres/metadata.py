@@ -13,7 +13,7 @@ Postgres source module
 """
 import traceback
 from collections import namedtuple
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Set, Tuple
 
 from sqlalchemy import sql
 from sqlalchemy.dialects.postgresql.base import PGDialect, ischema_names
@@ -43,11 +43,14 @@ from metadata.ingestion.source.database.common_db_source import (
 )
 from metadata.ingestion.source.database.postgres.queries import (
     POSTGRES_GET_ALL_TABLE_PG_POLICY,
+    POSTGRES_GET_CHANGED_TABLE_NAMES,
     POSTGRES_GET_DB_NAMES,
     POSTGRES_GET_TABLE_NAMES,
+    POSTGRES_GET_TRACK_COMMIT_TIMESTAMP,
     POSTGRES_PARTITION_DETAILS,
 )
 from metadata.ingestion.source.database.postgres.utils import (
+    PostgresSchemaReflector,
     get_column_info,
     get_columns,
     get_table_comment,
@@ -118,6 +121,8 @@ class PostgresSource(CommonDbSourceService):
     Database metadata from Postgres Source
     """
 
+    schema_reflector = PostgresSchemaReflector()
+
     @classmethod
     def create(cls, config_dict, metadata_config: OpenMetadataConnection):
         config: WorkflowSource = WorkflowSource.parse_obj(config_dict)
@@ -147,6 +152,24 @@ class PostgresSource(CommonDbSourceService):
             for name, relkind in result
         ]
 
+    def get_changed_table_names(self, schema_name: str) -> Optional[Set[str]]:
+        """
+        Only available if the server runs with track_commit_timestamp
+        """
+        track_commit_timestamp = self.connection.execute(
+            POSTGRES_GET_TRACK_COMMIT_TIMESTAMP
+        ).scalar()
+        if track_commit_timestamp != "on":
+            logger.info(
+                "Enable track_commit_timestamp to only extract the changed tables"
+            )
+            return None
+        result = self.connection.execute(
+            sql.text(POSTGRES_GET_CHANGED_TABLE_NAMES),
+            {"schema": schema_name, "since": self.watermark.timestamp()},
+        )
+        return {row.table_name for row in result}
+
     def get_database_names(self) -> Iterable[str]:
         if not self.config.serviceConnection.__root__.config.ingestAllDatabases:
             configured_db = self.config.serviceConnection.__root__.config.database
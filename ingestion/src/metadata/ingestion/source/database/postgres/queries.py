@@ -186,3 +186,92 @@ POSTGRES_SQL_COLUMNS = """
 POSTGRES_GET_SERVER_VERSION = """
 show server_version
 """
+
+POSTGRES_SQL_SCHEMA_COLUMNS = """
+        SELECT c.relname as table_name,
+            a.attname,
+            pg_catalog.format_type(a.atttypid, a.atttypmod),
+            (
+            SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+            FROM pg_catalog.pg_attrdef d
+            WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+            AND a.atthasdef
+            ) AS DEFAULT,
+            a.attnotnull,
+            pgd.description as comment,
+            {generated},
+            {identity}
+        FROM pg_catalog.pg_attribute a
+        JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_catalog.pg_description pgd ON (
+            pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+        WHERE n.nspname = :schema
+        AND c.relkind IN ('r', 'p', 'f', 'v', 'm')
+        AND a.attnum > 0 AND NOT a.attisdropped
+        ORDER BY c.relname, a.attnum
+    """
+
+POSTGRES_SCHEMA_CONSTRAINTS = """
+    SELECT
+        c.relname AS table_name,
+        con.conname AS constraint_name,
+        CASE con.contype
+            WHEN 'p' THEN 'PRIMARY KEY'
+            WHEN 'u' THEN 'UNIQUE'
+            WHEN 'f' THEN 'FOREIGN KEY'
+        END AS constraint_type,
+        a.attname AS column_name,
+        rn.nspname AS referred_schema,
+        rc.relname AS referred_table,
+        ra.attname AS referred_column
+    FROM pg_catalog.pg_constraint con
+    JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, position)
+    JOIN pg_catalog.pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+    LEFT JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+    LEFT JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+    LEFT JOIN pg_catalog.pg_attribute ra
+        ON ra.attrelid = con.confrelid AND ra.attnum = con.confkey[k.position::int]
+    WHERE n.nspname = :schema
+    AND con.contype IN ('p', 'u', 'f')
+    ORDER BY c.relname, con.conname, k.position
+"""
+
+POSTGRES_GET_TRACK_COMMIT_TIMESTAMP = """
+show track_commit_timestamp
+"""
+
+# Postgres does not keep DDL timestamps. With track_commit_timestamp we can
+# still tell when the catalog rows describing each table were last written.
+POSTGRES_GET_CHANGED_TABLE_NAMES = """
+    SELECT c.relname AS table_name
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = :schema
+    AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+    AND (
+        extract(epoch FROM pg_catalog.pg_xact_commit_timestamp(c.xmin)) >= :since
+        OR EXISTS (
+            SELECT 1 FROM pg_catalog.pg_attribute a
+            WHERE a.attrelid = c.oid
+            AND extract(epoch FROM pg_catalog.pg_xact_commit_timestamp(a.xmin)) >= :since
+        )
+        OR EXISTS (
+            SELECT 1 FROM pg_catalog.pg_constraint con
+            WHERE con.conrelid = c.oid
+            AND extract(epoch FROM pg_catalog.pg_xact_commit_timestamp(con.xmin)) >= :since
+        )
+        OR EXISTS (
+            SELECT 1 FROM pg_catalog.pg_description d
+            WHERE d.objoid = c.oid
+            AND extract(epoch FROM pg_catalog.pg_xact_commit_timestamp(d.xmin)) >= :since
+        )
+        OR EXISTS (
+            SELECT 1 FROM pg_catalog.pg_rewrite r
+            WHERE r.ev_class = c.oid
+            AND extract(epoch FROM pg_catalog.pg_xact_commit_timestamp(r.xmin)) >= :since
+        )
+    )
+"""
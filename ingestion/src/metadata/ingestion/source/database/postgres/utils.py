@@ -14,19 +14,27 @@
 Postgres SQLAlchemy util methods
 """
 import re
-from typing import Dict, Tuple
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import sql, util
 from sqlalchemy.dialects.postgresql.base import ENUM
 from sqlalchemy.engine import reflection
+from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.sql import sqltypes
 
 from metadata.ingestion.source.database.postgres.queries import (
     POSTGRES_COL_IDENTITY,
+    POSTGRES_SCHEMA_CONSTRAINTS,
     POSTGRES_SQL_COLUMNS,
+    POSTGRES_SQL_SCHEMA_COLUMNS,
     POSTGRES_TABLE_COMMENTS,
     POSTGRES_VIEW_DEFINITIONS,
 )
+from metadata.ingestion.source.database.schema_reflection import (
+    SchemaReflector,
+    constraints_from_key_column_usage,
+)
 from metadata.utils.sqlalchemy_utils import (
     get_table_comment_wrapper,
     get_view_definition_wrapper,
@@ -63,16 +71,9 @@ def get_columns(  # pylint: disable=too-many-locals
         if self.server_version_info >= (12,)
         else "NULL as generated"
     )
-    if self.server_version_info >= (10,):
-        # a.attidentity != '' is required or it will reflect also
-        # serial columns as identity.
-        identity = POSTGRES_COL_IDENTITY
-    else:
-        identity = "NULL as identity_options"
-
     sql_col_query = POSTGRES_SQL_COLUMNS.format(
         generated=generated,
-        identity=identity,
+        identity=_get_identity_clause(self),
     )
     sql_col_query = (
         sql.text(sql_col_query)
@@ -82,16 +83,7 @@ def get_columns(  # pylint: disable=too-many-locals
     conn = connection.execute(sql_col_query, {"table_oid": table_oid})
     rows = conn.fetchall()
 
-    # dictionary with (name, ) if default search path or (schema, name)
-    # as keys
-    domains = self._load_domains(connection)
-
-    # dictionary with (name, ) if default search path or (schema, name)
-    # as keys
-    enums = dict(
-        ((rec["name"],), rec) if rec["visible"] else ((rec["schema"], rec["name"]), rec)
-        for rec in self._load_enums(connection, schema="*")
-    )
+    domains, enums = _load_domains_and_enums(self, connection)
 
     # format columns
     columns = []
@@ -123,6 +115,91 @@ def get_columns(  # pylint: disable=too-many-locals
     return columns
 
 
+def _get_identity_clause(dialect) -> str:
+    if dialect.server_version_info >= (10,):
+        # a.attidentity != '' is required or it will reflect also
+        # serial columns as identity.
+        return POSTGRES_COL_IDENTITY
+    return "NULL as identity_options"
+
+
+def _load_domains_and_enums(dialect, connection) -> Tuple[Dict, Dict]:
+    # dictionaries with (name, ) if default search path or (schema, name)
+    # as keys
+    domains = dialect._load_domains(connection)
+    enums = dict(
+        ((rec["name"],), rec) if rec["visible"] else ((rec["schema"], rec["name"]), rec)
+        for rec in dialect._load_enums(connection, schema="*")
+    )
+    return domains, enums
+
+
+class PostgresSchemaReflector(SchemaReflector):
+    """
+    Fetch the columns and constraints of all the tables in
+    a schema from the catalog. Table comments and view definitions
+    are already fetched for all the tables by the dialect.
+    """
+
+    def get_schema_columns(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, List[Dict]]]:
+        dialect = inspector.dialect
+        generated = (
+            "a.attgenerated as generated"
+            if dialect.server_version_info >= (12,)
+            else "NULL as generated"
+        )
+        sql_col_query = (
+            sql.text(
+                POSTGRES_SQL_SCHEMA_COLUMNS.format(
+                    generated=generated,
+                    identity=_get_identity_clause(dialect),
+                )
+            )
+            .bindparams(sql.bindparam("schema", type_=sqltypes.Unicode))
+            .columns(attname=sqltypes.Unicode, default=sqltypes.Unicode)
+        )
+        with inspector.bind.connect() as connection:
+            rows = connection.execute(sql_col_query, {"schema": schema}).fetchall()
+            domains, enums = _load_domains_and_enums(dialect, connection)
+
+        columns = defaultdict(list)
+        for (
+            table_name,
+            name,
+            format_type,
+            default_,
+            notnull,
+            comment,
+            generated,
+            identity,
+        ) in rows:
+            column_info = dialect._get_column_info(
+                name,
+                format_type,
+                default_,
+                notnull,
+                domains,
+                enums,
+                schema,
+                comment,
+                generated,
+                identity,
+            )
+            column_info["system_data_type"] = format_type
+            columns[table_name].append(column_info)
+        return dict(columns)
+
+    def get_schema_constraints(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        rows = inspector.bind.execute(
+            sql.text(POSTGRES_SCHEMA_CONSTRAINTS), {"schema": schema}
+        ).fetchall()
+        return constraints_from_key_column_usage(rows)
+
+
 def _get_numeric_args(charlen):
     if charlen:
         prec, scale = charlen.split(",")
@@ -0,0 +1,216 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Bulk reflection of a whole schema.
+
+Instead of running the inspector methods for each table, a
+SchemaReflector fetches the information of all the tables in
+a schema with a few queries. The SchemaInspector keeps the results
+and serves them with the same API as the SQLAlchemy Inspector.
+"""
+import traceback
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.engine.reflection import Inspector
+
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+EMPTY_PK_CONSTRAINT = {"constrained_columns": [], "name": None}
+
+
+class SchemaReflector:
+    """
+    Fetches the information of all the tables of a schema.
+
+    Each method returns a dict keyed by table name, or None if the
+    dialect does not support it. In that case, the SchemaInspector
+    falls back to the inspector methods for each table.
+    """
+
+    # pylint: disable=unused-argument
+
+    def get_schema_columns(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, List[Dict]]]:
+        return None
+
+    def get_schema_constraints(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Primary keys, unique constraints and foreign keys,
+        see `constraints_from_key_column_usage`
+        """
+        return None
+
+    def get_schema_table_comments(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        return None
+
+    def get_schema_view_definitions(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        return None
+
+
+def constraints_from_key_column_usage(rows) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the pk, unique and foreign constraints of a schema from rows with:
+    table_name, constraint_name, constraint_type, column_name,
+    referred_schema, referred_table, referred_column,
+    sorted by table, constraint and column position.
+    """
+    pk_constraints = {}
+    unique_constraints = defaultdict(list)
+    foreign_keys = defaultdict(list)
+    constraints = {}
+    for row in rows:
+        key = (row.table_name, row.constraint_name)
+        constraint = constraints.get(key)
+        if constraint is None:
+            if row.constraint_type == "PRIMARY KEY":
+                constraint = {"constrained_columns": [], "name": row.constraint_name}
+                pk_constraints[row.table_name] = constraint
+            elif row.constraint_type == "UNIQUE":
+                constraint = {"column_names": [], "name": row.constraint_name}
+                unique_constraints[row.table_name].append(constraint)
+            elif row.constraint_type == "FOREIGN KEY":
+                constraint = {
+                    "name": row.constraint_name,
+                    "constrained_columns": [],
+                    "referred_schema": row.referred_schema,
+                    "referred_table": row.referred_table,
+                    "referred_columns": [],
+                    "options": {},
+                }
+                foreign_keys[row.table_name].append(constraint)
+            else:
+                continue
+            constraints[key] = constraint
+
+        if "column_names" in constraint:
+            constraint["column_names"].append(row.column_name)
+        else:
+            constraint["constrained_columns"].append(row.column_name)
+        if "referred_columns" in constraint:
+            constraint["referred_columns"].append(row.referred_column)
+
+    return {
+        "pk_constraints": pk_constraints,
+        "unique_constraints": dict(unique_constraints),
+        "foreign_keys": dict(foreign_keys),
+    }
+
+
+class SchemaInspector:
+    """
+    Wraps an Inspector for a single schema. The table level methods
+    read from the information fetched by the SchemaReflector, which
+    runs once per schema and kind of information. Anything else, or
+    anything the reflector does not support, goes to the inspector.
+    """
+
+    def __init__(self, inspector: Inspector, schema: str, reflector: SchemaReflector):
+        self.inspector = inspector
+        self.schema = schema
+        self.reflector = reflector
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def __getattr__(self, item):
+        return getattr(self.inspector, item)
+
+    def _get_schema_info(
+        self, name: str, fetch_fn: Callable[[Inspector, str], Optional[Dict]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the schema information the first time it is needed.
+        Any error will make us fall back to the inspector.
+        """
+        if name not in self._cache:
+            try:
+                self._cache[name] = fetch_fn(self.inspector, self.schema)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Could not reflect {name} of schema [{self.schema}] in bulk, "
+                    f"falling back to reflect each table: {exc}"
+                )
+                self._cache[name] = None
+        return self._cache[name]
+
+    def _is_cached_schema(self, schema: Optional[str]) -> bool:
+        return schema is None or schema == self.schema
+
+    def get_columns(self, table_name: str, schema: Optional[str] = None, **kw):
+        columns = (
+            self._get_schema_info("columns", self.reflector.get_schema_columns)
+            if self._is_cached_schema(schema)
+            else None
+        )
+        if columns is not None and table_name in columns:
+            return columns[table_name]
+        return self.inspector.get_columns(table_name, schema, **kw)
+
+    def _get_constraints(self, kind: str, schema: Optional[str]):
+        constraints = (
+            self._get_schema_info("constraints", self.reflector.get_schema_constraints)
+            if self._is_cached_schema(schema)
+            else None
+        )
+        return constraints[kind] if constraints is not None else None
+
+    def get_pk_constraint(self, table_name: str, schema: Optional[str] = None, **kw):
+        pk_constraints = self._get_constraints("pk_constraints", schema)
+        if pk_constraints is not None:
+            return pk_constraints.get(table_name, EMPTY_PK_CONSTRAINT)
+        return self.inspector.get_pk_constraint(table_name, schema, **kw)
+
+    def get_unique_constraints(
+        self, table_name: str, schema: Optional[str] = None, **kw
+    ):
+        unique_constraints = self._get_constraints("unique_constraints", schema)
+        if unique_constraints is not None:
+            return unique_constraints.get(table_name, [])
+        return self.inspector.get_unique_constraints(table_name, schema, **kw)
+
+    def get_foreign_keys(self, table_name: str, schema: Optional[str] = None, **kw):
+        foreign_keys = self._get_constraints("foreign_keys", schema)
+        if foreign_keys is not None:
+            return foreign_keys.get(table_name, [])
+        return self.inspector.get_foreign_keys(table_name, schema, **kw)
+
+    def get_table_comment(self, table_name: str, schema: Optional[str] = None, **kw):
+        comments = (
+            self._get_schema_info(
+                "table comments", self.reflector.get_schema_table_comments
+            )
+            if self._is_cached_schema(schema)
+            else None
+        )
+        if comments is not None:
+            return {"text": comments.get(table_name)}
+        return self.inspector.get_table_comment(table_name, schema, **kw)
+
+    def get_view_definition(self, view_name: str, schema: Optional[str] = None, **kw):
+        view_definitions = (
+            self._get_schema_info(
+                "view definitions", self.reflector.get_schema_view_definitions
+            )
+            if self._is_cached_schema(schema)
+            else None
+        )
+        if view_definitions is not None and view_name in view_definitions:
+            return view_definitions[view_name]
+        return self.inspector.get_view_definition(view_name, schema, **kw)
@@ -13,7 +13,7 @@ Snowflake source module
 """
 import json
 import traceback
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
 
 import sqlparse
 from snowflake.sqlalchemy.custom_types import VARIANT
@@ -48,6 +48,7 @@ from metadata.ingestion.source.database.snowflake.constants import (
 )
 from metadata.ingestion.source.database.snowflake.queries import (
     SNOWFLAKE_FETCH_ALL_TAGS,
+    SNOWFLAKE_GET_CHANGED_TABLE_NAMES,
     SNOWFLAKE_GET_CLUSTER_KEY,
     SNOWFLAKE_GET_CURRENT_ACCOUNT,
     SNOWFLAKE_GET_CURRENT_REGION,
@@ -57,6 +58,7 @@ from metadata.ingestion.source.database.snowflake.queries import (
     SNOWFLAKE_SESSION_TAG_QUERY,
 )
 from metadata.ingestion.source.database.snowflake.utils import (
+    SnowflakeSchemaReflector,
     get_schema_columns,
     get_table_comment,
     get_table_names,
@@ -99,6 +101,8 @@ class SnowflakeSource(CommonDbSourceService):
     Database metadata from Snowflake Source
     """
 
+    schema_reflector = SnowflakeSchemaReflector()
+
     def __init__(self, config, metadata_config):
         super().__init__(config, metadata_config)
         self.partition_details = {}
@@ -337,6 +341,14 @@ class SnowflakeSource(CommonDbSourceService):
 
         return regular_tables + external_tables
 
+    def get_changed_table_names(self, schema_name: str) -> Optional[Set[str]]:
+        cursor = self.connection.execute(
+            SNOWFLAKE_GET_CHANGED_TABLE_NAMES.format(
+                schema=schema_name, since=int(self.watermark.timestamp())
+            )
+        )
+        return {self.inspector.dialect.normalize_name(row[0]) for row in cursor}
+
     def _get_current_region(self) -> Optional[str]:
         try:
             res = self.engine.execute(SNOWFLAKE_GET_CURRENT_REGION).one()
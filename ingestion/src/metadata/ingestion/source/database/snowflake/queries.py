@@ -67,6 +67,12 @@ select TABLE_NAME from information_schema.tables
 where TABLE_SCHEMA = '{}' and TABLE_TYPE = 'VIEW'
 """
 
+SNOWFLAKE_GET_CHANGED_TABLE_NAMES = """
+select TABLE_NAME from information_schema.tables
+where TABLE_SCHEMA = '{schema}'
+and LAST_ALTERED >= TO_TIMESTAMP_LTZ({since})
+"""
+
 SNOWFLAKE_GET_COMMENTS = textwrap.dedent(
     """
   select
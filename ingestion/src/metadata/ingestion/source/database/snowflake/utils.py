@@ -12,11 +12,13 @@
 """
 Module to define overriden dialect methods
 """
+from typing import Dict, Optional
 
 import sqlalchemy.types as sqltypes
 from sqlalchemy import exc as sa_exc
 from sqlalchemy import util as sa_util
 from sqlalchemy.engine import reflection
+from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.sql import text
 from sqlalchemy.types import FLOAT
 
@@ -28,6 +30,7 @@ from metadata.ingestion.source.database.snowflake.queries import (
     SNOWFLAKE_GET_VIEW_NAMES,
     SNOWFLAKE_GET_WITHOUT_TRANSIENT_TABLE_NAMES,
 )
+from metadata.ingestion.source.database.schema_reflection import SchemaReflector
 from metadata.utils.sqlalchemy_utils import (
     get_display_datatype,
     get_table_comment_wrapper,
@@ -109,6 +112,26 @@ def get_view_definition(  # pylint: disable=unused-argument
     return None
 
 
+class SnowflakeSchemaReflector(SchemaReflector):
+    """
+    Columns and constraints are already reflected by schema in the
+    dialect, but the view definitions run a SHOW VIEWS for each view.
+    """
+
+    def get_schema_view_definitions(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        cursor = inspector.bind.execute(
+            f"SHOW /* sqlalchemy:get_view_definition */ VIEWS IN {schema}"
+        )
+        # pylint: disable=protected-access
+        n2i = inspector.dialect.__class__._map_name_to_idx(cursor)
+        return {
+            inspector.dialect.normalize_name(row[n2i["name"]]): row[n2i["text"]]
+            for row in cursor
+        }
+
+
 @reflection.cache
 def get_table_comment(
     self, connection, table_name, schema=None, **kw
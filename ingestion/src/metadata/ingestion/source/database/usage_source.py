@@ -19,6 +19,7 @@ from typing import Iterable, Optional
 
 from metadata.generated.schema.type.tableQuery import TableQueries, TableQuery
 from metadata.ingestion.source.database.query_parser_source import QueryParserSource
+from metadata.utils.helpers import batched
 from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
@@ -31,43 +32,50 @@ class UsageSource(QueryParserSource, ABC):
     Parse a query log to extract a `TableQuery` object
     """
 
-    def yield_table_queries_from_logs(self) -> Optional[Iterable[TableQuery]]:
+    def yield_table_queries_from_logs(self) -> Optional[Iterable[TableQueries]]:
         """
-        Method to handle the usage from query logs
+        Method to handle the usage from query logs.
+        The file is read in batches of `queryBatchSize` queries.
         """
         try:
-            query_list = []
             with open(
                 self.config.sourceConfig.config.queryLogFilePath, "r", encoding="utf-8"
             ) as fin:
-                for record in csv.DictReader(fin):
-                    query_dict = dict(record)
-                    analysis_date = (
-                        datetime.utcnow()
-                        if not query_dict.get("start_time")
-                        else datetime.strptime(
-                            query_dict.get("start_time"), "%Y-%m-%d %H:%M:%S.%f"
-                        )
-                    )
-                    query_list.append(
-                        TableQuery(
-                            query=query_dict["query_text"],
-                            userName=query_dict.get("user_name", ""),
-                            startTime=query_dict.get("start_time", ""),
-                            endTime=query_dict.get("end_time", ""),
-                            duration=query_dict.get("duration"),
-                            analysisDate=analysis_date,
-                            aborted=self.get_aborted_status(query_dict),
-                            databaseName=self.get_database_name(query_dict),
-                            serviceName=self.config.serviceName,
-                            databaseSchema=self.get_schema_name(query_dict),
-                        )
+                for records in batched(
+                    csv.DictReader(fin), self.source_config.queryBatchSize
+                ):
+                    yield TableQueries(
+                        queries=[
+                            self.get_table_query_from_log(dict(record))
+                            for record in records
+                        ]
                     )
-            yield TableQueries(queries=query_list)
         except Exception as err:
             logger.debug(traceback.format_exc())
             logger.warning(f"Failed to read queries form log file due to: {err}")
 
+    def get_table_query_from_log(self, query_dict: dict) -> TableQuery:
+        """
+        Build the TableQuery of a query log file row
+        """
+        analysis_date = (
+            datetime.utcnow()
+            if not query_dict.get("start_time")
+            else datetime.strptime(query_dict.get("start_time"), "%Y-%m-%d %H:%M:%S.%f")
+        )
+        return TableQuery(
+            query=query_dict["query_text"],
+            userName=query_dict.get("user_name", ""),
+            startTime=query_dict.get("start_time", ""),
+            endTime=query_dict.get("end_time", ""),
+            duration=query_dict.get("duration"),
+            analysisDate=analysis_date,
+            aborted=self.get_aborted_status(query_dict),
+            databaseName=self.get_database_name(query_dict),
+            serviceName=self.config.serviceName,
+            databaseSchema=self.get_schema_name(query_dict),
+        )
+
     def get_table_query(self) -> Optional[Iterable[TableQuery]]:
         """
         If queryLogFilePath available in config iterate through log file
@@ -81,7 +89,9 @@ class UsageSource(QueryParserSource, ABC):
     def yield_table_queries(self):
         """
         Given an Engine, iterate over the day range and
-        query the results
+        query the results.
+        Results are streamed from a server side cursor, when the
+        dialect supports it, in batches of `queryBatchSize` queries.
         """
         daydiff = self.end - self.start
         for days in range(daydiff.days):
@@ -91,40 +101,45 @@ class UsageSource(QueryParserSource, ABC):
             )
             try:
                 with self.engine.connect() as conn:
-                    rows = conn.execute(
+                    rows = conn.execution_options(stream_results=True).execute(
                         self.get_sql_statement(
                             start_time=self.start + timedelta(days=days),
                             end_time=self.start + timedelta(days=days + 1),
                         )
                     )
-                    queries = []
-                    for row in rows:
-                        row = dict(row)
-                        try:
-                            queries.append(
-                                TableQuery(
-                                    query=row["query_text"],
-                                    userName=row["user_name"],
-                                    startTime=str(row["start_time"]),
-                                    endTime=str(row["end_time"]),
-                                    analysisDate=row["start_time"],
-                                    aborted=self.get_aborted_status(row),
-                                    databaseName=self.get_database_name(row),
-                                    duration=row.get("duration"),
-                                    serviceName=self.config.serviceName,
-                                    databaseSchema=self.get_schema_name(row),
-                                )
-                            )
-                        except Exception as exc:
-                            logger.debug(traceback.format_exc())
-                            logger.warning(
-                                f"Unexpected exception processing row [{row}]: {exc}"
-                            )
-                yield TableQueries(queries=queries)
+                    for batch in batched(rows, self.source_config.queryBatchSize):
+                        queries = []
+                        for row in batch:
+                            table_query = self.get_table_query_from_row(dict(row))
+                            if table_query:
+                                queries.append(table_query)
+                        yield TableQueries(queries=queries)
             except Exception as exc:
                 logger.debug(traceback.format_exc())
                 logger.error(f"Source usage processing error: {exc}")
 
+    def get_table_query_from_row(self, row: dict) -> Optional[TableQuery]:
+        """
+        Build the TableQuery of a query log result row
+        """
+        try:
+            return TableQuery(
+                query=row["query_text"],
+                userName=row["user_name"],
+                startTime=str(row["start_time"]),
+                endTime=str(row["end_time"]),
+                analysisDate=row["start_time"],
+                aborted=self.get_aborted_status(row),
+                databaseName=self.get_database_name(row),
+                duration=row.get("duration"),
+                serviceName=self.config.serviceName,
+                databaseSchema=self.get_schema_name(row),
+            )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Unexpected exception processing row [{row}]: {exc}")
+        return None
+
     def next_record(self) -> Iterable[TableQuery]:
         for table_queries in self.get_table_query():
             if table_queries:
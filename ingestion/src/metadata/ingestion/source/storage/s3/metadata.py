@@ -53,6 +53,7 @@ from metadata.ingestion.source.storage.s3.models import (
     S3ContainerDetails,
 )
 from metadata.ingestion.source.storage.storage_service import StorageServiceSource
+from metadata.utils.datalake.common import SCHEMA_SAMPLE_ROWS
 from metadata.utils.datalake.datalake_utils import fetch_dataframe
 from metadata.utils.filters import filter_by_container
 from metadata.utils.logger import ingestion_logger
@@ -211,12 +212,13 @@ class S3Source(StorageServiceSource):
                 key=sample_key, bucket_name=bucket_name
             ),
             connection_kwargs=connection_args,
+            nrows=SCHEMA_SAMPLE_ROWS,
         )
         columns = []
         if isinstance(data_structure_details, DataFrame):
             columns = DatalakeSource.get_columns(data_structure_details)
-        if isinstance(data_structure_details, list) and data_structure_details:
-            columns = DatalakeSource.get_columns(data_structure_details[0])
+        elif data_structure_details:
+            columns = DatalakeSource.get_columns(next(iter(data_structure_details)))
         return columns
 
     def fetch_buckets(self) -> List[S3BucketResponse]:
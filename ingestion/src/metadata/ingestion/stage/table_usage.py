@@ -13,11 +13,11 @@ Given query data about tables, store the results
 in a temporary file (i.e., the stage)
 to be further processed by the BulkSink.
 """
-import json
 import os
 import shutil
 import traceback
 from pathlib import Path
+from typing import Dict, List, Optional, TextIO
 
 from metadata.config.common import ConfigModel
 from metadata.generated.schema.api.data.createQuery import CreateQueryRequest
@@ -27,7 +27,7 @@ from metadata.generated.schema.entity.services.connections.metadata.openMetadata
 from metadata.generated.schema.entity.teams.user import User
 from metadata.generated.schema.type.queryParserData import QueryParserData
 from metadata.generated.schema.type.tableUsageCount import TableUsageCount
-from metadata.ingestion.api.stage import Stage
+from metadata.ingestion.api.stage import Stage, StageStatus
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils.constants import UTF_8
 from metadata.utils.logger import ingestion_logger
@@ -39,6 +39,11 @@ class TableStageConfig(ConfigModel):
     filename: str
 
 
+class TableUsageStageStatus(StageStatus):
+    user_cache_hits: int = 0
+    user_cache_misses: int = 0
+
+
 class TableUsageStage(Stage[QueryParserData]):
     """
     Stage implementation for Table Usage data.
@@ -48,6 +53,7 @@ class TableUsageStage(Stage[QueryParserData]):
     """
 
     config: TableStageConfig
+    status: TableUsageStageStatus
 
     def __init__(
         self,
@@ -55,11 +61,16 @@ class TableUsageStage(Stage[QueryParserData]):
         metadata_config: OpenMetadataConnection,
     ):
         super().__init__()
+        self.status = TableUsageStageStatus()
         self.config = config
         self.metadata_config = metadata_config
         self.metadata = OpenMetadata(self.metadata_config)
         self.table_usage = {}
         self.table_queries = {}
+        # User FQNs by user name, None for names not found in OpenMetadata
+        self.users: Dict[str, Optional[str]] = {}
+        # Files of the stage by name, open until the stage is closed
+        self.files: Dict[str, TextIO] = {}
 
         self.init_location()
 
@@ -81,32 +92,31 @@ class TableUsageStage(Stage[QueryParserData]):
         logger.info(f"Creating the directory to store staging data in {location}")
         location.mkdir(parents=True, exist_ok=True)
 
-    def _get_user_entity(self, username: str):
-        if username:
+    def _get_user_entity(self, username: str) -> List[str]:
+        """
+        FQN of the query user. A handful of users run most of the
+        queries, so each name is only looked up once, found or not.
+        """
+        if not username:
+            return []
+        if username in self.users:
+            self.status.user_cache_hits += 1
+        else:
+            self.status.user_cache_misses += 1
             user = self.metadata.get_by_name(entity=User, fqn=username)
-            if user:
-                return [user.fullyQualifiedName.__root__]
-        return []
+            self.users[username] = user.fullyQualifiedName.__root__ if user else None
+        user_fqn = self.users[username]
+        return [user_fqn] if user_fqn else []
 
     def _add_sql_query(self, record, table):
-        if self.table_queries.get((table, record.date)):
-            self.table_queries[(table, record.date)].append(
-                CreateQueryRequest(
-                    query=record.sql,
-                    users=self._get_user_entity(record.userName),
-                    queryDate=record.date,
-                    duration=record.duration,
-                )
+        self.table_queries.setdefault((table, record.date), []).append(
+            CreateQueryRequest(
+                query=record.sql,
+                users=self._get_user_entity(record.userName),
+                queryDate=record.date,
+                duration=record.duration,
             )
-        else:
-            self.table_queries[(table, record.date)] = [
-                CreateQueryRequest(
-                    query=record.sql,
-                    users=self._get_user_entity(record.userName),
-                    queryDate=record.date,
-                    duration=record.duration,
-                )
-            ]
+        )
 
     def stage_record(self, record: QueryParserData) -> None:
         """
@@ -150,20 +160,35 @@ class TableUsageStage(Stage[QueryParserData]):
                 logger.info(f"Successfully record staged for {table}")
         self.dump_data_to_file()
 
+    def get_file(self, filename: str) -> TextIO:
+        """
+        Open the staging file the first time it is used,
+        and keep appending to it afterwards
+        """
+        file = self.files.get(filename)
+        if file is None:
+            file = open(  # pylint: disable=consider-using-with
+                os.path.join(self.config.filename, filename), "a+", encoding=UTF_8
+            )
+            self.files[filename] = file
+        return file
+
     def dump_data_to_file(self):
         for key, value in self.table_usage.items():
             if value:
                 value.sqlQueries = self.table_queries.get(key, [])
-                data = value.json()
-                with open(
-                    os.path.join(self.config.filename, f"{value.serviceName}_{key[1]}"),
-                    "a+",
-                    encoding=UTF_8,
-                ) as file:
-                    file.write(json.dumps(data))
-                    file.write("\n")
+                file = self.get_file(f"{value.serviceName}_{key[1]}")
+                file.write(value.json())
+                file.write("\n")
 
     def close(self) -> None:
         """
-        Nothing to close. Data is being dumped inside a context manager
+        Close the staging files so that the data is ready for the bulk sink
         """
+        logger.info(
+            f"Resolved {len(self.users)} query users with"
+            f" {self.status.user_cache_hits} cache hits"
+        )
+        for file in self.files.values():
+            file.close()
+        self.files = {}
@@ -13,9 +13,8 @@
 Interfaces with database for all database engine
 supporting sqlalchemy abstraction layer
 """
-import math
 import random
-from typing import cast
+from typing import List, Optional, cast
 
 from metadata.data_quality.validations.table.pandas.tableRowInsertedCountToBeBetween import (
     TableRowInsertedCountToBeBetweenValidator,
@@ -28,6 +27,7 @@ from metadata.generated.schema.entity.data.table import (
 from metadata.ingestion.source.database.datalake.models import (
     DatalakeTableSchemaWrapper,
 )
+from metadata.profiler.metrics.accumulator import DataFrameChunks
 from metadata.utils.datalake.datalake_utils import fetch_dataframe
 from metadata.utils.logger import test_suite_logger
 
@@ -41,7 +41,7 @@ class PandasInterfaceMixin:
         """Get partitioned dataframe
 
         Returns:
-            DataFrame
+            DataFrameChunks, filtered as the chunks are read
         """
         self.table_partition_config = cast(
             PartitionProfilerConfig, self.table_partition_config
@@ -51,81 +51,90 @@ class PandasInterfaceMixin:
             self.table_partition_config.partitionIntervalType
             == PartitionIntervalType.COLUMN_VALUE
         ):
-            return [
-                df[
+
+            def partition(df):
+                return df[
                     df[partition_field].isin(
                         self.table_partition_config.partitionValues
                     )
                 ]
-                for df in dfs
-            ]
-        if (
+
+        elif (
             self.table_partition_config.partitionIntervalType
             == PartitionIntervalType.INTEGER_RANGE
         ):
-            return [
-                df[
+
+            def partition(df):
+                return df[
                     df[partition_field].between(
                         self.table_partition_config.partitionIntegerRangeStart,
                         self.table_partition_config.partitionIntegerRangeEnd,
                     )
                 ]
-                for df in dfs
-            ]
-        return [
-            df[
-                df[partition_field]
-                >= TableRowInsertedCountToBeBetweenValidator._get_threshold_date(  # pylint: disable=protected-access
-                    self.table_partition_config.partitionIntervalUnit.value,
-                    self.table_partition_config.partitionInterval,
-                )
-            ]
-            for df in dfs
-        ]
+
+        else:
+            validator = TableRowInsertedCountToBeBetweenValidator
+            # pylint: disable=protected-access
+            threshold_date = validator._get_threshold_date(
+                self.table_partition_config.partitionIntervalUnit.value,
+                self.table_partition_config.partitionInterval,
+            )
+
+            def partition(df):
+                return df[df[partition_field] >= threshold_date]
+
+        return DataFrameChunks(lambda: (partition(df) for df in dfs))
+
+    @staticmethod
+    def _get_file_columns(table) -> Optional[List[str]]:
+        """
+        Names of the table columns in the file. Long names are truncated
+        in the column name but kept as they are in the display name.
+        """
+        columns = []
+        for column in table.columns:
+            columns.append(column.name.__root__)
+            if column.displayName:
+                columns.append(column.displayName)
+        return columns or None
 
     def return_ometa_dataframes_sampled(
         self, service_connection_config, client, table, profile_sample_config
     ):
         """
         returns sampled ometa dataframes
+
+        Only the columns of the table are read, and the samples are
+        taken while reading the file, so that the whole file never
+        needs to fit in memory. The file is read again on each pass
+        over the chunks, with the same seed to sample the same rows.
         """
         connection_args = service_connection_config.configSource.securityConfig
-        data = fetch_dataframe(
-            config_source=service_connection_config.configSource,
-            client=client,
-            file_fqn=DatalakeTableSchemaWrapper(
-                key=table.name.__root__, bucket_name=table.databaseSchema.name
-            ),
-            is_profiler=True,
-            connection_kwargs=connection_args,
+        sample_fraction, sample_rows = None, None
+        if getattr(profile_sample_config, "profile_sample", None):
+            if (
+                profile_sample_config.profile_sample_type
+                == ProfileSampleType.PERCENTAGE
+            ):
+                sample_fraction = profile_sample_config.profile_sample / 100
+            elif profile_sample_config.profile_sample_type == ProfileSampleType.ROWS:
+                sample_rows = int(profile_sample_config.profile_sample)
+        seed = random.randrange(2**32)
+        data = DataFrameChunks(
+            lambda: fetch_dataframe(
+                config_source=service_connection_config.configSource,
+                client=client,
+                file_fqn=DatalakeTableSchemaWrapper(
+                    key=table.name.__root__, bucket_name=table.databaseSchema.name
+                ),
+                is_profiler=True,
+                connection_kwargs=connection_args,
+                columns=self._get_file_columns(table),
+                sample_fraction=sample_fraction,
+                sample_rows=sample_rows,
+                seed=seed,
+            )
         )
         if data:
-            random.shuffle(data)
-            # sampling data based on profiler config (if any)
-            if hasattr(profile_sample_config, "profile_sample"):
-                if (
-                    profile_sample_config.profile_sample_type
-                    == ProfileSampleType.PERCENTAGE
-                ):
-                    return [
-                        df.sample(
-                            frac=profile_sample_config.profile_sample / 100,
-                            random_state=random.randint(0, 100),
-                            replace=True,
-                        )
-                        for df in data
-                    ]
-                if profile_sample_config.profile_sample_type == ProfileSampleType.ROWS:
-                    sample_rows_per_chunk: int = math.floor(
-                        profile_sample_config.profile_sample / len(data)
-                    )
-                    return [
-                        df.sample(
-                            n=sample_rows_per_chunk,
-                            random_state=random.randint(0, 100),
-                            replace=True,
-                        )
-                        for df in data
-                    ]
             return data
         raise TypeError(f"Couldn't fetch {table.name.__root__}")
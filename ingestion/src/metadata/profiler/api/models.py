@@ -48,6 +48,7 @@ class TableConfig(ConfigModel):
     profileQuery: Optional[str] = None
     partitionConfig: Optional[PartitionProfilerConfig]
     columnConfig: Optional[ColumnConfig]
+    approximateMetrics: Optional[bool] = None
 
 
 class ProfileSampleConfig(ConfigModel):
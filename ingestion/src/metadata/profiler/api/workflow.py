@@ -16,8 +16,13 @@ Workflow definition for the ORM Profiler.
 - How to specify the entities to run
 - How to define metrics & tests
 """
+import threading
+import time
 import traceback
-from typing import Iterable, Optional, cast
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterable, Optional, Set, cast
 
 from pydantic import ValidationError
 
@@ -52,6 +57,7 @@ from metadata.ingestion.ometa.client_utils import create_ometa_client
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.ingestion.source.connections import get_connection, get_test_connection_fn
 from metadata.profiler.api.models import ProfilerProcessorConfig, ProfilerResponse
+from metadata.profiler.metrics.system.system import clear_system_metrics_cache
 from metadata.profiler.processor.core import Profiler
 from metadata.profiler.source.base_profiler_source import BaseProfilerSource
 from metadata.profiler.source.profiler_source_factory import profiler_source_factory
@@ -62,6 +68,7 @@ from metadata.utils.class_helper import (
     get_service_class_from_service_type,
     get_service_type_from_source_type,
 )
+from metadata.utils.custom_thread_pool import CustomThreadPoolExecutor
 from metadata.utils.filters import filter_by_database, filter_by_schema, filter_by_table
 from metadata.utils.importer import get_sink
 from metadata.utils.logger import profiler_logger
@@ -269,6 +276,9 @@ class ProfilerWorkflow(WorkflowStatusMixin):
         profiler_runner: Profiler = profiler_source.get_profiler_runner(
             entity, self.profiler_config
         )
+        # Tables can be profiled concurrently from the same profiler source,
+        # so we don't rely on `profiler_source.interface`
+        interface = profiler_runner.profiler_interface
 
         try:
             profile: ProfilerResponse = profiler_runner.process(
@@ -281,24 +291,113 @@ class ProfilerWorkflow(WorkflowStatusMixin):
             logger.debug(traceback.format_exc())
             logger.error(error)
             self.source_status.failed(name, error, traceback.format_exc())
-            self.source_status.fail_all(
-                profiler_source.interface.processor_status.failures
-            )
-            self.source_status.records.extend(
-                profiler_source.interface.processor_status.records
-            )
+            self.source_status.fail_all(interface.processor_status.failures)
+            self.source_status.records.extend(interface.processor_status.records)
         else:
-            # at this point we know we have an interface variable since we the `try` block above didn't raise
-            self.source_status.fail_all(profiler_source.interface.processor_status.failures)  # type: ignore
-            self.source_status.records.extend(
-                profiler_source.interface.processor_status.records  # type: ignore
-            )
+            self.source_status.fail_all(interface.processor_status.failures)
+            self.source_status.records.extend(interface.processor_status.records)
             return profile
         finally:
             profiler_runner.close()
 
         return None
 
+    def get_table_threads(self) -> int:
+        """
+        Number of tables to profile at the same time. Each table opens
+        up to `threadCount` connections, plus the one of its interface.
+        """
+        threads = self.source_config.tableThreadCount or 1
+        if self.source_config.maxConnections:
+            connections_per_table = int(self.source_config.threadCount or 1) + 1
+            threads = min(
+                threads,
+                max(self.source_config.maxConnections // connections_per_table, 1),
+            )
+        return threads
+
+    def profile_entities(
+        self,
+        entities: Iterable[Table],
+        create_profiler_source: Callable[[], BaseProfilerSource],
+    ) -> Iterable[ProfilerResponse]:
+        """
+        Profile the tables and yield their profiles as they are ready.
+
+        With more than one table thread, the tables are profiled in a pool
+        and the profiles are handed over as soon as each table is done,
+        so that the sink writes them while the pool keeps profiling.
+        The entities are pulled lazily from the generator.
+
+        Profiler sources are not thread safe, e.g., they reflect the
+        tables in their own sqlalchemy MetaData, so each thread of the
+        pool creates its own.
+        """
+        threads = self.get_table_threads()
+        if threads <= 1:
+            profiler_source = create_profiler_source()
+            for entity in entities:
+                profile = self.run_profiler(entity, profiler_source)
+                if profile:
+                    yield profile
+            return
+
+        entities = iter(entities)
+        started: Dict[str, float] = {}
+        timed_out: Set[str] = set()
+        thread_sources = threading.local()
+
+        def _run_profiler(entity: Table) -> Optional[ProfilerResponse]:
+            started[entity.fullyQualifiedName.__root__] = time.monotonic()
+            if not hasattr(thread_sources, "profiler_source"):
+                thread_sources.profiler_source = create_profiler_source()
+            return self.run_profiler(entity, thread_sources.profiler_source)
+
+        pool = CustomThreadPoolExecutor(max_workers=threads)
+        futures: Dict[Future, str] = {}
+        try:
+            while True:
+                # Only queue a few tables ahead of the pool
+                for entity in islice(entities, 2 * threads - len(futures)):
+                    future = pool.submit(_run_profiler, entity)
+                    futures[future] = entity.fullyQualifiedName.__root__
+                if not futures:
+                    break
+
+                done, _ = wait(futures, timeout=1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    started.pop(name, None)
+                    profile = future.result()
+                    if profile and name not in timed_out:
+                        yield profile
+
+                for name in self._get_timed_out_tables(started, timed_out):
+                    timed_out.add(name)
+                    futures = {
+                        future: table
+                        for future, table in futures.items()
+                        if table != name
+                    }
+        finally:
+            # Tables that timed out can't be interrupted, don't wait for them
+            pool.shutdown39(wait=False, cancel_futures=True)
+
+    def _get_timed_out_tables(
+        self, started: Dict[str, float], timed_out: Set[str]
+    ) -> Iterable[str]:
+        """Mark as failed the tables running for longer than the table timeout"""
+        timeout = self.source_config.tableTimeoutSeconds
+        if not timeout:
+            return
+        now = time.monotonic()
+        for name, start in started.copy().items():
+            if name not in timed_out and now - start > timeout:
+                error = f"Profiling table [{name}] timed out after {timeout} seconds"
+                logger.error(error)
+                self.source_status.failed(name, error)
+                yield name
+
     def execute(self):
         """
         Run the profiling and tests
@@ -307,15 +406,17 @@ class ProfilerWorkflow(WorkflowStatusMixin):
 
         try:
             for database in self.get_database_entities():
-                profiler_source = profiler_source_factory.create(
-                    self.config.source.type.lower(),
-                    self.config,
-                    database,
-                    self.metadata,
-                )
-                for entity in self.get_table_entities(database=database):
-                    profile = self.run_profiler(entity, profiler_source)
-                    if hasattr(self, "sink") and profile:
+                for profile in self.profile_entities(
+                    self.get_table_entities(database=database),
+                    partial(
+                        profiler_source_factory.create,
+                        self.config.source.type.lower(),
+                        self.config,
+                        database,
+                        self.metadata,
+                    ),
+                ):
+                    if hasattr(self, "sink"):
                         self.sink.write_record(profile)
             # At the end of the `execute`, update the associated Ingestion Pipeline status as success
             self.update_ingestion_status_at_end()
@@ -395,6 +496,8 @@ class ProfilerWorkflow(WorkflowStatusMixin):
         """
         self.metadata.close()
         self.timer.stop()
+        # The DML history of the schemas is only valid for this run
+        clear_system_metrics_cache()
 
     def _retrieve_service_connection_if_needed(self) -> None:
         """
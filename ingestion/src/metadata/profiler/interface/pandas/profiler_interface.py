@@ -32,6 +32,7 @@ from metadata.ingestion.source.connections import get_connection
 from metadata.ingestion.source.database.datalake.metadata import DatalakeSource
 from metadata.mixins.pandas.pandas_mixin import PandasInterfaceMixin
 from metadata.profiler.interface.profiler_protocol import ProfilerProtocol
+from metadata.profiler.metrics.accumulator import DataFrameChunks
 from metadata.profiler.metrics.core import MetricTypes
 from metadata.profiler.metrics.registry import Metrics
 from metadata.profiler.processor.pandas.sampler import DatalakeSampler
@@ -89,6 +90,9 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         )
         if self.dfs and self.table_partition_config:
             self.dfs = self.get_partitioned_df(self.dfs)
+        # Summarize the columns in a single pass shared by all the metrics
+        if not isinstance(self.dfs, DataFrameChunks):
+            self.dfs = DataFrameChunks(self.dfs or [])
 
     @valuedispatch
     def _get_metrics(self, *args, **kwargs):
@@ -114,13 +118,10 @@ class PandasProfilerInterface(ProfilerProtocol, PandasInterfaceMixin):
         Returns:
             dictionnary of results
         """
-        import pandas as pd  # pylint: disable=import-outside-toplevel
-
         try:
             row_dict = {}
-            df_list = [df.where(pd.notnull(df), None) for df in self.dfs]
             for metric in metrics:
-                row_dict[metric.name()] = metric().df_fn(df_list)
+                row_dict[metric.name()] = metric().df_fn(self.dfs)
             return row_dict
         except Exception as exc:
             logger.debug(traceback.format_exc())
@@ -15,7 +15,7 @@ supporting sqlalchemy abstraction layer
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Union
+from typing import Dict, FrozenSet, Optional, Union
 
 from sqlalchemy import Column
 from typing_extensions import Self
@@ -43,6 +43,8 @@ class ProfilerProtocol(ABC):
 
     _profiler_type: Optional[str] = None
     subclasses = {}
+    # Names of the metrics computed with approximate functions
+    approximate_metrics: FrozenSet[str] = frozenset()
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Hook to map subclass objects to profiler type"""
@@ -106,9 +108,34 @@ class ProfilerProtocol(ABC):
             sample_query=sample_query,
             table_partition_config=table_partition_config,
             timeout_seconds=timeout_seconds,
+            approximate_metrics=cls.get_approximate_metrics(
+                entity_config, source_config
+            ),
             **kwargs,
         )
 
+    @staticmethod
+    def get_approximate_metrics(
+        entity_config: Optional[TableConfig],
+        source_config: DatabaseServiceProfilerPipeline,
+    ) -> bool:
+        """Whether distinct counts and quantiles can be approximated.
+        The table config takes precedence over the global one.
+
+        Args:
+            entity_config (Optional[TableConfig]): table config object from yaml/json file
+            source_config (DatabaseServiceProfilerPipeline): source config object
+        Returns:
+            bool
+        """
+        if entity_config and entity_config.approximateMetrics is not None:
+            return entity_config.approximateMetrics
+
+        try:
+            return bool(source_config.approximateMetrics)
+        except AttributeError:
+            return False
+
     @staticmethod
     def get_profile_sample_config(
         entity: Table,
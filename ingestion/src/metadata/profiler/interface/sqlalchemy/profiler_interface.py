@@ -19,11 +19,14 @@ import threading
 import traceback
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
-from sqlalchemy import Column
+from sqlalchemy import Column, MetaData, Table, inspect, select
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import ProgrammingError
-from sqlalchemy.orm import scoped_session
+from sqlalchemy.orm import aliased, scoped_session
+from sqlalchemy.orm.util import AliasedClass
+from sqlalchemy.sql.elements import Label
 
 from metadata.generated.schema.entity.data.table import TableData
 from metadata.generated.schema.entity.services.databaseService import DatabaseConnection
@@ -37,11 +40,23 @@ from metadata.profiler.metrics.registry import Metrics
 from metadata.profiler.metrics.static.mean import Mean
 from metadata.profiler.metrics.static.stddev import StdDev
 from metadata.profiler.metrics.static.sum import Sum
+from metadata.profiler.orm.functions.approximate import (
+    APPROX_DISTINCT_DIALECTS,
+    APPROX_QUANTILE_DIALECTS,
+)
+from metadata.profiler.orm.functions.create_table_as import (
+    TEMPORARY_SAMPLE_DIALECTS,
+    CreateTableAs,
+    get_materialized_sample_name,
+)
 from metadata.profiler.orm.functions.table_metric_construct import (
     table_metric_construct_factory,
 )
 from metadata.profiler.processor.runner import QueryRunner
-from metadata.profiler.processor.sqlalchemy.sampler import Sampler
+from metadata.profiler.processor.sqlalchemy.sample_registry import (
+    get_materialized_sample_registry,
+)
+from metadata.profiler.processor.sqlalchemy.sampler import RANDOM_LABEL, Sampler
 from metadata.utils.custom_thread_pool import CustomThreadPoolExecutor
 from metadata.utils.dispatch import valuedispatch
 from metadata.utils.logger import profiler_interface_registry_logger
@@ -49,6 +64,10 @@ from metadata.utils.logger import profiler_interface_registry_logger
 logger = profiler_interface_registry_logger()
 thread_local = threading.local()
 
+# Schemas already cleaned from the samples of dead runs
+_cleaned_sample_schemas: Set[Tuple[str, Optional[str]]] = set()
+_cleaned_sample_schemas_lock = threading.Lock()
+
 OVERFLOW_ERROR_CODES = {
     "snowflake": {100046, 100058},
 }
@@ -84,6 +103,7 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         sqa_metadata=None,
         timeout_seconds=43200,
         thread_count=5,
+        approximate_metrics=False,
         **_,
     ):
         """Instantiate SQA Interface object"""
@@ -115,11 +135,62 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         )
 
         self.timeout_seconds = timeout_seconds
+        if approximate_metrics:
+            self.approximate_metrics = self._get_approximate_metrics()
+
+        self._materialized_sample_lock = threading.Lock()
+        self._materialized_sample_table: Optional[Table] = None
+        self._materialized_sample_connection: Optional[Connection] = None
+        self._materialized_sample: Optional[AliasedClass] = None
+        self._materialized_sample_failed = False
 
     @property
     def table(self):
         return self._table
 
+    @property
+    def materialize_sample(self) -> bool:
+        """Whether the sample should be stored in a table
+        to be shared by all the metric queries
+        """
+        try:
+            materialize = self.source_config.materializeSample
+        except AttributeError:
+            return False
+        return bool(
+            materialize
+            and self.profile_sample_config
+            and self.profile_sample_config.profile_sample
+            and not self.profile_query
+        )
+
+    @property
+    def column_batch_size(self) -> int:
+        """Number of columns whose static metrics share a query"""
+        try:
+            return max(self.source_config.columnMetricsBatchSize or 1, 1)
+        except AttributeError:
+            return 1
+
+    def _get_approximate_metrics(self) -> FrozenSet[str]:
+        """Metrics with an approximate function in the dialect"""
+        dialect = self.engine.dialect.name
+        approximate_metrics = set()
+        if dialect in APPROX_DISTINCT_DIALECTS:
+            approximate_metrics.add(Metrics.DISTINCT_COUNT.value.name())
+        if dialect in APPROX_QUANTILE_DIALECTS:
+            approximate_metrics.update(
+                metric.value.name()
+                for metric in (
+                    Metrics.MEDIAN,
+                    Metrics.FIRST_QUARTILE,
+                    Metrics.THIRD_QUARTILE,
+                    # Composed from the approximate quartiles
+                    Metrics.IQR,
+                )
+            )
+        return frozenset(approximate_metrics)
+
     @staticmethod
     def _is_array_column(column) -> Dict[str, Union[Optional[str], bool]]:
         """check if column is an array column
@@ -433,7 +504,7 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
                 session,
                 table,
             )
-            sample = sampler.random_sample()
+            sample = self._get_sample(session, sampler)
             runner = self._create_thread_safe_runner(
                 session,
                 table,
@@ -463,6 +534,96 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
 
             return row, column, metric_type.value
 
+    def compute_fused_metrics_in_thread(
+        self,
+        metric_funcs: List,
+        table,
+    ) -> List[Tuple]:
+        """Compute the static metrics of several columns with
+        a single query over the sample, and split the resulting
+        row back by column.
+
+        If the query fails, e.g., due to an overflow, each column
+        is computed on its own query.
+        """
+        logger.debug(
+            f"Running profiler for {len(metric_funcs)} columns of {table.__tablename__}"
+            f" on thread {threading.current_thread()}"
+        )
+        labels = {}
+        entities = []
+        for col_idx, (metrics, _, column, _) in enumerate(metric_funcs):
+            for metric_idx, metric in enumerate(metrics):
+                expression = metric(column).fn()
+                if expression is None:
+                    continue
+                if isinstance(expression, Label):
+                    expression = expression.element
+                # Short labels to stay within the identifier length of any dialect
+                label = f"c{col_idx}m{metric_idx}"
+                labels[label] = (column.name, metric.name())
+                entities.append(expression.label(label))
+
+        row = None
+        Session = self.session_factory  # pylint: disable=invalid-name
+        with Session() as session:
+            self.set_session_tag(session)
+            self.set_catalog(session)
+            sampler = self._create_thread_safe_sampler(session, table)
+            sample = self._get_sample(session, sampler)
+            runner = self._create_thread_safe_runner(session, table, sample)
+            try:
+                row = runner.select_first_from_sample(*entities)
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.info(
+                    f"Could not compute the metrics of {len(metric_funcs)} columns of"
+                    f" {table.__tablename__} in a single query, running them by column: {exc}"
+                )
+                session.rollback()
+
+        if row is None:
+            return [
+                self.compute_metrics_in_thread(*metric_func)
+                for metric_func in metric_funcs
+            ]
+
+        profiles = defaultdict(dict)
+        for label, value in dict(row).items():
+            column_name, metric_name = labels[label]
+            profiles[column_name][metric_name] = value
+
+        results = []
+        for _, metric_type, column, _ in metric_funcs:
+            self.processor_status.scanned(f"{table.__tablename__}.{column.name}")
+            results.append((profiles[column.name], column.name, metric_type.value))
+        return results
+
+    def _split_fused_metrics(self, metric_funcs: list) -> Tuple[list, List[list]]:
+        """Group the static metrics of the columns in batches
+        to be computed together. Array columns need their own query.
+        """
+        if self.column_batch_size <= 1:
+            return metric_funcs, []
+
+        fused, others = [], []
+        for metric_func in metric_funcs:
+            metrics, metric_type, column, _ = metric_func
+            if (
+                metric_type == MetricTypes.Static
+                and metrics
+                and not self._is_array_column(column)["is_array"]
+            ):
+                fused.append(metric_func)
+            else:
+                others.append(metric_func)
+
+        batches = [
+            fused[idx : idx + self.column_batch_size]
+            for idx in range(0, len(fused), self.column_batch_size)
+        ]
+        return others, batches
+
     # pylint: disable=use-dict-literal
     def get_all_metrics(
         self,
@@ -471,6 +632,7 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
         """get all profiler metrics"""
         logger.debug(f"Computing metrics with {self._thread_count} threads.")
         profile_results = {"table": dict(), "columns": defaultdict(dict)}
+        metric_funcs, fused_batches = self._split_fused_metrics(metric_funcs)
         with CustomThreadPoolExecutor(max_workers=self._thread_count) as pool:
             futures = [
                 pool.submit(
@@ -479,30 +641,23 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
                 )
                 for metric_func in metric_funcs
             ]
+            futures.extend(
+                pool.submit(self.compute_fused_metrics_in_thread, batch, self.table)
+                for batch in fused_batches
+            )
 
             for future in futures:
                 if future.cancelled():
                     continue
 
                 try:
-                    profile, column, metric_type = future.result(
-                        timeout=self.timeout_seconds
-                    )
-                    if metric_type != MetricTypes.System.value and not isinstance(
-                        profile, dict
+                    results = future.result(timeout=self.timeout_seconds)
+                    # Fused metrics come back as a list of results, one per column
+                    for profile, column, metric_type in (
+                        results if isinstance(results, list) else [results]
                     ):
-                        profile = dict()
-                    if metric_type == MetricTypes.Table.value:
-                        profile_results["table"].update(profile)
-                    elif metric_type == MetricTypes.System.value:
-                        profile_results["system"] = profile
-                    else:
-                        profile_results["columns"][column].update(
-                            {
-                                "name": column,
-                                "timestamp": datetime.now(tz=timezone.utc).timestamp(),
-                                **profile,
-                            }
+                        self._update_profile_results(
+                            profile_results, profile, column, metric_type
                         )
                 except concurrent.futures.TimeoutError as exc:
                     pool.shutdown39(wait=True, cancel_futures=True)
@@ -512,6 +667,26 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
 
         return profile_results
 
+    @staticmethod
+    def _update_profile_results(
+        profile_results: Dict, profile, column: Optional[str], metric_type: str
+    ) -> None:
+        """Add the results of a metrics computation to the profile"""
+        if metric_type != MetricTypes.System.value and not isinstance(profile, dict):
+            profile = {}
+        if metric_type == MetricTypes.Table.value:
+            profile_results["table"].update(profile)
+        elif metric_type == MetricTypes.System.value:
+            profile_results["system"] = profile
+        else:
+            profile_results["columns"][column].update(
+                {
+                    "name": column,
+                    "timestamp": datetime.now(tz=timezone.utc).timestamp(),
+                    **profile,
+                }
+            )
+
     def fetch_sample_data(self, table) -> TableData:
         """Fetch sample data from database
 
@@ -572,7 +747,7 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             partition_details=self.partition_details,
             profile_sample_query=self.profile_query,
         )
-        sample = sampler.random_sample()
+        sample = self._get_sample(self.session, sampler)
         try:
             return metric(column).fn(sample, column_results, self.session)
         except Exception as exc:
@@ -599,7 +774,159 @@ class SQAProfilerInterface(ProfilerProtocol, SQAInterfaceMixin):
             profile_sample_query=profile_sample_query,
         )
 
+    def _get_sample(self, session, sampler: Sampler):
+        """Get the sample to run the metrics against: the materialized
+        sample if enabled, or the sampler's random sample otherwise
+        """
+        if self.materialize_sample and not self._materialized_sample_failed:
+            with self._materialized_sample_lock:
+                if (
+                    self._materialized_sample is None
+                    and not self._materialized_sample_failed
+                ):
+                    self._materialize_sample(session, sampler)
+            if self._materialized_sample is not None:
+                return self._materialized_sample
+        return sampler.random_sample()
+
+    def _materialize_sample(self, session, sampler: Sampler) -> None:
+        """Store the random sample in a table, so that all the metrics
+        are computed over the same rows and the source table is scanned
+        only once.
+
+        The metrics run on different connections, so we can only use a
+        temporary table on the dialects where it is visible to all of them.
+        Otherwise, we create a regular table named after the run, dropped
+        when closing the interface, and drop the ones left behind by dead runs.
+        Only the tables in the registry of the created samples are dropped.
+        If the table cannot be created, we keep sampling on each query.
+        """
+        sampled = inspect(sampler.random_sample()).selectable
+        sample_columns = [col for col in sampled.c if col.name != RANDOM_LABEL]
+        sample_column_names = {col.name for col in sample_columns}
+        temporary = self.engine.dialect.name in TEMPORARY_SAMPLE_DIALECTS
+        schema = None
+        if not temporary:
+            try:
+                schema = self.source_config.materializedSampleSchema
+            except AttributeError:
+                pass
+            schema = schema or self.table.__table__.schema
+            self._drop_stale_materialized_samples(schema)
+        sample_table = Table(
+            get_materialized_sample_name(temporary=temporary),
+            MetaData(),
+            *[
+                Column(col.name, col.type, key=col.key, quote=col.quote)
+                for col in self.table.__table__.c
+                if col.name in sample_column_names
+            ],
+            schema=schema,
+        )
+        create = CreateTableAs(sample_table, select(*sample_columns))
+        try:
+            if temporary:
+                # The temporary table lives as long as the connection creating it
+                self._materialized_sample_connection = self.engine.connect()
+                with self._materialized_sample_connection.begin():
+                    self._materialized_sample_connection.execute(create)
+            else:
+                session.execute(create)
+                session.commit()
+                get_materialized_sample_registry().add(
+                    str(self.engine.url), schema, sample_table.name
+                )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not materialize the sample of {self.table.__tablename__},"
+                f" sampling on each query instead: {exc}"
+            )
+            session.rollback()
+            self._close_materialized_sample_connection()
+            self._materialized_sample_failed = True
+            return
+
+        logger.debug(
+            f"Materialized the sample of {self.table.__tablename__}"
+            f" in {sample_table.fullname}"
+        )
+        self._materialized_sample_table = sample_table
+        self._materialized_sample = aliased(
+            self.table, sample_table, adapt_on_names=True
+        )
+
+    def _drop_stale_materialized_samples(self, schema: Optional[str]) -> None:
+        """Drop the samples left in `schema` by runs that did not clean up,
+        once per schema and process. Only the samples recorded in the
+        registry are dropped, never a table matching their names.
+        """
+        key = (str(self.engine.url), schema)
+        with _cleaned_sample_schemas_lock:
+            if key in _cleaned_sample_schemas:
+                return
+            _cleaned_sample_schemas.add(key)
+
+        registry = get_materialized_sample_registry()
+        location = str(self.engine.url)
+        try:
+            stale = registry.get_stale(location, schema)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Could not list the stale samples in {schema}: {exc}")
+            return
+
+        for name in stale:
+            try:
+                Table(name, MetaData(), schema=schema).drop(
+                    bind=self.engine, checkfirst=True
+                )
+                registry.remove(location, schema, name)
+                logger.info(f"Dropped the stale materialized sample {name}")
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Could not drop the stale sample {name}: {exc}")
+
+    def _close_materialized_sample_connection(self) -> None:
+        """Close the connection holding a temporary sample, if any"""
+        if self._materialized_sample_connection is None:
+            return
+        try:
+            self._materialized_sample_connection.close()
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Could not close the materialized sample connection: {exc}"
+            )
+        self._materialized_sample_connection = None
+
+    def _drop_materialized_sample(self) -> None:
+        """Drop the materialized sample table, if any"""
+        if self._materialized_sample_table is None:
+            return
+        try:
+            self._materialized_sample_table.drop(
+                bind=self._materialized_sample_connection or self.engine,
+                checkfirst=True,
+            )
+            if self._materialized_sample_connection is None:
+                get_materialized_sample_registry().remove(
+                    str(self.engine.url),
+                    self._materialized_sample_table.schema,
+                    self._materialized_sample_table.name,
+                )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                "Could not drop the materialized sample"
+                f" {self._materialized_sample_table.fullname}: {exc}"
+            )
+        self._close_materialized_sample_connection()
+        self._materialized_sample_table = None
+        self._materialized_sample = None
+
     def close(self):
         """Clean up session"""
+        self._drop_materialized_sample()
         self.session.close()
         self.engine.pool.dispose()
@@ -0,0 +1,526 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Mergeable summaries of the columns of chunked dataframes.
+
+The pandas metrics used to go over all the chunks once per metric, and
+the quantiles concatenated every chunk. Instead, each chunk is summarized
+once per column with vectorized operations, the summaries of the chunks
+are merged, and the metrics are computed from the merged summary.
+
+Columns with few distinct values keep the frequency of each value, so that
+their distinct counts and quantiles are exact. Past EXACT_VALUES_LIMIT
+distinct values, the frequencies are replaced by a HyperLogLog sketch for
+the distinct count and a quantile digest for the quantiles, so that memory
+does not grow with the rows of e.g. ID columns.
+"""
+import math
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+# Distinct values of a column counted exactly before switching to sketches
+EXACT_VALUES_LIMIT = 1 << 14
+# 2^14 registers: ~0.8% standard error on the distinct count
+HLL_PRECISION = 14
+# Points kept by the quantile digest: ~0.1% rank error per compression
+QUANTILE_DIGEST_SIZE = 1000
+
+
+def _is_numeric(values) -> bool:
+    # pylint: disable=import-outside-toplevel
+    from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+    return is_numeric_dtype(values) and not is_bool_dtype(values)
+
+
+def _hash_values(values):
+    """
+    64 bits hash of each value. Numbers are hashed as floats, so that
+    a value hashes the same in the int and float chunks of a column.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    if _is_numeric(values):
+        values = values.astype("float64")
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct count sketch. Each value updates the register picked
+    by the first bits of its hash with the position of the first 1 bit in
+    the rest of the hash.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes) -> None:
+        """Add the values given by their uint64 hashes"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if not len(hashes):
+            return
+        suffix_bits = 64 - self.precision
+        registers = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffixes = hashes & np.uint64((1 << suffix_bits) - 1)
+        # Bit length of the suffixes, exact as frexp works on 32 bits halves
+        high = np.frexp((suffixes >> np.uint64(32)).astype(np.float64))[1]
+        low = np.frexp((suffixes & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+        bit_lengths = np.where(high > 0, high + 32, low)
+        ranks = (suffix_bits - bit_lengths + 1).astype(np.uint8)
+        np.maximum.at(self.registers, registers, ranks)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        """Estimated distinct count, with linear counting for small ones"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size**2 / np.power(2.0, -self.registers.astype(float)).sum()
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+class QuantileDigest:
+    """
+    Mergeable summary of the distribution of numeric values, as weighted
+    points. When there are too many, the points are compressed into
+    `size` centroids of about the same weight.
+    """
+
+    def __init__(self, size: int = QUANTILE_DIGEST_SIZE):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self.size = size
+        self.values = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+
+    def update(self, values, weights=None) -> None:
+        """Add the values, each of them `weights` times"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        values = np.asarray(values, dtype=np.float64)
+        weights = (
+            np.ones(len(values))
+            if weights is None
+            else np.asarray(weights, dtype=np.float64)
+        )
+        self.values = np.concatenate([self.values, values])
+        self.weights = np.concatenate([self.weights, weights])
+        if len(self.values) > 2 * self.size:
+            self._compress()
+
+    def merge(self, other: "QuantileDigest") -> None:
+        self.update(other.values, other.weights)
+
+    def _compress(self) -> None:
+        """Merge the sorted points into `size` buckets of the same weight"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        order = np.argsort(self.values, kind="stable")
+        values, weights = self.values[order], self.weights[order]
+        cumulative = np.cumsum(weights)
+        buckets = np.minimum(
+            ((cumulative - weights / 2) / cumulative[-1] * self.size).astype(np.intp),
+            self.size - 1,
+        )
+        bucket_weights = np.bincount(buckets, weights, minlength=self.size)
+        bucket_sums = np.bincount(buckets, weights * values, minlength=self.size)
+        filled = bucket_weights > 0
+        self.weights = bucket_weights[filled]
+        self.values = bucket_sums[filled] / self.weights
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Interpolate the quantile between the centroids"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if not len(self.values):
+            return None
+        order = np.argsort(self.values, kind="stable")
+        values, weights = self.values[order], self.weights[order]
+        midpoints = np.cumsum(weights) - weights / 2
+        return float(np.interp(quantile * weights.sum(), midpoints, values))
+
+
+class ColumnAccumulator:
+    """
+    Summary of the values of a column, updated one chunk at a time
+    """
+
+    def __init__(self, exact_values_limit: int = EXACT_VALUES_LIMIT):
+        self.exact_values_limit = exact_values_limit
+        self.count = 0
+        self.null_count = 0
+        self.sum = None
+        self.min = None
+        self.max = None
+        # Mean and sum of squared deviations of the numeric values
+        self.numeric = True
+        self.mean_value = 0.0
+        self.squared_deviations = 0.0
+        # Lengths of the values of the non numeric chunks, as strings
+        self.length_min = None
+        self.length_max = None
+        self.length_sum = 0
+        self.length_count = 0
+        # Frequency of each non null value, indexed by value. The chunk
+        # frequencies are kept aside and merged together in a single pass.
+        self.value_counts = None
+        self.pending_value_counts: List = []
+        self.pending_size = 0
+        self.hashable = True
+        # Sketches replacing the frequencies past `exact_values_limit`
+        self.hll: Optional[HyperLogLog] = None
+        self.digest: Optional[QuantileDigest] = None
+
+    @property
+    def is_exact(self) -> bool:
+        return self.hll is None
+
+    def update(self, series) -> None:
+        """Add the values of a chunk of the column"""
+        self.null_count += int(series.isnull().sum())
+        values = series.dropna()
+        if values.empty:
+            return
+        self._update_moments(values)
+        self._update_lengths(values)
+        self.count += len(values)
+
+        if not self.hashable:
+            return
+        if not self.is_exact:
+            self._update_sketches(values)
+            return
+        try:
+            value_counts = values.value_counts(sort=False)
+        except TypeError:
+            # e.g., dicts and lists of JSON columns
+            self._set_unhashable()
+            return
+        self._add_value_counts(value_counts)
+
+    def _update_moments(self, values) -> None:
+        # pylint: disable=import-outside-toplevel
+        from pandas.api.types import is_numeric_dtype
+
+        try:
+            self.min = _combine(min, self.min, values.min())
+            self.max = _combine(max, self.max, values.max())
+        except TypeError:
+            # values that cannot be compared, e.g., mixed types
+            pass
+        if is_numeric_dtype(values):
+            self.sum = _combine(_add, self.sum, values.sum())
+        if not _is_numeric(values):
+            self.numeric = False
+            return
+        numbers = values.to_numpy(dtype="float64")
+        mean = numbers.mean()
+        self._merge_moments(len(numbers), mean, ((numbers - mean) ** 2).sum())
+
+    def _merge_moments(self, count: int, mean: float, squared_deviations) -> None:
+        """Combine the moments of two sets of values (Chan et al.)"""
+        total = self.count + count
+        delta = mean - self.mean_value
+        self.mean_value += delta * count / total
+        self.squared_deviations += (
+            squared_deviations + delta**2 * self.count * count / total
+        )
+
+    def _update_lengths(self, values) -> None:
+        if _is_numeric(values):
+            return
+        lengths = values.astype(str).str.len()
+        self.length_min = _combine(min, self.length_min, int(lengths.min()))
+        self.length_max = _combine(max, self.length_max, int(lengths.max()))
+        self.length_sum += int(lengths.sum())
+        self.length_count += len(lengths)
+
+    def _set_unhashable(self) -> None:
+        self.hashable = False
+        self.value_counts = None
+        self.pending_value_counts, self.pending_size = [], 0
+        self.hll = self.digest = None
+
+    def _add_value_counts(self, value_counts) -> None:
+        """Keep the frequencies, merging them once there are enough pending"""
+        self.pending_value_counts.append(value_counts)
+        self.pending_size += len(value_counts)
+        if self.pending_size > self.exact_values_limit:
+            self._merge_pending_value_counts()
+
+    def _merge_pending_value_counts(self) -> None:
+        """Sum the pending frequencies, or move to the sketches if too many"""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        if not self.pending_value_counts:
+            return
+        if self.value_counts is not None:
+            self.pending_value_counts.append(self.value_counts)
+        if len(self.pending_value_counts) == 1:
+            value_counts = self.pending_value_counts[0]
+        else:
+            value_counts = (
+                pd.concat(self.pending_value_counts).groupby(level=0, sort=False).sum()
+            )
+        self.pending_value_counts, self.pending_size = [], 0
+        self.value_counts = value_counts
+        if len(value_counts) > self.exact_values_limit:
+            self._start_sketches()
+
+    def _start_sketches(self) -> None:
+        """Replace the frequencies by the sketches"""
+        self.hll = HyperLogLog()
+        self.digest = QuantileDigest() if self.numeric else None
+        self._add_to_sketches(self.value_counts)
+        self.value_counts = None
+
+    def _add_to_sketches(self, value_counts) -> None:
+        values = value_counts.index.to_series()
+        self.hll.update(_hash_values(values))
+        if self.digest is not None:
+            self.digest.update(values, value_counts.to_numpy())
+
+    def _update_sketches(self, values) -> None:
+        self.hll.update(_hash_values(values))
+        if self.digest is not None:
+            if self.numeric:
+                self.digest.update(values.to_numpy(dtype="float64"))
+            else:
+                self.digest = None
+
+    def merge(self, other: "ColumnAccumulator") -> "ColumnAccumulator":
+        """Add the values summarized by another accumulator"""
+        if other.count and other.numeric:
+            self._merge_moments(
+                other.count, other.mean_value, other.squared_deviations
+            )
+        self.numeric = self.numeric and other.numeric
+        self.count += other.count
+        self.null_count += other.null_count
+        self.sum = _combine(_add, self.sum, other.sum)
+        self.min = _combine(min, self.min, other.min)
+        self.max = _combine(max, self.max, other.max)
+        self.length_min = _combine(min, self.length_min, other.length_min)
+        self.length_max = _combine(max, self.length_max, other.length_max)
+        self.length_sum += other.length_sum
+        self.length_count += other.length_count
+
+        if not (self.hashable and other.hashable):
+            self._set_unhashable()
+            return self
+        other._merge_pending_value_counts()  # pylint: disable=protected-access
+        if self.is_exact and other.is_exact:
+            if other.value_counts is not None:
+                self._add_value_counts(other.value_counts)
+            return self
+
+        self._merge_pending_value_counts()
+        if self.is_exact:
+            if self.value_counts is None:
+                self.hll, self.digest = HyperLogLog(), QuantileDigest()
+            else:
+                self._start_sketches()
+        if other.is_exact:
+            if other.value_counts is not None:
+                self._add_to_sketches(other.value_counts)
+        else:
+            self.hll.merge(other.hll)
+            if self.digest is not None and other.digest is not None:
+                self.digest.merge(other.digest)
+            else:
+                self.digest = None
+        if not self.numeric:
+            self.digest = None
+        return self
+
+    def _get_value_counts(self):
+        if not self.hashable:
+            raise TypeError("Values of the column are not hashable")
+        self._merge_pending_value_counts()
+        if self.value_counts is None:
+            import pandas as pd  # pylint: disable=import-outside-toplevel
+
+            return pd.Series(dtype="int64")
+        return self.value_counts
+
+    @property
+    def distinct_count(self) -> int:
+        if not self.hashable:
+            raise TypeError("Values of the column are not hashable")
+        self._merge_pending_value_counts()
+        if not self.is_exact:
+            return self.hll.count()
+        return len(self._get_value_counts())
+
+    @property
+    def unique_count(self) -> Optional[int]:
+        """
+        Values seen exactly once. No sketch estimates them, so
+        they are only counted while the frequencies are kept.
+        """
+        if not self.hashable:
+            raise TypeError("Values of the column are not hashable")
+        self._merge_pending_value_counts()
+        if not self.is_exact:
+            return None
+        return int((self._get_value_counts() == 1).sum())
+
+    @property
+    def mean(self) -> Optional[float]:
+        if not self.count or self.sum is None:
+            return None
+        return self.sum / self.count
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Sample standard deviation, as pandas `std`"""
+        if self.count < 2 or not self.numeric:
+            return None
+        return math.sqrt(self.squared_deviations / (self.count - 1))
+
+    def quantile(self, quantile: float) -> Optional[Any]:
+        """
+        Quantile of the values, with midpoint interpolation between
+        the two closest values, as pandas `quantile`. It is
+        approximated by the digest past the exact values limit.
+        """
+        if not self.count or not self.hashable:
+            return None
+        self._merge_pending_value_counts()
+        if not self.is_exact:
+            return self.digest.quantile(quantile) if self.digest else None
+        value_counts = self._get_value_counts().sort_index()
+        cumulative_counts = value_counts.cumsum().to_numpy()
+        values = value_counts.index
+
+        position = quantile * (self.count - 1)
+        lower = values[cumulative_counts.searchsorted(math.floor(position), "right")]
+        upper = values[cumulative_counts.searchsorted(math.ceil(position), "right")]
+        if lower == upper:
+            return lower
+        return (lower + upper) / 2
+
+    @property
+    def min_length(self) -> Optional[int]:
+        return self.length_min
+
+    @property
+    def max_length(self) -> Optional[int]:
+        return self.length_max
+
+    @property
+    def mean_length(self) -> Optional[float]:
+        if not self.length_count:
+            return None
+        return self.length_sum / self.length_count
+
+
+def _add(left, right):
+    return left + right
+
+
+def _combine(operator, current, value):
+    """Combine the values, ignoring the missing ones"""
+    if current is None:
+        return value
+    if value is None:
+        return current
+    return operator(current, value)
+
+
+class DataFrameChunks:
+    """
+    Chunks of a table. The accumulators of all the columns
+    are built in a single pass over the chunks, the first
+    time one of them is needed, and reused by every metric.
+
+    The chunks are a list, or a callable returning a new iterator
+    over them: the file is then read again on each pass, and only
+    the chunk being processed is held in memory. The first chunk
+    is kept, to get the columns of the table.
+    """
+
+    def __init__(self, chunks: Union[Iterable, Callable[[], Iterable]]):
+        self._chunks = chunks
+        self._first_chunk = None
+        self.accumulators: Optional[Dict[str, ColumnAccumulator]] = None
+
+    def __iter__(self) -> Iterator:
+        chunks = self._chunks() if callable(self._chunks) else self._chunks
+        return iter(chunks or [])
+
+    def __getitem__(self, index: int):
+        if index != 0:
+            for position, chunk in enumerate(self):
+                if position == index:
+                    return chunk
+            raise IndexError(index)
+        if self._first_chunk is None:
+            self._first_chunk = next(iter(self), None)
+            if self._first_chunk is None:
+                raise IndexError(index)
+        return self._first_chunk
+
+    def __bool__(self) -> bool:
+        try:
+            self[0]  # pylint: disable=pointless-statement
+        except IndexError:
+            return False
+        return True
+
+    def build_accumulators(self) -> Dict[str, ColumnAccumulator]:
+        accumulators: Dict[str, ColumnAccumulator] = {}
+        for df in self:
+            for column_name in df.columns:
+                accumulators.setdefault(column_name, ColumnAccumulator()).update(
+                    df[column_name]
+                )
+        return accumulators
+
+
+def get_accumulator(dfs: List, column_name: str) -> ColumnAccumulator:
+    """
+    Summary of the column over the chunks. It is computed once
+    for DataFrameChunks, and for each call on plain lists.
+    """
+    if isinstance(dfs, DataFrameChunks):
+        if dfs.accumulators is None:
+            dfs.accumulators = dfs.build_accumulators()
+        if column_name not in dfs.accumulators:
+            raise KeyError(column_name)
+        return dfs.accumulators[column_name]
+
+    accumulator = ColumnAccumulator()
+    for df in dfs:
+        accumulator.update(df[column_name])
+    return accumulator
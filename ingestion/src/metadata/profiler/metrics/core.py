@@ -98,8 +98,14 @@ class Metric(ABC):
 
     Table Metrics do not require a column.
     If not specified, it is a Table metric.
+
+    Metrics supporting it are computed with the approximate
+    functions of the database when `approximate` is set, e.g.,
+    add_props(approximate=True)(Metrics.DISTINCT_COUNT.value)
     """
 
+    approximate: bool = False
+
     def __init__(self, col: Optional[Column] = None, **kwargs):
         self.col = col
 
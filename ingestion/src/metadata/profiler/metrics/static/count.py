@@ -17,6 +17,7 @@ Count Metric definition
 
 from sqlalchemy import column, func
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import StaticMetric, _label
 from metadata.utils.logger import profiler_logger
 
@@ -46,7 +47,7 @@ class Count(StaticMetric):
     def df_fn(self, dfs=None):
         """pandas function"""
         try:
-            return sum(df[self.col.name].count() for df in dfs)
+            return get_accumulator(dfs, self.col.name).count
         except Exception as err:
             logger.debug(
                 f"Don't know how to process type {self.col.type} when computing Count"
@@ -17,7 +17,9 @@ Distinct Count Metric definition
 
 from sqlalchemy import column, distinct, func
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import StaticMetric, _label
+from metadata.profiler.orm.functions.approximate import ApproxCountDistinctFn
 from metadata.utils.logger import profiler_logger
 
 logger = profiler_logger()
@@ -40,16 +42,13 @@ class DistinctCount(StaticMetric):
 
     @_label
     def fn(self):
+        if self.approximate:
+            return ApproxCountDistinctFn(column(self.col.name))
         return func.count(distinct(column(self.col.name)))
 
     def df_fn(self, dfs=None):
-        from collections import Counter  # pylint: disable=import-outside-toplevel
-
         try:
-            counter = Counter()
-            for df in dfs:
-                counter.update(df[self.col.name].dropna().to_list())
-            return len(counter.keys())
+            return get_accumulator(dfs, self.col.name).distinct_count
         except Exception as err:
             logger.debug(
                 f"Don't know how to process type {self.col.type}"
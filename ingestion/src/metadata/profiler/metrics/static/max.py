@@ -19,6 +19,7 @@ from sqlalchemy import column
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.functions import GenericFunction
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import CACHE, StaticMetric, _label
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.registry import (
@@ -62,5 +63,5 @@ class Max(StaticMetric):
     def df_fn(self, dfs=None):
         """pandas function"""
         if is_quantifiable(self.col.type) or is_date_time(self.col.type):
-            return max((df[self.col.name].max() for df in dfs))
+            return get_accumulator(dfs, self.col.name).max
         return 0
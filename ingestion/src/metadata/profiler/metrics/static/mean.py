@@ -15,12 +15,11 @@ AVG Metric definition
 # pylint: disable=duplicate-code
 
 
-from typing import List, cast
-
 from sqlalchemy import column, func
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.functions import GenericFunction
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import CACHE, StaticMetric, _label
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.registry import Dialects, is_concatenable, is_quantifiable
@@ -84,36 +83,17 @@ class Mean(StaticMetric):
         )
         return None
 
-    # pylint: disable=import-outside-toplevel
     def df_fn(self, dfs=None):
         """dataframe function"""
-        import pandas as pd
-        from numpy import average, vectorize
-
-        dfs = cast(List[pd.DataFrame], dfs)
-
-        means = []
-        weights = []
-
+        mean = None
         if is_quantifiable(self.col.type):
-            for df in dfs:
-                mean = df[self.col.name].mean()
-                if not pd.isnull(mean):
-                    means.append(mean)
-                    weights.append(df[self.col.name].count())
+            mean = get_accumulator(dfs, self.col.name).mean
 
         if is_concatenable(self.col.type):
-            length_vectorize_func = vectorize(len)
-            for df in dfs:
-                mean = length_vectorize_func(
-                    df[self.col.name].dropna().astype(str)
-                ).mean()
-                if not pd.isnull(mean):
-                    means.append(mean)
-                    weights.append(df[self.col.name].dropna().count())
-
-        if means:
-            return average(means, weights=weights)
+            mean = get_accumulator(dfs, self.col.name).mean_length
+
+        if mean is not None:
+            return mean
 
         logger.warning(
             f"Don't know how to process type {self.col.type} when computing MEAN"
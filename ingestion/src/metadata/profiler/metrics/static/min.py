@@ -18,6 +18,7 @@ from sqlalchemy import column
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.functions import GenericFunction
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import CACHE, StaticMetric, _label
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.registry import (
@@ -62,5 +63,5 @@ class Min(StaticMetric):
     def df_fn(self, dfs=None):
         """pandas function"""
         if is_quantifiable(self.col.type) or is_date_time(self.col.type):
-            return min((df[self.col.name].min() for df in dfs))
+            return get_accumulator(dfs, self.col.name).min
         return 0
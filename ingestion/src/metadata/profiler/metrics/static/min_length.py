@@ -17,6 +17,7 @@ MIN_LENGTH Metric definition
 
 from sqlalchemy import column, func
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import StaticMetric, _label
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.registry import is_concatenable
@@ -56,18 +57,10 @@ class MinLength(StaticMetric):
         )
         return None
 
-    # pylint: disable=import-outside-toplevel
     def df_fn(self, dfs=None):
         """dataframe function"""
-        from numpy import vectorize
-
-        length_vectorize_func = vectorize(len)
-
         if self._is_concatenable():
-            return min(
-                length_vectorize_func(df[self.col.name].dropna().astype(str)).min()
-                for df in dfs
-            )
+            return get_accumulator(dfs, self.col.name).min_length
         logger.debug(
             f"Don't know how to process type {self.col.type} when computing MIN_LENGTH"
         )
@@ -17,6 +17,7 @@ Null Count Metric definition
 
 from sqlalchemy import case, column
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import StaticMetric, _label
 from metadata.profiler.orm.functions.sum import SumFn
 
@@ -51,4 +52,4 @@ class NullCount(StaticMetric):
 
     def df_fn(self, dfs=None):
         """pandas function"""
-        return sum(df[self.col.name].isnull().sum() for df in dfs)
+        return get_accumulator(dfs, self.col.name).null_count
@@ -21,6 +21,7 @@ from sqlalchemy import column
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.functions import FunctionElement
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import CACHE, StaticMetric, _label
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.registry import Dialects, is_concatenable, is_quantifiable
@@ -96,17 +97,8 @@ class StdDev(StaticMetric):
 
     def df_fn(self, dfs=None):
         """pandas function"""
-        import pandas as pd  # pylint: disable=import-outside-toplevel
-
         if is_quantifiable(self.col.type):
-            try:
-                return pd.concat(df[self.col.name] for df in dfs).std()
-            except MemoryError:
-                logger.error(
-                    f"Unable to compute distinctCount for {self.col.name} due to memory constraints."
-                    f"We recommend using a smaller sample size or partitionning."
-                )
-                return None
+            return get_accumulator(dfs, self.col.name).stddev
 
         logger.debug(
             f"{self.col.name} has type {self.col.type}, which is not listed as quantifiable."
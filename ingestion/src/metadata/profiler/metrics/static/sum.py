@@ -16,6 +16,7 @@ SUM Metric definition
 
 from sqlalchemy import column
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import StaticMetric, _label
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.functions.sum import SumFn
@@ -49,5 +50,5 @@ class Sum(StaticMetric):
     def df_fn(self, dfs=None):
         """pandas function"""
         if is_quantifiable(self.col.type):
-            return sum(df[self.col.name].sum() for df in dfs)
+            return get_accumulator(dfs, self.col.name).sum
         return None
@@ -17,6 +17,7 @@ from typing import Optional
 from sqlalchemy import column, func
 from sqlalchemy.orm import DeclarativeMeta, Session
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import QueryMetric
 from metadata.profiler.orm.registry import NOT_COMPUTE
 from metadata.utils.logger import profiler_logger
@@ -69,13 +70,8 @@ class UniqueCount(QueryMetric):
         """
         Build the Unique Count metric
         """
-        from collections import Counter  # pylint: disable=import-outside-toplevel
-
         try:
-            counter = Counter()
-            for df in dfs:
-                counter.update(df[self.col.name].dropna().to_list())
-            return len([key for key, value in counter.items() if value == 1])
+            return get_accumulator(dfs, self.col.name).unique_count
         except Exception as err:
             logger.debug(
                 f"Don't know how to process type {self.col.type}"
@@ -18,16 +18,29 @@ from typing import Optional
 
 from sqlalchemy.engine.row import Row
 
+from metadata.profiler.metrics.system.dml_operation import DatabaseDMLOperations
 from metadata.utils.logger import profiler_logger
 from metadata.utils.profiler_utils import QueryResult, get_identifiers_from_string
 
 logger = profiler_logger()
 
+# DML queries of the last day against a schema. Only queries with the
+# fully qualified name of a table can be linked to it, so we can filter
+# on the database and schema names, and get the rows of all the tables
+# of the schema at once. Rows affected come from the history itself.
 INFORMATION_SCHEMA_QUERY = """
-    SELECT * FROM "SNOWFLAKE"."ACCOUNT_USAGE"."QUERY_HISTORY"
+    SELECT
+        QUERY_ID,
+        QUERY_TEXT,
+        QUERY_TYPE,
+        START_TIME,
+        ROWS_INSERTED,
+        ROWS_UPDATED,
+        ROWS_DELETED
+    FROM "SNOWFLAKE"."ACCOUNT_USAGE"."QUERY_HISTORY"
     WHERE
     start_time>= DATEADD('DAY', -1, CURRENT_TIMESTAMP)
-    AND QUERY_TEXT ILIKE '%{tablename}%'
+    AND QUERY_TEXT ILIKE '%{database}%{schema}%'
     AND QUERY_TYPE IN (
         '{insert}',
         '{update}',
@@ -37,10 +50,27 @@ INFORMATION_SCHEMA_QUERY = """
     AND EXECUTION_STATUS = 'SUCCESS';
 """
 
-RESULT_SCAN = """
-    SELECT *
-    FROM TABLE(RESULT_SCAN('{query_id}'));
-    """
+# Columns of the query history with the rows affected by each query type
+ROWS_AFFECTED_COLUMNS = {
+    DatabaseDMLOperations.INSERT.value: ("ROWS_INSERTED",),
+    DatabaseDMLOperations.UPDATE.value: ("ROWS_UPDATED",),
+    DatabaseDMLOperations.DELETE.value: ("ROWS_DELETED",),
+    DatabaseDMLOperations.MERGE.value: (
+        "ROWS_INSERTED",
+        "ROWS_UPDATED",
+        "ROWS_DELETED",
+    ),
+}
+
+
+def get_rows_affected(row: Row) -> Optional[int]:
+    """Rows affected by the query, from the query history row"""
+    rows = [
+        getattr(row, column, None)
+        for column in ROWS_AFFECTED_COLUMNS.get(row.QUERY_TYPE, ())
+    ]
+    rows = [value for value in rows if value is not None]
+    return sum(rows) if rows else None
 
 
 def get_snowflake_system_queries(
@@ -92,6 +122,7 @@ def get_snowflake_system_queries(
                 query_text=row.QUERY_TEXT,
                 query_type=row.QUERY_TYPE,
                 timestamp=row.START_TIME,
+                rows=get_rows_affected(row),
             )
     except Exception:
         return None
@@ -13,10 +13,10 @@
 System Metric
 """
 
+import threading
 import traceback
 from collections import defaultdict
-from textwrap import dedent
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
 
 from sqlalchemy import text
 from sqlalchemy.orm import DeclarativeMeta, Session
@@ -41,19 +41,24 @@ from metadata.profiler.metrics.system.queries.redshift import (
 )
 from metadata.profiler.metrics.system.queries.snowflake import (
     INFORMATION_SCHEMA_QUERY,
-    RESULT_SCAN,
     get_snowflake_system_queries,
 )
 from metadata.profiler.orm.registry import Dialects
 from metadata.utils.dispatch import valuedispatch
 from metadata.utils.helpers import deep_size_of_dict
 from metadata.utils.logger import profiler_logger
-from metadata.utils.profiler_utils import get_value_from_cache, set_cache
+from metadata.utils.profiler_utils import (
+    QueryResult,
+    get_value_from_cache,
+    set_cache,
+)
 
 logger = profiler_logger()
 
 MAX_SIZE_IN_BYTES = 2 * 1024**3  # 2GB
 
+T = TypeVar("T")
+
 
 def recursive_dic():
     """recursive default dict"""
@@ -61,6 +66,9 @@ def recursive_dic():
 
 
 SYSTEM_QUERY_RESULT_CACHE = recursive_dic()
+SYSTEM_QUERY_LOCK = threading.Lock()
+# One lock per schema, so that its DML history is only fetched once
+SYSTEM_QUERY_KEY_LOCKS: Dict[str, threading.Lock] = defaultdict(threading.Lock)
 
 
 @valuedispatch
@@ -88,6 +96,47 @@ def get_system_metrics_for_dialect(
     logger.info(f"System metrics not support for {dialect}. Skipping processing.")
 
 
+def get_schema_system_results(
+    cache_key: str,
+    fetch_results: Callable[[], Iterable[T]],
+    table_name_fn: Callable[[T], str],
+) -> Dict[str, List[T]]:
+    """DML history of a schema, indexed by table name.
+
+    The history is fetched once per schema and run for all its tables.
+    Tables of the same schema profiled at the same time wait for the
+    first one to fetch it instead of running the same query.
+
+    Args:
+        cache_key (str): key of the schema in the cache
+        fetch_results (Callable): runs the queries on the DML history
+        table_name_fn (Callable): table name of a result
+    Returns:
+        Dict[str, List[T]]: results of each table
+    """
+    with SYSTEM_QUERY_LOCK:
+        key_lock = SYSTEM_QUERY_KEY_LOCKS[cache_key]
+
+    with key_lock:
+        results = get_value_from_cache(SYSTEM_QUERY_RESULT_CACHE, cache_key)
+        if results is None:
+            results = defaultdict(list)
+            for result in fetch_results():
+                results[table_name_fn(result)].append(result)
+            # Keep empty schemas in the cache as well
+            results = dict(results)
+            with SYSTEM_QUERY_LOCK:
+                set_cache(SYSTEM_QUERY_RESULT_CACHE, cache_key, results)
+    return results
+
+
+def clear_system_metrics_cache() -> None:
+    """Forget the DML history fetched during the run"""
+    with SYSTEM_QUERY_LOCK:
+        SYSTEM_QUERY_RESULT_CACHE.clear()
+        SYSTEM_QUERY_KEY_LOCKS.clear()
+
+
 @get_system_metrics_for_dialect.register(Dialects.BigQuery)
 def _(
     dialect: str,
@@ -113,16 +162,8 @@ def _(
     dataset_id = table.__table_args__["schema"]  # type: ignore
 
     metric_results: List[Dict] = []
-    # QueryResult = namedtuple(
-    #     "QueryResult",
-    #     "query_type,timestamp,destination_table,dml_statistics",
-    # )
-
-    jobs = get_value_from_cache(
-        SYSTEM_QUERY_RESULT_CACHE, f"{Dialects.BigQuery}.{project_id}.{dataset_id}.jobs"
-    )
 
-    if not jobs:
+    def _fetch_jobs() -> Iterable[BigQueryQueryResult]:
         cursor_jobs = session.execute(
             text(
                 JOBS.format(
@@ -136,7 +177,7 @@ def _(
                 )
             )
         )
-        jobs = [
+        return [
             BigQueryQueryResult(
                 query_type=row.statement_type,
                 timestamp=row.start_time,
@@ -145,49 +186,49 @@ def _(
             )
             for row in cursor_jobs
         ]
-        set_cache(
-            SYSTEM_QUERY_RESULT_CACHE,
-            f"{Dialects.BigQuery}.{project_id}.{dataset_id}.jobs",
-            jobs,
-        )
 
-    for job in jobs:
-        if job.table_name.get("table_id") == table.__tablename__:  # type: ignore
+    jobs = get_schema_system_results(
+        f"{Dialects.BigQuery}.{project_id}.{dataset_id}.jobs",
+        _fetch_jobs,
+        lambda job: job.table_name.get("table_id"),
+    )
+
+    for job in jobs.get(table.__tablename__, []):  # type: ignore
+        rows_affected = None
+        try:
+            if job.query_type == DatabaseDMLOperations.INSERT.value:
+                rows_affected = job.dml_statistics.get("inserted_row_count")
+            if job.query_type == DatabaseDMLOperations.DELETE.value:
+                rows_affected = job.dml_statistics.get("deleted_row_count")
+            if job.query_type == DatabaseDMLOperations.UPDATE.value:
+                rows_affected = job.dml_statistics.get("updated_row_count")
+        except AttributeError:
+            logger.debug(traceback.format_exc())
             rows_affected = None
-            try:
-                if job.query_type == DatabaseDMLOperations.INSERT.value:
-                    rows_affected = job.dml_statistics.get("inserted_row_count")
-                if job.query_type == DatabaseDMLOperations.DELETE.value:
-                    rows_affected = job.dml_statistics.get("deleted_row_count")
-                if job.query_type == DatabaseDMLOperations.UPDATE.value:
-                    rows_affected = job.dml_statistics.get("updated_row_count")
-            except AttributeError:
-                logger.debug(traceback.format_exc())
-                rows_affected = None
-
-            if job.query_type == DatabaseDMLOperations.MERGE.value:
-                for indx, key in enumerate(job.dml_statistics):
-                    if job.dml_statistics[key] != 0:
-                        metric_results.append(
-                            {
-                                # Merge statement can include multiple DML operations
-                                # We are padding timestamps by 0,1,2 millisesond to avoid
-                                # duplicate timestamps
-                                "timestamp": int(job.timestamp.timestamp() * 1000)
-                                + indx,
-                                "operation": DML_STAT_TO_DML_STATEMENT_MAPPING.get(key),
-                                "rowsAffected": job.dml_statistics[key],
-                            }
-                        )
-                continue
-
-            metric_results.append(
-                {
-                    "timestamp": int(job.timestamp.timestamp() * 1000),
-                    "operation": job.query_type,
-                    "rowsAffected": rows_affected,
-                }
-            )
+
+        if job.query_type == DatabaseDMLOperations.MERGE.value:
+            for indx, key in enumerate(job.dml_statistics):
+                if job.dml_statistics[key] != 0:
+                    metric_results.append(
+                        {
+                            # Merge statement can include multiple DML operations
+                            # We are padding timestamps by 0,1,2 millisesond to avoid
+                            # duplicate timestamps
+                            "timestamp": int(job.timestamp.timestamp() * 1000)
+                            + indx,
+                            "operation": DML_STAT_TO_DML_STATEMENT_MAPPING.get(key),
+                            "rowsAffected": job.dml_statistics[key],
+                        }
+                    )
+            continue
+
+        metric_results.append(
+            {
+                "timestamp": int(job.timestamp.timestamp() * 1000),
+                "operation": job.query_type,
+                "rowsAffected": rows_affected,
+            }
+        )
 
     return metric_results
 
@@ -214,81 +255,33 @@ def _(
     database = session.get_bind().url.database
     schema = table.__table_args__["schema"]  # type: ignore
 
-    metric_results: List[Dict] = []
-
-    # get inserts ddl queries
-    inserts = get_value_from_cache(
-        SYSTEM_QUERY_RESULT_CACHE, f"{Dialects.Redshift}.{database}.{schema}.inserts"
-    )
-    if not inserts:
-        insert_query = STL_QUERY.format(
-            alias="si",
-            join_type="LEFT",
-            condition="sd.query is null",
-            database=database,
-            schema=schema,
-        )
-        inserts = get_query_results(
-            session,
-            insert_query,
-            DatabaseDMLOperations.INSERT.value,
-        )
-        set_cache(
-            SYSTEM_QUERY_RESULT_CACHE,
-            f"{Dialects.Redshift}.{database}.{schema}.inserts",
-            inserts,
-        )
-    metric_results.extend(get_metric_result(inserts, table.__tablename__))  # type: ignore
+    def _fetch_dml_operations() -> Iterable[QueryResult]:
+        for alias, join_type, condition, operation in (
+            # inserts
+            ("si", "LEFT", "sd.query is null", DatabaseDMLOperations.INSERT),
+            # deletes
+            ("sd", "RIGHT", "si.query is null", DatabaseDMLOperations.DELETE),
+            # updates
+            ("si", "INNER", "sd.query is not null", DatabaseDMLOperations.UPDATE),
+        ):
+            query = STL_QUERY.format(
+                alias=alias,
+                join_type=join_type,
+                condition=condition,
+                database=database,
+                schema=schema,
+            )
+            yield from get_query_results(session, query, operation.value)
 
-    # get deletes ddl queries
-    deletes = get_value_from_cache(
-        SYSTEM_QUERY_RESULT_CACHE, f"{Dialects.Redshift}.{database}.{schema}.deletes"
+    dml_operations = get_schema_system_results(
+        f"{Dialects.Redshift}.{database}.{schema}.dml_operations",
+        _fetch_dml_operations,
+        lambda result: result.table_name,
     )
-    if not deletes:
-        delete_query = STL_QUERY.format(
-            alias="sd",
-            join_type="RIGHT",
-            condition="si.query is null",
-            database=database,
-            schema=schema,
-        )
-        deletes = get_query_results(
-            session,
-            delete_query,
-            DatabaseDMLOperations.DELETE.value,
-        )
-        set_cache(
-            SYSTEM_QUERY_RESULT_CACHE,
-            f"{Dialects.Redshift}.{database}.{schema}.deletes",
-            deletes,
-        )
-    metric_results.extend(get_metric_result(deletes, table.__tablename__))  # type: ignore
 
-    # get updates ddl queries
-    updates = get_value_from_cache(
-        SYSTEM_QUERY_RESULT_CACHE, f"{Dialects.Redshift}.{database}.{schema}.updates"
+    return get_metric_result(
+        dml_operations.get(table.__tablename__, []), table.__tablename__  # type: ignore
     )
-    if not updates:
-        update_query = STL_QUERY.format(
-            alias="si",
-            join_type="INNER",
-            condition="sd.query is not null",
-            database=database,
-            schema=schema,
-        )
-        updates = get_query_results(
-            session,
-            update_query,
-            DatabaseDMLOperations.UPDATE.value,
-        )
-        set_cache(
-            SYSTEM_QUERY_RESULT_CACHE,
-            f"{Dialects.Redshift}.{database}.{schema}.updates",
-            updates,
-        )
-    metric_results.extend(get_metric_result(updates, table.__tablename__))  # type: ignore
-
-    return metric_results
 
 
 @get_system_metrics_for_dialect.register(Dialects.Snowflake)
@@ -299,14 +292,11 @@ def _(
     *args,
     **kwargs,
 ) -> Optional[List[Dict]]:
-    """Fetch system metrics for Snowflake. query_history will return maximum 10K rows in one request.
-    We'll be fetching all the queries ran for the past 24 hours and filtered on specific query types
-    (INSERTS, MERGE, DELETE, UPDATE).
-
-    :waring: Unlike redshift and bigquery results are not cached as we'll be looking
-    at DDL for each table
+    """Fetch system metrics for Snowflake. We'll be fetching all the queries ran
+    for the past 24 hours against the schema and filtered on specific query types
+    (INSERTS, MERGE, DELETE, UPDATE), once for all the tables of the schema.
 
-    To get the number of rows affected we'll use the specific query ID.
+    The number of rows affected comes from the ROWS_* columns of the query history.
 
     Args:
         dialect (str): dialect
@@ -319,40 +309,40 @@ def _(
     database = session.get_bind().url.database
     schema = table.__table_args__["schema"]  # type: ignore
 
-    metric_results: List[Dict] = []
-
-    rows = session.execute(
-        text(
-            INFORMATION_SCHEMA_QUERY.format(
-                tablename=table.__tablename__,  # type: ignore
-                insert=DatabaseDMLOperations.INSERT.value,
-                update=DatabaseDMLOperations.UPDATE.value,
-                delete=DatabaseDMLOperations.DELETE.value,
-                merge=DatabaseDMLOperations.MERGE.value,
+    def _fetch_query_history() -> Iterable[QueryResult]:
+        rows = session.execute(
+            text(
+                INFORMATION_SCHEMA_QUERY.format(
+                    database=database,
+                    schema=schema,
+                    insert=DatabaseDMLOperations.INSERT.value,
+                    update=DatabaseDMLOperations.UPDATE.value,
+                    delete=DatabaseDMLOperations.DELETE.value,
+                    merge=DatabaseDMLOperations.MERGE.value,
+                )
             )
         )
+        for row in rows:
+            result = get_snowflake_system_queries(row, database, schema)
+            if result:
+                yield result
+
+    query_results = get_schema_system_results(
+        f"{Dialects.Snowflake}.{database}.{schema}.queries",
+        _fetch_query_history,
+        lambda result: result.table_name,
     )
-    query_results = []
-    for row in rows:
-        result = get_snowflake_system_queries(row, database, schema)
-        if result:
-            query_results.append(result)
-
-    for query_result in query_results:
-        cursor_for_result_scan = session.execute(
-            text(dedent(RESULT_SCAN.format(query_id=query_result.query_id)))
-        )
-        row_for_result_scan = cursor_for_result_scan.first()
 
-        metric_results.append(
-            {
-                "timestamp": int(query_result.timestamp.timestamp() * 1000),
-                "operation": DML_OPERATION_MAP.get(query_result.query_type),
-                "rowsAffected": row_for_result_scan[0] if row_for_result_scan else None,
-            }
+    return [
+        {
+            "timestamp": int(query_result.timestamp.timestamp() * 1000),
+            "operation": DML_OPERATION_MAP.get(query_result.query_type),
+            "rowsAffected": query_result.rows,
+        }
+        for query_result in query_results.get(
+            table.__tablename__.lower(), []  # type: ignore
         )
-
-    return metric_results
+    ]
 
 
 class System(SystemMetric):
@@ -392,7 +382,7 @@ class System(SystemMetric):
         """
         if deep_size_of_dict(SYSTEM_QUERY_RESULT_CACHE) > max_size_in_bytes:
             logger.debug("Clearing system cache")
-            SYSTEM_QUERY_RESULT_CACHE.clear()
+            clear_system_metrics_cache()
 
     def sql(self, session: Session, **kwargs):
         """Implements the SQL logic to fetch system data"""
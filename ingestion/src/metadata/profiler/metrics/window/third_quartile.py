@@ -14,11 +14,11 @@ Median Metric definition
 """
 # pylint: disable=duplicate-code
 
-from typing import List, cast
-
 from sqlalchemy import column
 
+from metadata.profiler.metrics.accumulator import get_accumulator
 from metadata.profiler.metrics.core import StaticMetric, _label
+from metadata.profiler.orm.functions.approximate import ApproxQuantileFn
 from metadata.profiler.orm.functions.length import LenFn
 from metadata.profiler.orm.functions.median import MedianFn
 from metadata.profiler.orm.registry import is_concatenable, is_quantifiable
@@ -51,11 +51,14 @@ class ThirdQuartile(StaticMetric):
     @_label
     def fn(self):
         """sqlalchemy function"""
+        quantile_fn = ApproxQuantileFn if self.approximate else MedianFn
         if is_quantifiable(self.col.type):
-            return MedianFn(column(self.col.name), self.col.table.fullname, 0.75)
+            return quantile_fn(column(self.col.name), self.col.table.fullname, 0.75)
 
         if is_concatenable(self.col.type):
-            return MedianFn(LenFn(column(self.col.name)), self.col.table.fullname, 0.75)
+            return quantile_fn(
+                LenFn(column(self.col.name)), self.col.table.fullname, 0.75
+            )
 
         logger.debug(
             f"Don't know how to process type {self.col.type} when computing Third Quartile"
@@ -64,26 +67,8 @@ class ThirdQuartile(StaticMetric):
 
     def df_fn(self, dfs=None):
         """Dataframe function"""
-        # pylint: disable=import-outside-toplevel
-        import pandas as pd
-
-        df = cast(List[pd.DataFrame], dfs)
-
         if is_quantifiable(self.col.type):
-            # we can't compute the median unless we have
-            # the entire set. Median of Medians could be used
-            # though it would required set to be sorted before hand
-            try:
-                df = pd.concat(dfs)
-            except MemoryError:
-                logger.error(
-                    f"Unable to compute Median for {self.col.name} due to memory constraints."
-                    f"We recommend using a smaller sample size or partitionning."
-                )
-                return None
-            # check if nan
-            third_quartile = df[self.col.name].quantile(0.75, interpolation="midpoint")
-            return None if pd.isnull(third_quartile) else third_quartile
+            return get_accumulator(dfs, self.col.name).quantile(0.75)
         logger.debug(
             f"Don't know how to process type {self.col.type} when computing Third Quartile"
         )
@@ -0,0 +1,177 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define the approximate distinct count and quantile functions.
+
+They compile to the sketches of each database (HyperLogLog for
+distinct counts, t-digest or KLL for quantiles). Dialects without
+them compile to the exact computation.
+"""
+# Keep SQA docs style defining custom constructs
+# pylint: disable=consider-using-f-string,duplicate-code
+from sqlalchemy import distinct, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from metadata.profiler.metrics.core import CACHE
+from metadata.profiler.orm.functions.median import MedianFn
+from metadata.profiler.orm.registry import Dialects
+
+APPROX_DISTINCT_DIALECTS = {
+    Dialects.Athena,
+    Dialects.BigQuery,
+    Dialects.ClickHouse,
+    Dialects.Databricks,
+    Dialects.Impala,
+    Dialects.Oracle,
+    Dialects.Presto,
+    Dialects.Redshift,
+    Dialects.Snowflake,
+    Dialects.Trino,
+    Dialects.Vertica,
+}
+
+APPROX_QUANTILE_DIALECTS = {
+    Dialects.Athena,
+    Dialects.BigQuery,
+    Dialects.ClickHouse,
+    Dialects.Databricks,
+    Dialects.Oracle,
+    Dialects.Presto,
+    Dialects.Redshift,
+    Dialects.Snowflake,
+    Dialects.Trino,
+}
+
+
+class ApproxCountDistinctFn(FunctionElement):
+    inherit_cache = CACHE
+
+
+@compiles(ApproxCountDistinctFn)
+def _(elements, compiler, **kwargs):
+    """Exact distinct count for dialects without sketches"""
+    return compiler.process(func.count(distinct(elements.clauses.clauses[0])), **kwargs)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.BigQuery)
+@compiles(ApproxCountDistinctFn, Dialects.Oracle)
+@compiles(ApproxCountDistinctFn, Dialects.Snowflake)
+def _(elements, compiler, **kwargs):
+    return "APPROX_COUNT_DISTINCT(%s)" % compiler.process(elements.clauses, **kwargs)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Athena)
+@compiles(ApproxCountDistinctFn, Dialects.Presto)
+@compiles(ApproxCountDistinctFn, Dialects.Trino)
+def _(elements, compiler, **kwargs):
+    return "approx_distinct(%s)" % compiler.process(elements.clauses, **kwargs)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.ClickHouse)
+def _(elements, compiler, **kwargs):
+    return "uniq(%s)" % compiler.process(elements.clauses, **kwargs)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Databricks)
+def _(elements, compiler, **kwargs):
+    return "approx_count_distinct(%s)" % compiler.process(elements.clauses, **kwargs)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Impala)
+def _(elements, compiler, **kwargs):
+    return "NDV(%s)" % compiler.process(elements.clauses, **kwargs)
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Redshift)
+def _(elements, compiler, **kwargs):
+    return "APPROXIMATE COUNT(DISTINCT %s)" % compiler.process(
+        elements.clauses, **kwargs
+    )
+
+
+@compiles(ApproxCountDistinctFn, Dialects.Vertica)
+def _(elements, compiler, **kwargs):
+    return "APPROXIMATE_COUNT_DISTINCT(%s)" % compiler.process(
+        elements.clauses, **kwargs
+    )
+
+
+class ApproxQuantileFn(FunctionElement):
+    """Takes the same arguments as MedianFn: column, table and percentile"""
+
+    inherit_cache = CACHE
+
+
+@compiles(ApproxQuantileFn)
+def _(elements, compiler, **kwargs):
+    """Exact quantile for dialects without sketches"""
+    return compiler.process(MedianFn(*elements.clauses.clauses), **kwargs)
+
+
+@compiles(ApproxQuantileFn, Dialects.BigQuery)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "APPROX_QUANTILES(%s, 100)[OFFSET(%d)]" % (col, round(percentile * 100))
+
+
+@compiles(ApproxQuantileFn, Dialects.Snowflake)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "APPROX_PERCENTILE(%s, %.2f)" % (col, percentile)
+
+
+@compiles(ApproxQuantileFn, Dialects.Athena)
+@compiles(ApproxQuantileFn, Dialects.Presto)
+@compiles(ApproxQuantileFn, Dialects.Trino)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "approx_percentile(%s, %.2f)" % (col, percentile)
+
+
+@compiles(ApproxQuantileFn, Dialects.Databricks)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "percentile_approx(%s, %.2f)" % (col, percentile)
+
+
+@compiles(ApproxQuantileFn, Dialects.ClickHouse)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "if(isNaN(quantileTDigest(%.2f)(%s)),null,quantileTDigest(%.2f)(%s))" % (
+        (percentile, col) * 2
+    )
+
+
+@compiles(ApproxQuantileFn, Dialects.Oracle)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "APPROX_PERCENTILE(%.2f) WITHIN GROUP (ORDER BY %s ASC)" % (
+        percentile,
+        col,
+    )
+
+
+@compiles(ApproxQuantileFn, Dialects.Redshift)
+def _(elements, compiler, **kwargs):
+    col = compiler.process(elements.clauses.clauses[0], **kwargs)
+    percentile = elements.clauses.clauses[2].value
+    return "APPROXIMATE PERCENTILE_DISC(%.2f) WITHIN GROUP (ORDER BY %s ASC)" % (
+        percentile,
+        col,
+    )
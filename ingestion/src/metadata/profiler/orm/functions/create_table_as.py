@@ -0,0 +1,93 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Define a CREATE TABLE ... AS SELECT construct,
+used to materialize the profiler sample
+"""
+# Keep SQA docs style defining custom constructs
+# pylint: disable=duplicate-code
+
+import time
+from uuid import uuid4
+
+from sqlalchemy import Table
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.ddl import DDLElement
+
+from metadata.profiler.orm.registry import Dialects
+from metadata.utils.logger import profiler_logger
+
+logger = profiler_logger()
+
+# Dialects whose temporary tables are visible to the other connections
+# of the profiler and dropped by the database when the creating one closes
+TEMPORARY_SAMPLE_DIALECTS = {Dialects.MSSQL}
+
+# Prefix the samples with the start of the run, so that the ones left
+# behind by a dead process can be traced back to it. They are only
+# dropped from the registry of the samples created by the profiler.
+MATERIALIZED_SAMPLE_PREFIX = "om_sample_"
+MATERIALIZED_SAMPLE_TTL_SECONDS = 24 * 60 * 60
+RUN_START = int(time.time())
+
+
+class CreateTableAs(DDLElement):
+    """Create `table` with the results of `select`"""
+
+    def __init__(self, table: Table, select: Select):
+        self.table = table
+        self.select = select
+
+
+def _compile_select(element, compiler):
+    return compiler.sql_compiler.process(element.select, literal_binds=True)
+
+
+@compiles(CreateTableAs)
+def _(element, compiler, **_):
+    """Generic CTAS"""
+    table = compiler.preparer.format_table(element.table)
+    return f"CREATE TABLE {table} AS {_compile_select(element, compiler)}"
+
+
+@compiles(CreateTableAs, Dialects.Snowflake)
+def _(element, compiler, **_):
+    """Skip the Fail-safe storage of a throwaway table"""
+    table = compiler.preparer.format_table(element.table)
+    return f"CREATE TRANSIENT TABLE {table} AS {_compile_select(element, compiler)}"
+
+
+@compiles(CreateTableAs, Dialects.Redshift)
+def _(element, compiler, **_):
+    """Skip the snapshots of a throwaway table"""
+    table = compiler.preparer.format_table(element.table)
+    return f"CREATE TABLE {table} BACKUP NO AS {_compile_select(element, compiler)}"
+
+
+@compiles(CreateTableAs, Dialects.MSSQL)
+def _(element, compiler, **_):
+    """SQL Server has no CTAS, but SELECT ... INTO"""
+    table = compiler.preparer.format_table(element.table)
+    return (
+        f"SELECT * INTO {table}"
+        f" FROM ({_compile_select(element, compiler)}) AS om_sample"
+    )
+
+
+def get_materialized_sample_name(temporary: bool = False) -> str:
+    """Name of a new materialized sample of the current run.
+    SQL Server global temporary tables are prefixed with ##
+    """
+    name = f"{MATERIALIZED_SAMPLE_PREFIX}{RUN_START}_{uuid4().hex[:8]}"
+    return f"##{name}" if temporary else name
+
@@ -45,6 +45,7 @@ from metadata.profiler.metrics.core import (
     StaticMetric,
     SystemMetric,
     TMetric,
+    add_props,
 )
 from metadata.profiler.metrics.registry import Metrics
 from metadata.profiler.metrics.static.row_count import RowCount
@@ -92,7 +93,12 @@ class Profiler(Generic[TMetric]):
         self.profiler_interface = profiler_interface
         self.include_columns = include_columns
         self.exclude_columns = exclude_columns
-        self._metrics = metrics
+        self._metrics = tuple(
+            add_props(approximate=True)(metric)
+            if metric.name() in self.profiler_interface.approximate_metrics
+            else metric
+            for metric in metrics
+        )
         self._profile_date = profile_date
         self.profile_sample_config = self.profiler_interface.profile_sample_config
 
@@ -253,10 +259,10 @@ class Profiler(Generic[TMetric]):
             )
 
             if metric_names:
+                # Match by name to keep the metrics set up for the profiler,
+                # e.g., the approximate ones
                 metrics = [
-                    Metric.value
-                    for Metric in Metrics
-                    if Metric.value.name() in metric_names and Metric.value in metrics
+                    metric for metric in metrics if metric.name() in metric_names
                 ]
 
         return [metric for metric in metrics if metric.is_col_metric()]
@@ -517,6 +523,17 @@ class Profiler(Generic[TMetric]):
             )
             logger.debug(traceback.format_exc())
 
+    def _mark_approximate_metrics(self, column_results: Dict[str, Any]) -> Dict:
+        """Record the metrics of the column computed with approximate functions"""
+        approximate_metrics = sorted(
+            name
+            for name in self.profiler_interface.approximate_metrics
+            if column_results.get(name) is not None
+        )
+        if approximate_metrics:
+            return {**column_results, "approximateMetrics": approximate_metrics}
+        return column_results
+
     def get_profile(self) -> CreateTableProfileRequest:
         """
         After executing the profiler, get all results
@@ -546,10 +563,12 @@ class Profiler(Generic[TMetric]):
             # Let's filter those out.
             column_profile = [
                 ColumnProfile(
-                    **self.column_results.get(
-                        col.name
-                        if not isinstance(col.name, ColumnName)
-                        else col.name.__root__
+                    **self._mark_approximate_metrics(
+                        self.column_results.get(
+                            col.name
+                            if not isinstance(col.name, ColumnName)
+                            else col.name.__root__
+                        )
                     )
                 )
                 for col in self.columns
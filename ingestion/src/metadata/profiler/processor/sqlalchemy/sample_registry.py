@@ -0,0 +1,98 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Registry of the materialized samples created by the profiler.
+
+Runs that die before dropping their samples leave them behind.
+Only the tables recorded here are dropped by the next runs, so that
+no table is ever dropped based on its name alone.
+"""
+import os
+import sqlite3
+import tempfile
+import time
+from threading import Lock
+from typing import List, Optional
+
+from metadata.profiler.orm.functions.create_table_as import (
+    MATERIALIZED_SAMPLE_TTL_SECONDS,
+    RUN_START,
+)
+
+SAMPLE_REGISTRY_PATH = os.path.join(
+    tempfile.gettempdir(), "openmetadata_materialized_samples.db"
+)
+
+
+class MaterializedSampleRegistry:
+    """
+    Keeps in a local sqlite file the samples created by each run,
+    until they are dropped. The samples of runs started more than
+    MATERIALIZED_SAMPLE_TTL_SECONDS ago are stale.
+    """
+
+    def __init__(self, path: str):
+        self.lock = Lock()
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS samples ("
+            "location TEXT NOT NULL, schema_name TEXT NOT NULL, name TEXT NOT NULL,"
+            " run_start INTEGER NOT NULL, PRIMARY KEY (location, schema_name, name))"
+        )
+
+    def add(self, location: str, schema: Optional[str], name: str) -> None:
+        """Record a sample created by the current run"""
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?)",
+                (location, schema or "", name, RUN_START),
+            )
+
+    def remove(self, location: str, schema: Optional[str], name: str) -> None:
+        """Forget a sample once it is dropped"""
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM samples"
+                " WHERE location = ? AND schema_name = ? AND name = ?",
+                (location, schema or "", name),
+            )
+
+    def get_stale(
+        self, location: str, schema: Optional[str], now: Optional[int] = None
+    ) -> List[str]:
+        """Names of the samples left in `schema` by old runs"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT name FROM samples WHERE location = ? AND schema_name = ?"
+                " AND run_start != ? AND run_start < ?",
+                (
+                    location,
+                    schema or "",
+                    RUN_START,
+                    (now or int(time.time())) - MATERIALIZED_SAMPLE_TTL_SECONDS,
+                ),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+_registry: Optional[MaterializedSampleRegistry] = None
+_registry_lock = Lock()
+
+
+def get_materialized_sample_registry() -> MaterializedSampleRegistry:
+    """Registry shared by all the profiler interfaces of the process"""
+    global _registry  # pylint: disable=global-statement
+    with _registry_lock:
+        if _registry is None:
+            _registry = MaterializedSampleRegistry(SAMPLE_REGISTRY_PATH)
+        return _registry
@@ -0,0 +1,192 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Snapshot of the tables of a Database Service.
+
+Lineage, usage and dbt resolve the table names found in queries and
+manifests. Instead of an ES search and an API call for each of them,
+a CatalogIndex lists the tables of the service once and answers the
+lookups locally. It is stored in sqlite, in memory or in a file that
+can be reused by the next runs.
+"""
+import sqlite3
+import time
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.utils.logger import utils_logger
+from metadata.utils.lru_cache import LRUCache
+
+logger = utils_logger()
+
+LRU_CACHE_SIZE = 4096
+WILDCARD = "*"
+# Map the file in memory instead of reading it page by page
+MMAP_SIZE = 1 << 30
+
+
+class CatalogIndex:
+    """
+    Tables of a service, keyed by lowercase database, schema and table name
+    """
+
+    def __init__(self, service_name: str, path: str = ":memory:"):
+        self.service_name = service_name
+        self.lock = Lock()
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS tables ("
+            "database TEXT, schema TEXT, name TEXT NOT NULL, entity TEXT NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS tables_name ON tables (name)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshot ("
+            "service TEXT PRIMARY KEY, built_at REAL NOT NULL)"
+        )
+        self._results = LRUCache(LRU_CACHE_SIZE)
+
+    @property
+    def built_at(self) -> Optional[float]:
+        """Time the snapshot of the service was taken, if any"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT built_at FROM snapshot WHERE service = ?",
+                (self.service_name,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def build(self, metadata: OpenMetadata) -> None:
+        """
+        List the tables of the service, with their columns, and replace
+        the current snapshot
+        """
+        start = time.time()
+        tables = metadata.list_all_entities(
+            entity=Table,
+            fields=["columns"],
+            params={"service": self.service_name},
+        )
+        self.load(tables, built_at=start)
+        logger.info(
+            f"Indexed {len(self)} tables of service [{self.service_name}]"
+            f" in {time.time() - start:.1f} seconds"
+        )
+
+    def load(self, tables: Iterable[Table], built_at: Optional[float] = None) -> None:
+        """Replace the current snapshot with the given tables"""
+        rows = (
+            (
+                _lower_name(table.database),
+                _lower_name(table.databaseSchema),
+                table.name.__root__.lower(),
+                table.json(exclude_none=True),
+            )
+            for table in tables
+        )
+        with self.lock:
+            self.connection.execute("BEGIN")
+            # A file holds the snapshot of a single service
+            self.connection.execute("DELETE FROM tables")
+            self.connection.execute("DELETE FROM snapshot")
+            self.connection.executemany("INSERT INTO tables VALUES (?, ?, ?, ?)", rows)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO snapshot VALUES (?, ?)",
+                (self.service_name, built_at or time.time()),
+            )
+            self.connection.execute("COMMIT")
+            self._results = LRUCache(LRU_CACHE_SIZE)
+
+    def search(
+        self,
+        database: Optional[str],
+        schema: Optional[str],
+        table: str,
+    ) -> List[Table]:
+        """
+        Tables matching the names, case insensitive.
+        A missing database or schema, or `*`, matches any.
+        """
+        key = tuple(
+            name.lower() if name and name != WILDCARD else None
+            for name in (database, schema, table)
+        )
+        with self.lock:
+            if key in self._results:
+                return self._results.get(key)
+
+            query = "SELECT database, schema, entity FROM tables WHERE name = ?"
+            rows = self.connection.execute(query, (key[2],)).fetchall()
+            result = [
+                Table.parse_raw(entity)
+                for row_database, row_schema, entity in rows
+                if key[0] in (None, row_database) and key[1] in (None, row_schema)
+            ]
+            self._results.put(key, result)
+        return result
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM tables").fetchone()[0]
+
+
+def _lower_name(reference: Optional[EntityReference]) -> Optional[str]:
+    return reference.name.lower() if reference and reference.name else None
+
+
+_catalog_indexes: Dict[str, CatalogIndex] = {}
+
+
+def get_catalog_index(service_name: Optional[str]) -> Optional[CatalogIndex]:
+    """Snapshot of the service, if the workflow took one"""
+    return _catalog_indexes.get(service_name) if service_name else None
+
+
+def create_catalog_index(
+    metadata: OpenMetadata,
+    service_name: str,
+    path: Optional[str] = None,
+    max_age: Optional[float] = None,
+) -> CatalogIndex:
+    """
+    Take a snapshot of the tables of the service, and use it to
+    resolve table names from now on. A snapshot stored in `path`
+    is reused if it is younger than `max_age` seconds.
+    """
+    catalog_index = CatalogIndex(service_name, path or ":memory:")
+    built_at = catalog_index.built_at
+    if built_at and max_age and time.time() - built_at < max_age:
+        logger.info(
+            f"Reusing the snapshot of {len(catalog_index)} tables"
+            f" of service [{service_name}] from {path}"
+        )
+    else:
+        catalog_index.build(metadata)
+    _catalog_indexes[service_name] = catalog_index
+    return catalog_index
+
+
+def close_catalog_index(service_name: str) -> None:
+    """Stop using the snapshot of the service"""
+    catalog_index = _catalog_indexes.pop(service_name, None)
+    if catalog_index:
+        catalog_index.close()
@@ -17,7 +17,7 @@ from Avro file formats
 
 import io
 from functools import singledispatch
-from typing import Any
+from typing import Any, Iterator, List, Optional
 
 from avro.datafile import DataFileReader
 from avro.errors import InvalidAvroBinaryEncoding
@@ -39,8 +39,10 @@ from metadata.parsers.avro_parser import parse_avro_schema
 from metadata.utils.constants import UTF_8
 from metadata.utils.datalake.common import (
     DatalakeFileFormatException,
-    dataframe_to_chunks,
+    get_chunk_size,
+    read_chunks,
 )
+from metadata.utils.helpers import batched
 from metadata.utils.logger import utils_logger
 
 logger = utils_logger()
@@ -86,6 +88,42 @@ def read_from_avro(
         return DatalakeColumnWrapper(columns=columns, dataframes=DataFrame(field_map))
 
 
+def read_avro_chunks(
+    avro_text: bytes,
+    columns: Optional[List[str]] = None,
+    nrows: Optional[int] = None,
+    sample_fraction: Optional[float] = None,
+    sample_rows: Optional[int] = None,
+    seed: Optional[int] = None,
+    **_,
+) -> Iterator:
+    """
+    Decode the avro records in chunks, only building
+    a dataframe for the records being requested
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import DataFrame
+
+    try:
+        elements = DataFileReader(io.BytesIO(avro_text), DatumReader())
+    except (AssertionError, InvalidAvroBinaryEncoding):
+        # Schema files without any data
+        yield read_from_avro(avro_text).dataframes
+        return
+
+    yield from read_chunks(
+        (
+            DataFrame.from_records(records)
+            for records in batched(elements, get_chunk_size(nrows))
+        ),
+        columns=columns,
+        nrows=nrows,
+        sample_fraction=sample_fraction,
+        sample_rows=sample_rows,
+        seed=seed,
+    )
+
+
 @singledispatch
 def read_avro_dispatch(config_source: Any, key: str, **kwargs):
     raise DatalakeFileFormatException(config_source=config_source, file_name=key)
@@ -97,17 +135,17 @@ def _(_: GCSConfig, key: str, bucket_name: str, client, **kwargs):
     Read the avro file from the gcs bucket and return a dataframe
     """
     avro_text = client.get_bucket(bucket_name).get_blob(key).download_as_string()
-    return dataframe_to_chunks(read_from_avro(avro_text).dataframes)
+    return read_avro_chunks(avro_text, **kwargs)
 
 
 @read_avro_dispatch.register
 def _(_: S3Config, key: str, bucket_name: str, client, **kwargs):
     avro_text = client.get_object(Bucket=bucket_name, Key=key)["Body"].read()
-    return dataframe_to_chunks(read_from_avro(avro_text).dataframes)
+    return read_avro_chunks(avro_text, **kwargs)
 
 
 @read_avro_dispatch.register
 def _(_: AzureConfig, key: str, bucket_name: str, client, **kwargs):
     container_client = client.get_container_client(bucket_name)
     avro_text = container_client.get_blob_client(key).download_blob().readall()
-    return dataframe_to_chunks(read_from_avro(avro_text).dataframes)
+    return read_avro_chunks(avro_text, **kwargs)
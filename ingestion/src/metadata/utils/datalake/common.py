@@ -12,12 +12,16 @@
 """
 Module to define Datalake Exceptions
 """
-from typing import Any, Dict
+import random
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from metadata.utils.constants import CHUNKSIZE
 
 AZURE_PATH = "abfs://{bucket_name}@{account_name}.dfs.core.windows.net/{key}"
 
+# Rows read from a file to infer its schema
+SCHEMA_SAMPLE_ROWS = 10000
+
 
 class DatalakeFileFormatException(Exception):
     def __init__(self, config_source: Any, file_name: str) -> None:
@@ -43,3 +47,77 @@ def dataframe_to_chunks(df):
         df[range_iter : range_iter + CHUNKSIZE]
         for range_iter in range(0, len(df), CHUNKSIZE)
     ]
+
+
+def get_chunk_size(nrows: Optional[int] = None) -> int:
+    """Rows to read at once, without reading more than `nrows`"""
+    return min(CHUNKSIZE, nrows) if nrows else CHUNKSIZE
+
+
+def read_chunks(
+    chunks: Iterable,
+    columns: Optional[List[str]] = None,
+    nrows: Optional[int] = None,
+    sample_fraction: Optional[float] = None,
+    sample_rows: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Iterator:
+    """
+    Lazily filter the dataframes read from a file: keep only
+    the `columns`, stop after `nrows` rows and keep a random
+    `sample_fraction` of each chunk, or `sample_rows` rows of the file.
+    The file is only read as the chunks are requested.
+
+    The samples only depend on the `seed`, so that reading the
+    file again with the same seed gives the same rows.
+    """
+    rng = random.Random(seed)
+    read_rows = 0
+
+    def filter_chunks() -> Iterator:
+        nonlocal read_rows
+        for chunk in chunks:
+            if columns:
+                chunk = chunk[[column for column in chunk.columns if column in columns]]
+            if nrows:
+                chunk = chunk[: nrows - read_rows]
+                read_rows += len(chunk)
+            if sample_fraction and sample_fraction < 1:
+                chunk = chunk.sample(
+                    frac=sample_fraction,
+                    random_state=rng.randrange(2**32),
+                    replace=True,
+                )
+            yield chunk
+            if nrows and read_rows >= nrows:
+                return
+
+    if sample_rows:
+        yield from sample_chunk_rows(filter_chunks(), sample_rows, rng.randrange(2**32))
+    else:
+        yield from filter_chunks()
+
+
+def sample_chunk_rows(chunks: Iterable, sample_rows: int, seed: int) -> Iterator:
+    """
+    Uniform sample of `sample_rows` rows of the chunks, without replacement,
+    holding at most the sample and a chunk in memory: each row gets a random
+    key, and the rows with the smallest keys are kept.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    sample, sample_keys = None, None
+    for chunk in chunks:
+        keys = rng.random(len(chunk))
+        if sample is not None:
+            chunk = pd.concat([sample, chunk])
+            keys = np.concatenate([sample_keys, keys])
+        if len(chunk) > sample_rows:
+            kept = np.argpartition(keys, sample_rows)[:sample_rows]
+            chunk, keys = chunk.iloc[kept], keys[kept]
+        sample, sample_keys = chunk, keys
+    if sample is not None:
+        yield from dataframe_to_chunks(sample)
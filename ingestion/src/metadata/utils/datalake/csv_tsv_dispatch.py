@@ -14,7 +14,7 @@ Module to define helper methods for datalake and to fetch data and metadata
 from Csv and Tsv file formats
 """
 from functools import singledispatch
-from typing import Any
+from typing import Any, Iterator, List, Optional
 
 from metadata.generated.schema.entity.services.connections.database.datalake.azureConfig import (
     AzureConfig,
@@ -25,10 +25,11 @@ from metadata.generated.schema.entity.services.connections.database.datalake.gcs
 from metadata.generated.schema.entity.services.connections.database.datalake.s3Config import (
     S3Config,
 )
-from metadata.utils.constants import CHUNKSIZE
 from metadata.utils.datalake.common import (
     AZURE_PATH,
     DatalakeFileFormatException,
+    get_chunk_size,
+    read_chunks,
     return_azure_storage_options,
 )
 from metadata.utils.logger import utils_logger
@@ -39,16 +40,37 @@ TSV_SEPARATOR = "\t"
 CSV_SEPARATOR = ","
 
 
-def read_from_pandas(path: str, separator: str, storage_options=None):
+def read_from_pandas(
+    path: str,
+    separator: str,
+    storage_options=None,
+    columns: Optional[List[str]] = None,
+    nrows: Optional[int] = None,
+    sample_fraction: Optional[float] = None,
+    sample_rows: Optional[int] = None,
+    seed: Optional[int] = None,
+    **_,
+) -> Iterator:
+    """
+    Read the file in chunks, only parsing the `columns`
+    and the first `nrows` rows, if given
+    """
     import pandas as pd  # pylint: disable=import-outside-toplevel
 
-    chunk_list = []
     with pd.read_csv(
-        path, sep=separator, chunksize=CHUNKSIZE, storage_options=storage_options
+        path,
+        sep=separator,
+        chunksize=get_chunk_size(nrows),
+        nrows=nrows,
+        usecols=(lambda column: column in columns) if columns else None,
+        storage_options=storage_options,
     ) as reader:
-        for chunks in reader:
-            chunk_list.append(chunks)
-    return chunk_list
+        yield from read_chunks(
+            reader,
+            sample_fraction=sample_fraction,
+            sample_rows=sample_rows,
+            seed=seed,
+        )
 
 
 @singledispatch
@@ -67,13 +89,13 @@ def _(_: GCSConfig, key: str, bucket_name: str, **kwargs):
     Read the CSV file from the gcs bucket and return a dataframe
     """
     path = f"gs://{bucket_name}/{key}"
-    return read_from_pandas(path=path, separator=CSV_SEPARATOR)
+    return read_from_pandas(path=path, separator=CSV_SEPARATOR, **kwargs)
 
 
 @read_csv_dispatch.register
 def _(_: S3Config, key: str, bucket_name: str, client, **kwargs):
     path = client.get_object(Bucket=bucket_name, Key=key)["Body"]
-    return read_from_pandas(path=path, separator=CSV_SEPARATOR)
+    return read_from_pandas(path=path, separator=CSV_SEPARATOR, **kwargs)
 
 
 @read_csv_dispatch.register
@@ -88,6 +110,7 @@ def _(config_source: AzureConfig, key: str, bucket_name: str, **kwargs):
         path=path,
         separator=CSV_SEPARATOR,
         storage_options=storage_options,
+        **kwargs,
     )
 
 
@@ -97,13 +120,13 @@ def _(_: GCSConfig, key: str, bucket_name: str, **kwargs):
     Read the TSV file from the gcs bucket and return a dataframe
     """
     path = f"gs://{bucket_name}/{key}"
-    return read_from_pandas(path=path, separator=TSV_SEPARATOR)
+    return read_from_pandas(path=path, separator=TSV_SEPARATOR, **kwargs)
 
 
 @read_tsv_dispatch.register
 def _(_: S3Config, key: str, bucket_name: str, client, **kwargs):
     path = client.get_object(Bucket=bucket_name, Key=key)["Body"]
-    return read_from_pandas(path=path, separator=TSV_SEPARATOR)
+    return read_from_pandas(path=path, separator=TSV_SEPARATOR, **kwargs)
 
 
 @read_tsv_dispatch.register
@@ -120,4 +143,5 @@ def _(config_source: AzureConfig, key: str, bucket_name: str, **kwargs):
         path=path,
         separator=TSV_SEPARATOR,
         storage_options=storage_options,
+        **kwargs,
     )
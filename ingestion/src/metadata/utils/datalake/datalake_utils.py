@@ -16,6 +16,7 @@ from different auths and different file systems.
 
 
 from enum import Enum
+from itertools import chain
 
 from metadata.ingestion.source.database.datalake.models import (
     DatalakeTableSchemaWrapper,
@@ -67,6 +68,18 @@ def fetch_dataframe(
 ):
     """
     Method to get dataframe for profiling
+
+    The file is read in chunks, and the optional kwargs are applied
+    while reading it:
+    - columns: only read these columns
+    - nrows: stop after the first rows, e.g. to infer the schema
+    - sample_fraction: only keep a random fraction of the rows
+    - sample_rows: only keep a random sample of this many rows
+    - seed: seed of the random samples, to read the same rows again
+
+    The chunks are returned as a generator, so that only the chunk
+    being processed is held in memory. The first chunk is read upfront
+    to report the files that cannot be read, and empty files give None.
     """
     # dispatch to handle fetching of data from multiple file formats (csv, tsv, json, avro and parquet)
     key: str = file_fqn.key
@@ -75,13 +88,19 @@ def fetch_dataframe(
     try:
         for supported_types_enum in SupportedTypes:
             if key.endswith(supported_types_enum.value):
-                return supported_types_enum.return_dispatch(
-                    config_source,
-                    key=key,
-                    bucket_name=bucket_name,
-                    client=client,
-                    **kwargs,
+                chunks = iter(
+                    supported_types_enum.return_dispatch(
+                        config_source,
+                        key=key,
+                        bucket_name=bucket_name,
+                        client=client,
+                        **kwargs,
+                    )
                 )
+                first_chunk = next(chunks, None)
+                if first_chunk is None:
+                    return None
+                return chain([first_chunk], chunks)
     except Exception as err:
         logger.error(
             f"Error fetching file {bucket_name}/{key} using {config_source.__class__.__name__} due to: {err}"
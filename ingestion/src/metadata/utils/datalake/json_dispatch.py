@@ -18,7 +18,7 @@ import io
 import json
 import zipfile
 from functools import singledispatch
-from typing import Any, List
+from typing import Any, Iterator, Optional
 
 from metadata.generated.schema.entity.services.connections.database.datalake.azureConfig import (
     AzureConfig,
@@ -30,7 +30,13 @@ from metadata.generated.schema.entity.services.connections.database.datalake.s3C
     S3Config,
 )
 from metadata.utils.constants import COMPLEX_COLUMN_SEPARATOR, UTF_8
-from metadata.utils.datalake.common import DatalakeFileFormatException
+from metadata.utils.datalake.common import (
+    DatalakeFileFormatException,
+    dataframe_to_chunks,
+    get_chunk_size,
+    read_chunks,
+)
+from metadata.utils.helpers import batched
 from metadata.utils.logger import utils_logger
 
 logger = utils_logger()
@@ -47,27 +53,60 @@ def _get_json_text(key: str, text: bytes, decode: bool) -> str:
     return text
 
 
-def read_from_json(
-    key: str, json_text: str, decode: bool = False, is_profiler: bool = False, **_
-) -> List:
+def _iter_json_lines(json_text) -> Iterator[Any]:
+    """Parse the JSON Lines one at a time, without splitting the whole text"""
+    if isinstance(json_text, str):
+        lines = io.StringIO(json_text)
+    else:
+        lines = io.BytesIO(json_text)
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_json_chunks(
+    key: str,
+    json_text: str,
+    decode: bool = False,
+    is_profiler: bool = False,
+    nrows: Optional[int] = None,
+    sample_fraction: Optional[float] = None,
+    sample_rows: Optional[int] = None,
+    seed: Optional[int] = None,
+    **_,
+) -> Iterator:
     """
-    Read the json file from the azure container and return a dataframe
+    Read the json file and return its dataframes as they are requested.
+    JSON Lines files are normalized one chunk of lines at a time.
     """
 
     # pylint: disable=import-outside-toplevel
     from pandas import json_normalize
 
-    from metadata.utils.datalake.common import dataframe_to_chunks
+    def normalize(data):
+        if is_profiler:
+            return json_normalize(data)
+        return json_normalize(data, sep=COMPLEX_COLUMN_SEPARATOR)
 
     json_text = _get_json_text(key, json_text, decode)
     try:
         data = json.loads(json_text)
+        if nrows and isinstance(data, list):
+            data = data[:nrows]
+        chunks = dataframe_to_chunks(normalize(data))
     except json.decoder.JSONDecodeError:
         logger.debug("Failed to read as JSON object. Trying to read as JSON Lines")
-        data = [json.loads(json_obj) for json_obj in json_text.strip().split("\n")]
-    if is_profiler:
-        return dataframe_to_chunks(json_normalize(data))
-    return dataframe_to_chunks(json_normalize(data, sep=COMPLEX_COLUMN_SEPARATOR))
+        chunks = (
+            normalize(lines)
+            for lines in batched(_iter_json_lines(json_text), get_chunk_size(nrows))
+        )
+    yield from read_chunks(
+        chunks,
+        nrows=nrows,
+        sample_fraction=sample_fraction,
+        sample_rows=sample_rows,
+        seed=seed,
+    )
 
 
 @singledispatch
@@ -81,17 +120,17 @@ def _(_: GCSConfig, key: str, bucket_name: str, client, **kwargs):
     Read the json file from the gcs bucket and return a dataframe
     """
     json_text = client.get_bucket(bucket_name).get_blob(key).download_as_string()
-    return read_from_json(key=key, json_text=json_text, decode=True, **kwargs)
+    return read_json_chunks(key=key, json_text=json_text, decode=True, **kwargs)
 
 
 @read_json_dispatch.register
 def _(_: S3Config, key: str, bucket_name: str, client, **kwargs):
     json_text = client.get_object(Bucket=bucket_name, Key=key)["Body"].read()
-    return read_from_json(key=key, json_text=json_text, decode=True, **kwargs)
+    return read_json_chunks(key=key, json_text=json_text, decode=True, **kwargs)
 
 
 @read_json_dispatch.register
 def _(_: AzureConfig, key: str, bucket_name: str, client, **kwargs):
     container_client = client.get_container_client(bucket_name)
     json_text = container_client.get_blob_client(key).download_blob().readall()
-    return read_from_json(key=key, json_text=json_text, decode=True, **kwargs)
+    return read_json_chunks(key=key, json_text=json_text, decode=True, **kwargs)
@@ -15,8 +15,9 @@ from Parquet file formats
 """
 
 
+import random
 from functools import singledispatch
-from typing import Any
+from typing import Any, Iterator, List, Optional
 
 from metadata.generated.schema.entity.services.connections.database.datalake.azureConfig import (
     AzureConfig,
@@ -30,7 +31,8 @@ from metadata.generated.schema.entity.services.connections.database.datalake.s3C
 from metadata.utils.datalake.common import (
     AZURE_PATH,
     DatalakeFileFormatException,
-    dataframe_to_chunks,
+    get_chunk_size,
+    read_chunks,
     return_azure_storage_options,
 )
 from metadata.utils.logger import utils_logger
@@ -38,6 +40,63 @@ from metadata.utils.logger import utils_logger
 logger = utils_logger()
 
 
+def read_parquet_file(
+    file,
+    columns: Optional[List[str]] = None,
+    nrows: Optional[int] = None,
+    sample_fraction: Optional[float] = None,
+    sample_rows: Optional[int] = None,
+    seed: Optional[int] = None,
+    **_,
+) -> Iterator:
+    """
+    Read the parquet file in batches. Only the footer is read upfront:
+    the row groups are fetched as the batches are requested, and only
+    for the `columns`, if given.
+
+    With a `sample_fraction`, a random subset of the row groups is read
+    instead of the whole file. Files with a single row group are sampled
+    by rows. With `sample_rows`, random row groups are read until they
+    hold enough rows, and the rows are sampled from them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pyarrow.parquet import ParquetFile
+
+    parquet_file = ParquetFile(file)
+    if columns:
+        columns = [name for name in parquet_file.schema_arrow.names if name in columns]
+
+    rng = random.Random(seed)
+    row_groups = None
+    num_row_groups = parquet_file.num_row_groups
+    if sample_rows and not nrows and num_row_groups > 1:
+        row_groups, group_rows = [], 0
+        for row_group in rng.sample(range(num_row_groups), num_row_groups):
+            if group_rows >= sample_rows:
+                break
+            row_groups.append(row_group)
+            group_rows += parquet_file.metadata.row_group(row_group).num_rows
+        row_groups.sort()
+    elif sample_fraction and sample_fraction < 1 and num_row_groups > 1:
+        row_groups = sorted(
+            rng.sample(
+                range(num_row_groups), max(1, round(num_row_groups * sample_fraction))
+            )
+        )
+        sample_fraction = None
+
+    batches = parquet_file.iter_batches(
+        batch_size=get_chunk_size(nrows), row_groups=row_groups, columns=columns
+    )
+    yield from read_chunks(
+        (batch.to_pandas(split_blocks=True) for batch in batches),
+        nrows=nrows,
+        sample_fraction=sample_fraction,
+        sample_rows=sample_rows,
+        seed=rng.randrange(2**32),
+    )
+
+
 @singledispatch
 def read_parquet_dispatch(config_source: Any, key: str, **kwargs):
     raise DatalakeFileFormatException(config_source=config_source, file_name=key)
@@ -50,14 +109,10 @@ def _(_: GCSConfig, key: str, bucket_name: str, **kwargs):
     """
     # pylint: disable=import-outside-toplevel
     from gcsfs import GCSFileSystem
-    from pyarrow.parquet import ParquetFile
 
     gcs = GCSFileSystem()
-    file = gcs.open(f"gs://{bucket_name}/{key}")
-    dataframe_response = (
-        ParquetFile(file).read().to_pandas(split_blocks=True, self_destruct=True)
-    )
-    return dataframe_to_chunks(dataframe_response)
+    with gcs.open(f"gs://{bucket_name}/{key}") as file:
+        yield from read_parquet_file(file, **kwargs)
 
 
 @read_parquet_dispatch.register
@@ -67,7 +122,6 @@ def _(_: S3Config, key: str, bucket_name: str, connection_kwargs, **kwargs):
     """
     # pylint: disable=import-outside-toplevel
     import s3fs
-    from pyarrow.parquet import ParquetDataset
 
     client_kwargs = {}
     client = connection_kwargs
@@ -87,13 +141,14 @@ def _(_: S3Config, key: str, bucket_name: str, connection_kwargs, **kwargs):
             client_kwargs=client_kwargs,
         )
     bucket_uri = f"s3://{bucket_name}/{key}"
-    dataset = ParquetDataset(bucket_uri, filesystem=s3_fs)
-    return dataframe_to_chunks(dataset.read_pandas().to_pandas())
+    with s3_fs.open(bucket_uri) as file:
+        yield from read_parquet_file(file, **kwargs)
 
 
 @read_parquet_dispatch.register
 def _(config_source: AzureConfig, key: str, bucket_name: str, **kwargs):
-    import pandas as pd  # pylint: disable=import-outside-toplevel
+    # pylint: disable=import-outside-toplevel
+    import fsspec
 
     storage_options = return_azure_storage_options(config_source)
     account_url = AZURE_PATH.format(
@@ -101,5 +156,5 @@ def _(config_source: AzureConfig, key: str, bucket_name: str, **kwargs):
         account_name=storage_options.get("account_name"),
         key=key,
     )
-    dataframe = pd.read_parquet(account_url, storage_options=storage_options)
-    return dataframe_to_chunks(dataframe)
+    with fsspec.open(account_url, mode="rb", **storage_options) as file:
+        yield from read_parquet_file(file, **kwargs)
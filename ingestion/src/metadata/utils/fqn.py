@@ -13,8 +13,8 @@ Handle FQN building and splitting logic.
 Filter information has been taken from the
 ES indexes definitions
 """
-import re
-from typing import Dict, List, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from antlr4.CommonTokenStream import CommonTokenStream
 from antlr4.error.ErrorStrategy import BailErrorStrategy
@@ -39,12 +39,14 @@ from metadata.generated.schema.entity.teams.team import Team
 from metadata.generated.schema.entity.teams.user import User
 from metadata.generated.schema.tests.testCase import TestCase
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.utils.catalog_index import get_catalog_index
 from metadata.utils.dispatch import class_register
 from metadata.utils.elasticsearch import get_entity_from_es_result
 
 T = TypeVar("T", bound=BaseModel)
 
 FQN_SEPARATOR: str = "."
+FQN_CACHE_SIZE = 8192
 fqn_build_registry = class_register()
 
 
@@ -67,6 +69,48 @@ def split(s: str) -> List[str]:  # pylint: disable=invalid-name
     """
     Equivalent of Java's FullyQualifiedName#split
     """
+    return list(_split(s))
+
+
+@lru_cache(maxsize=FQN_CACHE_SIZE)
+def _split(s: str) -> Tuple[str, ...]:  # pylint: disable=invalid-name
+    parts = _fast_split(s)
+    if parts is None:
+        # Not a valid FQN for the fast path. Let the grammar decide and raise
+        return tuple(_antlr_split(s))
+    return parts
+
+
+def _fast_split(s: str) -> Optional[Tuple[str, ...]]:  # pylint: disable=invalid-name
+    """
+    Linear scan following the Fqn.g4 grammar: names separated by ".",
+    where names containing "." are quoted. Quoted names are returned
+    with their quotes, as the ANTLR parser does.
+    Returns None if the FQN is not valid.
+    """
+    parts = []
+    start = 0
+    length = len(s)
+    while True:
+        if start < length and s[start] == '"':
+            end = s.find('"', start + 1) + 1
+            if not end or "." not in s[start:end]:
+                return None
+        else:
+            end = s.find(FQN_SEPARATOR, start)
+            if end == -1:
+                end = length
+            if end == start or '"' in s[start:end]:
+                return None
+        parts.append(s[start:end])
+        if end == length:
+            return tuple(parts)
+        if s[end] != FQN_SEPARATOR:
+            return None
+        start = end + 1
+
+
+def _antlr_split(s: str) -> List[str]:  # pylint: disable=invalid-name
     lexer = FqnLexer(InputStream(s))
     stream = CommonTokenStream(lexer)
     parser = FqnParser(stream)
@@ -90,21 +134,17 @@ def quote_name(name: str) -> str:
     """
     Equivalent of Java's FullyQualifiedName#quoteName
     """
-    matcher = re.compile(r'^(")([^"]+)(")$|^(.*)$').match(name)
-    if not matcher or len(matcher.group(0)) != len(name):
-        raise ValueError("Invalid name " + name)
-
     # Name matches quoted string "sss".
     # If quoted string does not contain "." return unquoted sss, else return quoted "sss"
-    if matcher.group(1):
-        unquoted_name = matcher.group(2)
+    if len(name) > 2 and name[0] == name[-1] == '"' and '"' not in name[1:-1]:
+        unquoted_name = name[1:-1]
         return name if "." in unquoted_name else unquoted_name
 
     # Name matches unquoted string sss
-    # If unquoted string contains ".", return quoted "sss", else unquoted sss
-    unquoted_name = matcher.group(4)
-    if '"' not in unquoted_name:
-        return '"' + name + '"' if "." in unquoted_name else unquoted_name
+    # If unquoted string contains ".", return quoted "sss", else unquoted sss.
+    # Names with line breaks are not valid, as with the ^(.*)$ pattern in Java.
+    if '"' not in name and "\n" not in name:
+        return '"' + name + '"' if "." in name else name
     raise ValueError("Invalid name " + name)
 
 
@@ -328,6 +368,8 @@ def _(
     es_result = metadata.es_search_from_fqn(
         entity_type=User,
         fqn_search_string=fqn_search_string,
+        fields=[],
+        from_source=True,
     )
     entity: Optional[Union[User, List[User]]] = get_entity_from_es_result(
         entity_list=es_result, fetch_multiple_entities=fetch_multiple_entities
@@ -358,6 +400,8 @@ def _(
     es_result = metadata.es_search_from_fqn(
         entity_type=Team,
         fqn_search_string=fqn_search_string,
+        fields=[],
+        from_source=True,
     )
     entity: Optional[Union[Team, List[Team]]] = get_entity_from_es_result(
         entity_list=es_result, fetch_multiple_entities=fetch_multiple_entities
@@ -498,6 +542,16 @@ def search_table_from_es(
     table_name: str,
     fetch_multiple_entities: bool = False,
 ):
+    # Tables missing from the snapshot, e.g., created after it, are searched in ES
+    catalog_index = get_catalog_index(service_name)
+    if catalog_index:
+        entity_list = catalog_index.search(database_name, schema_name, table_name)
+        if entity_list:
+            return get_entity_from_es_result(
+                entity_list=entity_list,
+                fetch_multiple_entities=fetch_multiple_entities,
+            )
+
     fqn_search_string = build_es_fqn_search_string(
         database_name, schema_name, service_name, table_name
     )
@@ -453,3 +453,15 @@ def get_database_name_for_lineage(
         db_service_entity.connection.config.__dict__.get("databaseName")
         or DEFAULT_DATABASE
     )
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    """
+    Split an iterable in lists of `size` elements at most,
+    only consuming it as the lists are requested
+    """
+    iterator = iter(iterable)
+    batch = list(itertools.islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(iterator, size))
@@ -18,6 +18,7 @@ import inspect
 import os
 import platform
 import signal
+import threading
 from typing import Callable
 
 from metadata.utils.constants import TEN_MIN
@@ -38,7 +39,8 @@ def timeout(seconds: int = TEN_MIN) -> Callable:
     Decorator factory to handle timeouts in functions. Defaults
     to 10 min.
 
-    This functionality is not supported on Windows.
+    This functionality is not supported on Windows, nor
+    outside the main thread, as it relies on SIGALRM.
 
     Args:
          seconds: seconds to wait until raising the timeout
@@ -47,7 +49,12 @@ def timeout(seconds: int = TEN_MIN) -> Callable:
     def decorator(fn):
         @functools.wraps(fn)
         def inner(*args, **kwargs):
-            if platform.system() != "Windows":  # SIGALRM not supported on Windows
+            # SIGALRM is not supported on Windows, and its handler
+            # can only be set from the main thread
+            if (
+                platform.system() != "Windows"
+                and threading.current_thread() is threading.main_thread()
+            ):
                 signal.signal(signal.SIGALRM, _handle_timeout)
                 signal.alarm(seconds)
                 try:
@@ -56,7 +63,7 @@ def timeout(seconds: int = TEN_MIN) -> Callable:
                     signal.alarm(0)
                 return result
 
-            # If platform is Windows, run the function as-is
+            # Otherwise, run the function as-is
             return fn(*args, **kwargs)
 
         return inner
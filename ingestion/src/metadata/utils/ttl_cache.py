@@ -0,0 +1,70 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+LRU cache whose entries expire after a time to live
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class TTLCache:
+    """
+    Least Recently Used cache with a time to live.
+    Safe to share between threads. Keeps track of
+    the hits and misses to report on its usage.
+    """
+
+    def __init__(self, capacity: int, ttl: float) -> None:
+        self._cache = OrderedDict()
+        self._lock = Lock()
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Returns the value associated to `key` if it exists and has not
+        expired, updating the cache usage.
+        Raises `KeyError` otherwise.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self._cache.pop(key, None)
+                self.misses += 1
+                raise KeyError(key)
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value) -> None:
+        """
+        Assigns `value` to `key`, overwriting `key` if it already exists
+        in the cache and restarting its time to live.
+        If the size of the cache grows above capacity, pops the least used
+        element.
+        """
+        with self._lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the entries"""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -12,7 +12,7 @@
 Add methods to the workflows for updating the IngestionPipeline status
 """
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from metadata.config.common import WorkflowExecutionError
@@ -25,6 +25,9 @@ from metadata.generated.schema.metadataIngestion.workflow import (
 )
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 
+# How far back we look for a successful run to use as watermark
+WATERMARK_LOOKBACK = timedelta(days=30)
+
 
 class WorkflowStatusMixin:
     """
@@ -79,6 +82,32 @@ class WorkflowStatusMixin:
                 self.config.ingestionPipelineFQN, pipeline_status
             )
 
+    def get_last_successful_run_start(self) -> Optional[datetime]:
+        """
+        Start date of the latest successful run of the current
+        ingestion pipeline, if any, to be used as watermark
+        """
+        if not self.config.ingestionPipelineFQN:
+            return None
+
+        now = datetime.now()
+        pipeline_statuses = self.metadata.get_pipeline_status_between_ts(
+            self.config.ingestionPipelineFQN,
+            start_ts=int((now - WATERMARK_LOOKBACK).timestamp() * 1000),
+            end_ts=int(now.timestamp() * 1000),
+        )
+        start_dates = [
+            pipeline_status.startDate.__root__
+            for pipeline_status in pipeline_statuses or []
+            if pipeline_status.runId != self.run_id
+            and pipeline_status.startDate
+            # Tables failing in a partial success did not make it to OpenMetadata
+            and pipeline_status.pipelineState == PipelineState.success
+        ]
+        if not start_dates:
+            return None
+        return datetime.fromtimestamp(max(start_dates) / 1000, tz=timezone.utc)
+
     def raise_from_status(self, raise_warnings=False):
         """
         Method to raise error if failed execution
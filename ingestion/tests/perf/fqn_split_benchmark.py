@@ -0,0 +1,44 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Compare the time taken to split FQNs by the fast path
+and by the ANTLR parser. It only reports the timings,
+the results are checked by the unit tests of the fqn module.
+
+Run it with:
+    python ingestion/tests/perf/fqn_split_benchmark.py
+"""
+import timeit
+from functools import partial
+
+from metadata.utils import fqn
+
+NAMES = [
+    "service.db.schema.table.column",
+    'service."data.base".schema.table.column',
+    'service.db.schema."table with spaces".column',
+]
+NUMBER = 1000
+
+
+def main() -> None:
+    for name in NAMES:
+        # pylint: disable=protected-access
+        antlr_time = timeit.timeit(partial(fqn._antlr_split, name), number=NUMBER)
+        fast_time = timeit.timeit(partial(fqn._fast_split, name), number=NUMBER)
+        print(
+            f"{name}: ANTLR split {antlr_time:.4f}s,"
+            f" fast split {fast_time:.4f}s for {NUMBER} splits"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Tests for the TTL cache class"""
+
+from unittest.mock import patch
+
+import pytest
+
+from metadata.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_fails_if_key_doesnt_exist(self) -> None:
+        cache = TTLCache(2, 60)
+        with pytest.raises(KeyError):
+            cache.get(1)
+        assert cache.misses == 1
+
+    def test_getting_an_existing_key_returns_the_associated_element(self) -> None:
+        cache = TTLCache(2, 60)
+        cache.put(1, 2)
+        assert cache.get(1) == 2
+        assert cache.hits == 1
+
+    def test_putting_over_capacity_rotates_cache(self) -> None:
+        cache = TTLCache(2, 60)
+        cache.put(1, None)
+        cache.put(2, None)
+        cache.put(3, None)
+        assert len(cache) == 2
+        with pytest.raises(KeyError):
+            cache.get(1)
+
+    def test_entries_expire(self) -> None:
+        cache = TTLCache(2, 60)
+        with patch("metadata.utils.ttl_cache.time.monotonic", return_value=0):
+            cache.put(1, 1)
+        with patch("metadata.utils.ttl_cache.time.monotonic", return_value=30):
+            assert cache.get(1) == 1
+        with patch("metadata.utils.ttl_cache.time.monotonic", return_value=61):
+            with pytest.raises(KeyError):
+                cache.get(1)
+        assert len(cache) == 0
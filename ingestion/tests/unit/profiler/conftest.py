@@ -64,8 +64,14 @@ class Row:
         query_type,
         start_time,
         query_text,
+        rows_inserted=None,
+        rows_updated=None,
+        rows_deleted=None,
     ):
         self.QUERY_ID = query_id
         self.QUERY_TYPE = query_type
         self.START_TIME = start_time
         self.QUERY_TEXT = query_text
+        self.ROWS_INSERTED = rows_inserted
+        self.ROWS_UPDATED = rows_updated
+        self.ROWS_DELETED = rows_deleted
@@ -0,0 +1,117 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the column accumulators of the pandas profiler
+"""
+import random
+from unittest import TestCase
+
+import pandas as pd
+
+from metadata.profiler.metrics.accumulator import (
+    ColumnAccumulator,
+    DataFrameChunks,
+    get_accumulator,
+)
+
+
+class AccumulatorTest(TestCase):
+    """Accumulated values match pandas over the whole column"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        values = [random.choice([None, *range(50)]) for _ in range(1000)]
+        cls.df = pd.DataFrame(
+            {"number": values, "name": [f"name_{value}" for value in values]}
+        )
+        cls.dfs = DataFrameChunks(
+            [cls.df[start : start + 100] for start in range(0, 1000, 100)]
+        )
+
+    def test_numbers(self):
+        """Moments, distinct values and quantiles are exact"""
+        series = self.df["number"]
+        accumulator = get_accumulator(self.dfs, "number")
+
+        self.assertEqual(accumulator.count, series.count())
+        self.assertEqual(accumulator.null_count, series.isnull().sum())
+        self.assertEqual(accumulator.sum, series.sum())
+        self.assertEqual(accumulator.min, series.min())
+        self.assertEqual(accumulator.max, series.max())
+        self.assertAlmostEqual(accumulator.stddev, series.std())
+        self.assertEqual(accumulator.distinct_count, series.nunique())
+        self.assertEqual(accumulator.unique_count, (series.value_counts() == 1).sum())
+        for quantile in (0.25, 0.5, 0.75):
+            self.assertEqual(
+                accumulator.quantile(quantile),
+                series.quantile(quantile, interpolation="midpoint"),
+            )
+
+    def test_lengths(self):
+        """Lengths are accumulated chunk by chunk"""
+        lengths = self.df["name"].str.len()
+        accumulator = get_accumulator(self.dfs, "name")
+
+        self.assertEqual(accumulator.min_length, lengths.min())
+        self.assertEqual(accumulator.max_length, lengths.max())
+        self.assertAlmostEqual(accumulator.mean_length, lengths.mean())
+
+    def test_chunk_factory(self):
+        """Chunks are read again on each pass, and the first one is kept"""
+        reads = []
+
+        def read_chunks():
+            reads.append(None)
+            return iter(list(self.dfs))
+
+        dfs = DataFrameChunks(read_chunks)
+        self.assertTrue(dfs)
+        self.assertIs(dfs[0], dfs[0])
+        self.assertEqual(len(reads), 1)
+        self.assertEqual(sum(len(df) for df in dfs), 1000)
+        self.assertEqual(sum(len(df) for df in dfs), 1000)
+        self.assertEqual(len(reads), 3)
+        self.assertFalse(DataFrameChunks(lambda: None))
+
+    def test_single_pass(self):
+        """Accumulators are built once and merge like the whole column"""
+        self.assertIs(
+            get_accumulator(self.dfs, "number"), get_accumulator(self.dfs, "number")
+        )
+
+        merged = ColumnAccumulator()
+        for df in self.dfs:
+            accumulator = ColumnAccumulator()
+            accumulator.update(df["number"])
+            merged.merge(accumulator)
+        self.assertEqual(
+            merged.distinct_count, get_accumulator(self.dfs, "number").distinct_count
+        )
+        self.assertEqual(merged.sum, self.df["number"].sum())
+
+    def test_sketches(self):
+        """Past the exact values limit, counts and quantiles are approximated"""
+        series = pd.Series(random.sample(range(1_000_000), 50_000), dtype="float64")
+        merged = ColumnAccumulator(exact_values_limit=1000)
+        for start in range(0, len(series), 10_000):
+            accumulator = ColumnAccumulator(exact_values_limit=1000)
+            accumulator.update(series[start : start + 10_000])
+            merged.merge(accumulator)
+
+        self.assertIsNone(merged.value_counts)
+        self.assertIsNone(merged.unique_count)
+        self.assertAlmostEqual(merged.distinct_count / series.nunique(), 1, delta=0.03)
+        self.assertAlmostEqual(merged.stddev / series.std(), 1)
+        for quantile in (0.25, 0.5, 0.75):
+            self.assertAlmostEqual(
+                merged.quantile(quantile) / series.quantile(quantile), 1, delta=0.02
+            )
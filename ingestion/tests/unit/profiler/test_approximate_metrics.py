@@ -0,0 +1,122 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test the approximate distinct counts and quantiles
+"""
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from sqlalchemy import Column, Integer, column
+from sqlalchemy.dialects import oracle, postgresql
+
+from metadata.generated.schema.entity.data.table import ColumnProfilerConfig
+from metadata.generated.schema.metadataIngestion.databaseServiceProfilerPipeline import (
+    DatabaseServiceProfilerPipeline,
+)
+from metadata.profiler.api.models import TableConfig
+from metadata.profiler.interface.profiler_protocol import ProfilerProtocol
+from metadata.profiler.metrics.core import add_props
+from metadata.profiler.metrics.registry import Metrics
+from metadata.profiler.orm.functions.approximate import (
+    ApproxCountDistinctFn,
+    ApproxQuantileFn,
+)
+from metadata.profiler.processor.core import Profiler
+
+
+def _compile(expression, dialect) -> str:
+    return str(
+        expression.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
+
+
+class ApproximateMetricsTest(TestCase):
+    """Approximate functions compile to the sketches of the dialect"""
+
+    def test_approximate_functions(self):
+        """Dialects with sketches use them"""
+        self.assertEqual(
+            _compile(ApproxCountDistinctFn(column("age")), oracle.dialect()),
+            "APPROX_COUNT_DISTINCT(age)",
+        )
+        self.assertEqual(
+            _compile(ApproxQuantileFn(column("age"), "users", 0.25), oracle.dialect()),
+            "APPROX_PERCENTILE(0.25) WITHIN GROUP (ORDER BY age ASC)",
+        )
+
+    def test_exact_fallback(self):
+        """Other dialects compute the exact values"""
+        self.assertEqual(
+            _compile(ApproxCountDistinctFn(column("age")), postgresql.dialect()),
+            "count(DISTINCT age)",
+        )
+        self.assertEqual(
+            _compile(
+                ApproxQuantileFn(column("age"), "users", 0.5), postgresql.dialect()
+            ),
+            "percentile_cont(0.50) WITHIN GROUP (ORDER BY age ASC)",
+        )
+
+    def test_approximate_metric(self):
+        """Metrics switch to the approximate functions when asked to"""
+        col = Column("age", Integer)
+        exact = Metrics.DISTINCT_COUNT.value(col).fn()
+        approximate = add_props(approximate=True)(Metrics.DISTINCT_COUNT.value)(
+            col
+        ).fn()
+
+        self.assertIn("count(DISTINCT age)", _compile(exact, oracle.dialect()))
+        self.assertIn(
+            "APPROX_COUNT_DISTINCT(age)", _compile(approximate, oracle.dialect())
+        )
+
+    def test_approximate_config(self):
+        """The table config takes precedence over the global one"""
+        source_config = DatabaseServiceProfilerPipeline(approximateMetrics=True)
+        table_config = TableConfig(
+            fullyQualifiedName="service.db.schema.table", approximateMetrics=False
+        )
+
+        self.assertTrue(ProfilerProtocol.get_approximate_metrics(None, source_config))
+        self.assertFalse(
+            ProfilerProtocol.get_approximate_metrics(table_config, source_config)
+        )
+        self.assertFalse(
+            ProfilerProtocol.get_approximate_metrics(
+                None, DatabaseServiceProfilerPipeline()
+            )
+        )
+
+    def test_included_column_metrics(self):
+        """Metrics picked for a column keep their approximate setup"""
+        profiler_interface = MagicMock(
+            approximate_metrics=frozenset({Metrics.DISTINCT_COUNT.value.name()})
+        )
+        profiler_interface.table_entity.tableProfilerConfig.includeColumns = [
+            ColumnProfilerConfig(
+                columnName="age", metrics=["distinctCount", "nullCount"]
+            )
+        ]
+        profiler = Profiler.__new__(Profiler)
+        profiler.profiler_interface = profiler_interface
+        metrics = [
+            add_props(approximate=True)(Metrics.DISTINCT_COUNT.value),
+            Metrics.NULL_COUNT.value,
+            Metrics.MEAN.value,
+        ]
+        col = Column("age", Integer)
+
+        col_metrics = profiler.get_col_metrics(metrics, col)
+        self.assertEqual(
+            [metric.name() for metric in col_metrics], ["distinctCount", "nullCount"]
+        )
+        self.assertTrue(col_metrics[0].approximate)
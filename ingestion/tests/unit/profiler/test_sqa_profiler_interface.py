@@ -14,12 +14,15 @@ Test SQA Interface
 """
 
 import os
+import tempfile
 from datetime import datetime, timezone
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
-from sqlalchemy import TEXT, Column, Integer, String, inspect
+from sqlalchemy import TEXT, Column, Integer, MetaData, String
+from sqlalchemy import Table as SQATable
+from sqlalchemy import inspect
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm.session import Session
 
@@ -38,6 +41,8 @@ from metadata.generated.schema.entity.services.connections.database.sqliteConnec
     SQLiteConnection,
     SQLiteScheme,
 )
+from metadata.profiler.api.models import ProfileSampleConfig
+from metadata.profiler.interface.sqlalchemy import profiler_interface
 from metadata.profiler.interface.sqlalchemy.profiler_interface import (
     SQAProfilerInterface,
 )
@@ -48,7 +53,13 @@ from metadata.profiler.metrics.core import (
     StaticMetric,
 )
 from metadata.profiler.metrics.static.row_count import RowCount
+from metadata.profiler.orm.functions.create_table_as import (
+    get_materialized_sample_name,
+)
 from metadata.profiler.processor.default import get_default_metrics
+from metadata.profiler.processor.sqlalchemy.sample_registry import (
+    MaterializedSampleRegistry,
+)
 
 
 class User(declarative_base()):
@@ -251,6 +262,116 @@ class SQAInterfaceTestMultiThread(TestCase):
         assert name_column_profile.nullCount == 0
         assert id_column_profile.median == 1.0
 
+    def test_fused_static_metrics(self):
+        """Fused static metrics give the same results as one query per column"""
+        static_metrics = [
+            (
+                [
+                    metric
+                    for metric in self.static_metrics
+                    if metric.is_col_metric() and not metric.is_window_metric()
+                ],
+                MetricTypes.Static,
+                col,
+                self.table,
+            )
+            for col in inspect(User).c
+        ]
+
+        by_column = self.sqa_profiler_interface.get_all_metrics(static_metrics)
+
+        self.sqa_profiler_interface.source_config = MagicMock(
+            columnMetricsBatchSize=4
+        )
+        try:
+            _, batches = self.sqa_profiler_interface._split_fused_metrics(
+                static_metrics
+            )
+            assert [len(batch) for batch in batches] == [4, 2]
+            fused = self.sqa_profiler_interface.get_all_metrics(static_metrics)
+        finally:
+            self.sqa_profiler_interface.source_config = None
+
+        for col in inspect(User).c:
+            by_column["columns"][col.name].pop("timestamp")
+            fused["columns"][col.name].pop("timestamp")
+            assert fused["columns"][col.name] == by_column["columns"][col.name]
+
+    def test_materialized_sample(self):
+        """All the metrics run against the same materialized sample"""
+        static_metrics = [
+            (
+                [
+                    metric
+                    for metric in self.static_metrics
+                    if metric.is_col_metric() and not metric.is_window_metric()
+                ],
+                MetricTypes.Static,
+                col,
+                self.table,
+            )
+            for col in inspect(User).c
+        ]
+        self.sqa_profiler_interface.source_config = MagicMock(
+            materializeSample=True,
+            materializedSampleSchema=None,
+            columnMetricsBatchSize=1,
+        )
+        self.sqa_profiler_interface.profile_sample_config = ProfileSampleConfig(
+            profile_sample=100
+        )
+        engine = self.sqa_profiler_interface.session.get_bind()
+        try:
+            profile = self.sqa_profiler_interface.get_all_metrics(static_metrics)
+            sample_table = self.sqa_profiler_interface._materialized_sample_table
+            assert sample_table is not None
+            assert inspect(engine).has_table(sample_table.name)
+            assert profile["columns"]["age"]["valuesCount"] == 2
+            assert profile["columns"]["age"]["min"] == 30
+        finally:
+            self.sqa_profiler_interface._drop_materialized_sample()
+            self.sqa_profiler_interface.source_config = None
+            self.sqa_profiler_interface.profile_sample_config = None
+
+        assert not inspect(engine).has_table(sample_table.name)
+
+    def test_stale_materialized_samples(self):
+        """Only the registered samples left behind by old runs are dropped"""
+        engine = self.sqa_profiler_interface.session.get_bind()
+        stale, unregistered, current = (
+            SQATable(name, MetaData(), Column("id", Integer))
+            for name in (
+                "om_sample_1_deadbeef",
+                "om_sample_1_cafebabe",
+                get_materialized_sample_name(),
+            )
+        )
+        for table in (stale, unregistered, current):
+            table.create(bind=engine)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry = MaterializedSampleRegistry(os.path.join(tmp_dir, "samples.db"))
+            location = str(engine.url)
+            registry.add(location, None, current.name)
+            registry.connection.execute(
+                "INSERT INTO samples VALUES (?, '', ?, 1)", (location, stale.name)
+            )
+            profiler_interface._cleaned_sample_schemas.clear()
+            try:
+                with patch.object(
+                    profiler_interface,
+                    "get_materialized_sample_registry",
+                    return_value=registry,
+                ):
+                    self.sqa_profiler_interface._drop_stale_materialized_samples(None)
+                assert not inspect(engine).has_table(stale.name)
+                assert inspect(engine).has_table(unregistered.name)
+                assert inspect(engine).has_table(current.name)
+                assert registry.get_stale(location, None) == []
+            finally:
+                registry.connection.close()
+                for table in (stale, unregistered, current):
+                    table.drop(bind=engine, checkfirst=True)
+
     @classmethod
     def tearDownClass(cls) -> None:
         os.remove(cls.db_path)
@@ -14,6 +14,7 @@ Tests utils function for the profiler
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest import TestCase
 
@@ -26,7 +27,11 @@ from metadata.profiler.metrics.hybrid.histogram import Histogram
 from metadata.profiler.metrics.system.queries.snowflake import (
     get_snowflake_system_queries,
 )
-from metadata.profiler.metrics.system.system import recursive_dic
+from metadata.profiler.metrics.system.system import (
+    clear_system_metrics_cache,
+    get_schema_system_results,
+    recursive_dic,
+)
 from metadata.utils.profiler_utils import (
     ColumnLike,
     get_identifiers_from_string,
@@ -220,6 +225,53 @@ def test_get_snowflake_system_queries_all_dll(query, expected):
     assert query_result.table_name == "table1"
 
 
+@pytest.mark.parametrize(
+    "query_type, expected",
+    [("INSERT", 1), ("UPDATE", 2), ("DELETE", 3), ("MERGE", 6)],
+)
+def test_get_snowflake_system_queries_rows_affected(query_type, expected):
+    """Rows affected come from the query history"""
+    row = Row(
+        query_id="1",
+        query_type=query_type,
+        start_time=datetime.now(),
+        query_text="UPDATE DATABASE.SCHEMA.TABLE1 SET col1 = 1",
+        rows_inserted=1,
+        rows_updated=2,
+        rows_deleted=3,
+    )
+
+    query_result = get_snowflake_system_queries(row, "DATABASE", "SCHEMA")  # type: ignore
+    assert query_result.rows == expected
+
+
+def test_get_schema_system_results():
+    """The DML history of a schema is fetched once for all its tables"""
+    calls = []
+
+    def fetch_results():
+        calls.append(1)
+        return [("table1", 1), ("table2", 2), ("table1", 3)]
+
+    def get_results():
+        return get_schema_system_results(
+            "snowflake.database.schema.test", fetch_results, lambda res: res[0]
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: get_results(), range(8)))
+    finally:
+        clear_system_metrics_cache()
+
+    assert len(calls) == 1
+    assert results[0] == {
+        "table1": [("table1", 1), ("table1", 3)],
+        "table2": [("table2", 2)],
+    }
+    assert all(result is results[0] for result in results)
+
+
 @pytest.mark.parametrize(
     "identifier, expected",
     [
@@ -12,9 +12,10 @@
 """
 Validate workflow configs and filters
 """
+import time
 import uuid
 from copy import deepcopy
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import sqlalchemy as sqa
 from pytest import raises
@@ -293,6 +294,57 @@ def test_default_profile_def(
     )
 
 
+@patch.object(
+    ProfilerWorkflow,
+    "_validate_service_name",
+    return_value=True,
+)
+def test_profile_entities_concurrently(mocked_method):
+    """
+    Tables are profiled in a pool, and the ones running for longer
+    than the table timeout are marked as failed
+    """
+    concurrent_config = deepcopy(config)
+    concurrent_config["source"]["sourceConfig"]["config"].update(
+        {"tableThreadCount": 4, "maxConnections": 12, "tableTimeoutSeconds": 1}
+    )
+    workflow = ProfilerWorkflow.create(concurrent_config)
+    mocked_method.assert_called()
+    # 12 connections with 5 threads per table
+    assert workflow.get_table_threads() == 2
+
+    tables = [
+        Table(
+            id=uuid.uuid4(),
+            name=f"table{idx}",
+            fullyQualifiedName=f"service.db.schema.table{idx}",
+            columns=[Column(name="id", dataType=DataType.BIGINT)],
+        )
+        for idx in range(5)
+    ]
+
+    sources = []
+
+    def create_profiler_source():
+        source = MagicMock()
+        sources.append(source)
+        return source
+
+    def run_profiler(entity, profiler_source):
+        assert profiler_source in sources
+        if entity.name.__root__ == "table0":
+            time.sleep(3)
+        return entity.name.__root__
+
+    with patch.object(ProfilerWorkflow, "run_profiler", side_effect=run_profiler):
+        profiles = list(workflow.profile_entities(tables, create_profiler_source))
+
+    assert sorted(profiles) == ["table1", "table2", "table3", "table4"]
+    assert len(workflow.source_status.failures) == 1
+    # Each thread of the pool profiles with its own source
+    assert len(sources) == 2
+
+
 def test_service_name_validation_raised():
     """Test the service name validation for the profiler
     workflow is raised correctly
@@ -0,0 +1,105 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the catalog snapshot used to resolve table names
+"""
+import os
+import tempfile
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.generated.schema.entity.data.table import Column, DataType, Table
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.lineage.sql_lineage import search_table_entities
+from metadata.utils.catalog_index import (
+    CatalogIndex,
+    close_catalog_index,
+    create_catalog_index,
+)
+
+SERVICE = "mysql_service"
+
+
+def get_table(database: str, schema: str, name: str) -> Table:
+    return Table(
+        id=uuid.uuid4(),
+        name=name,
+        fullyQualifiedName=f"{SERVICE}.{database}.{schema}.{name}",
+        database=EntityReference(id=uuid.uuid4(), type="database", name=database),
+        databaseSchema=EntityReference(
+            id=uuid.uuid4(), type="databaseSchema", name=schema
+        ),
+        columns=[Column(name="id", dataType=DataType.BIGINT)],
+    )
+
+
+TABLES = [
+    get_table("db", "shop", "Orders"),
+    get_table("db", "staging", "orders"),
+    get_table("db", "shop", "customers"),
+]
+
+
+class CatalogIndexTest(TestCase):
+    """Validate the lookups of the catalog snapshot"""
+
+    def setUp(self) -> None:
+        self.catalog_index = CatalogIndex(SERVICE)
+        self.catalog_index.load(TABLES)
+
+    def tearDown(self) -> None:
+        self.catalog_index.close()
+
+    def test_search(self):
+        """Names are case insensitive and missing parts match any"""
+        res = self.catalog_index.search("DB", "Shop", "ORDERS")
+        self.assertEqual([table.id for table in res], [TABLES[0].id])
+        self.assertEqual(res[0].columns[0].name.__root__, "id")
+
+        self.assertEqual(len(self.catalog_index.search(None, None, "orders")), 2)
+        self.assertEqual(len(self.catalog_index.search("*", "staging", "orders")), 1)
+        self.assertEqual(self.catalog_index.search("db", "shop", "missing"), [])
+
+    def test_reuse_stored_snapshot(self):
+        """A stored snapshot is reused while it is fresh"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "catalog.db")
+            metadata = MagicMock()
+            metadata.list_all_entities.return_value = iter(TABLES)
+            create_catalog_index(metadata, SERVICE, path=path, max_age=60)
+            close_catalog_index(SERVICE)
+
+            metadata = MagicMock()
+            create_catalog_index(metadata, SERVICE, path=path, max_age=60)
+            try:
+                metadata.list_all_entities.assert_not_called()
+                res = search_table_entities(metadata, SERVICE, None, None, "customers")
+                self.assertEqual([table.id for table in res], [TABLES[2].id])
+                metadata.es_search_from_fqn.assert_not_called()
+            finally:
+                close_catalog_index(SERVICE)
+
+    def test_fallback_on_miss(self):
+        """Tables missing from the snapshot are searched in ES"""
+        new_table = get_table("db", "shop", "created_after_snapshot")
+        metadata = MagicMock()
+        metadata.list_all_entities.return_value = iter(TABLES)
+        metadata.es_search_from_fqn.return_value = [new_table]
+        create_catalog_index(metadata, SERVICE)
+        try:
+            res = search_table_entities(
+                metadata, SERVICE, "db", "shop", "created_after_snapshot"
+            )
+            self.assertEqual([table.id for table in res], [new_table.id])
+            metadata.es_search_from_fqn.assert_called_once()
+        finally:
+            close_catalog_index(SERVICE)
@@ -0,0 +1,103 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the Elasticsearch sink helpers
+"""
+import json
+import uuid
+from threading import Lock
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.api.sink import SinkStatus
+from metadata.ingestion.sink.elasticsearch import ElasticsearchSink, get_parent_name
+
+
+class ElasticsearchSinkTest(TestCase):
+    """Validate the parent names and the bulk status of the sink"""
+
+    def test_parent_name_from_reference(self):
+        """The name in the reference is used as is"""
+        metadata = MagicMock()
+        reference = EntityReference(
+            id=uuid.uuid4(), type="databaseSchema", name="schema"
+        )
+
+        self.assertEqual(
+            get_parent_name(metadata, DatabaseSchema, reference), "schema"
+        )
+        metadata.get_by_id.assert_not_called()
+
+    def test_parent_name_is_cached(self):
+        """Parents without name in the reference are fetched once"""
+        metadata = MagicMock()
+        metadata.get_by_id.return_value.name.__root__ = "schema"
+        reference = EntityReference(id=uuid.uuid4(), type="databaseSchema")
+
+        for _ in range(3):
+            self.assertEqual(
+                get_parent_name(metadata, DatabaseSchema, reference), "schema"
+            )
+        metadata.get_by_id.assert_called_once()
+
+    def test_bulk_status(self):
+        """Documents are reported from the _bulk response"""
+        sink = ElasticsearchSink.__new__(ElasticsearchSink)
+        sink.status = SinkStatus()
+        sink.config = MagicMock(timeout=30)
+        sink.elasticsearch_client = MagicMock()
+        sink.elasticsearch_client.bulk.return_value = {
+            "errors": True,
+            "items": [
+                {"index": {"_id": "1", "status": 201}},
+                {"index": {"_id": "2", "error": {"type": "mapper_parsing_exception"}}},
+            ],
+        }
+
+        sink._write_bulk(  # pylint: disable=protected-access
+            [("written", '{"index": {}}', "{}"), ("failed", '{"index": {}}', "{}")]
+        )
+        self.assertEqual(sink.status.records, ["written"])
+        self.assertEqual(
+            [failure.name for failure in sink.status.failures], ["failed"]
+        )
+
+        sink.elasticsearch_client.bulk.side_effect = ConnectionError("ES is down")
+        sink._write_bulk(  # pylint: disable=protected-access
+            [("lost", '{"index": {}}', "{}")]
+        )
+        self.assertEqual(sink.status.records, ["written"])
+        self.assertEqual(
+            [failure.name for failure in sink.status.failures], ["failed", "lost"]
+        )
+
+    def test_documents_without_id(self):
+        """Elasticsearch generates the id of documents without one"""
+        sink = ElasticsearchSink.__new__(ElasticsearchSink)
+        sink.config = MagicMock(bulk_size=10, bulk_flush_interval=60)
+        sink.bulk_buffer, sink.bulk_buffer_start = [], None
+        sink.bulk_lock = Lock()
+
+        sink._index(  # pylint: disable=protected-access
+            index="report_data", doc_id=None, body="{}", name="report"
+        )
+        sink._index(  # pylint: disable=protected-access
+            index="table_search_index", doc_id="1", body="{}", name="table"
+        )
+        self.assertEqual(
+            [json.loads(action) for _, action, _ in sink.bulk_buffer],
+            [
+                {"index": {"_index": "report_data"}},
+                {"index": {"_index": "table_search_index", "_id": "1"}},
+            ],
+        )
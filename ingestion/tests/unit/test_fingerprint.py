@@ -0,0 +1,101 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the fingerprints of the written requests
+"""
+import os
+import tempfile
+import uuid
+from unittest import TestCase
+
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.generated.schema.entity.data.table import Column, DataType, Table
+from metadata.ingestion.sink.fingerprint import FingerprintStore, get_fingerprint_key
+
+
+def table_request(description: str) -> CreateTableRequest:
+    return CreateTableRequest(
+        name="my.table",
+        databaseSchema="service.db.schema",
+        columns=[Column(name="id", dataType=DataType.INT)],
+        description=description,
+    )
+
+
+TABLE = Table(
+    id=uuid.uuid4(),
+    name="my.table",
+    columns=[Column(name="id", dataType=DataType.INT)],
+)
+
+
+def is_unchanged(store: FingerprintStore, description: str) -> bool:
+    return store.get_unchanged_entity(table_request(description), Table) is not None
+
+
+class FingerprintStoreTest(TestCase):
+    """
+    Validate when a request is considered unchanged
+    """
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "fingerprints.db")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_fingerprint_key(self):
+        self.assertEqual(
+            get_fingerprint_key(table_request("desc")),
+            'service.db.schema."my.table"',
+        )
+
+    def test_unchanged_request(self):
+        store = FingerprintStore(path=self.path, max_age=60)
+        self.assertFalse(is_unchanged(store, "desc"))
+
+        store.save(table_request("desc"), TABLE)
+        self.assertEqual(
+            store.get_unchanged_entity(table_request("desc"), Table), TABLE
+        )
+        self.assertFalse(is_unchanged(store, "new desc"))
+
+        store.remove('service.db.schema."my.table"')
+        self.assertFalse(is_unchanged(store, "desc"))
+        store.close()
+
+    def test_recursive_remove(self):
+        """Deleting a schema or database forgets the tables under it"""
+        store = FingerprintStore(path=self.path, max_age=60)
+        store.save(table_request("desc"), TABLE)
+
+        store.remove("service.db.sch", recursive=True)
+        store.remove("service.db", recursive=False)
+        self.assertTrue(is_unchanged(store, "desc"))
+
+        store.remove("service.db", recursive=True)
+        self.assertFalse(is_unchanged(store, "desc"))
+        store.close()
+
+    def test_fingerprints_are_kept_between_runs(self):
+        store = FingerprintStore(path=self.path, max_age=60)
+        store.save(table_request("desc"), TABLE)
+        store.close()
+
+        store = FingerprintStore(path=self.path, max_age=60)
+        self.assertTrue(is_unchanged(store, "desc"))
+        store.close()
+
+        # Old fingerprints are ignored
+        store = FingerprintStore(path=self.path, max_age=0)
+        self.assertFalse(is_unchanged(store, "desc"))
+        store.close()
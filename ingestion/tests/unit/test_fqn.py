@@ -11,6 +11,7 @@
 """
 Test FQN build behavior
 """
+import random
 from unittest import TestCase
 from unittest.mock import MagicMock
 
@@ -87,6 +88,46 @@ class TestFqn(TestCase):
         with self.assertRaises(Exception):
             fqn.split('a"')
 
+    def test_split_matches_antlr(self):
+        """
+        The fast path splits as the ANTLR grammar does, and rejects
+        the same FQNs
+        """
+        rng = random.Random(42)
+        for _ in range(5000):
+            name = "".join(rng.choice('ab ."') for _ in range(rng.randint(0, 12)))
+            try:
+                expected = fqn._antlr_split(name)
+            except Exception:  # pylint: disable=broad-except
+                expected = None
+            parts = fqn._fast_split(name)
+            self.assertEqual(expected, list(parts) if parts else None, name)
+
+            if expected is None:
+                with self.assertRaises(Exception):
+                    fqn.split(name)
+            else:
+                self.assertEqual(fqn.split(name), expected)
+
+    def test_split_tricky_names(self):
+        """
+        The fast path and the ANTLR parser agree on quoted names,
+        and reject the same invalid FQNs
+        """
+        for name in [
+            'service."data.base".schema.table.column',
+            '"a.b"."c.d"',
+            'a."b .c".d',
+            '"..".x',
+            'a b.c d',
+        ]:
+            self.assertEqual(list(fqn._fast_split(name)), fqn._antlr_split(name))
+
+        for name in ['"ab".c', "a..b", 'a."b', "a.", 'a"b.c']:
+            self.assertIsNone(fqn._fast_split(name))
+            with self.assertRaises(Exception):
+                fqn._antlr_split(name)
+
     def test_build_table(self):
         """
         Validate Table FQN building
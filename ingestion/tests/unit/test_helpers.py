@@ -22,6 +22,7 @@ from metadata.generated.schema.type.tagLabel import (
     TagSource,
 )
 from metadata.utils.helpers import (
+    batched,
     clean_up_starting_ending_double_quotes_in_string,
     deep_size_of_dict,
     get_entity_tier_from_tags,
@@ -145,3 +146,13 @@ class TestHelpers(TestCase):
         self.assertTrue(is_safe_sql_query(select_query))
         self.assertTrue(is_safe_sql_query(cte_query))
         self.assertFalse(is_safe_sql_query(transaction_query))
+
+    def test_batched(self):
+        """Iterables are split lazily in lists of the given size"""
+        self.assertEqual(list(batched(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(batched([], 2)), [])
+
+        consumed = []
+        batches = batched((consumed.append(i) or i for i in range(10)), 3)
+        self.assertEqual(next(batches), [0, 1, 2])
+        self.assertEqual(consumed, [0, 1, 2])
@@ -0,0 +1,101 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the buffered and the unchanged create requests of the metadata REST sink
+"""
+import os
+import tempfile
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
+from metadata.generated.schema.entity.data.table import Column, DataType, Table
+from metadata.generated.schema.type.entityLineage import EntitiesEdge
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.sink.metadata_rest import (
+    MetadataRestSink,
+    MetadataRestSinkConfig,
+)
+
+
+def table_request() -> CreateTableRequest:
+    return CreateTableRequest(
+        name="table",
+        databaseSchema="service.db.schema",
+        columns=[Column(name="id", dataType=DataType.INT)],
+    )
+
+
+class MetadataRestSinkTest(TestCase):
+    """Validate the buffered and the skipped requests"""
+
+    @patch("metadata.ingestion.sink.metadata_rest.OpenMetadata")
+    def test_creates_are_sent_before_other_records(self, _):
+        """Lineage is only sent after the buffered create requests"""
+        sink = MetadataRestSink(
+            MetadataRestSinkConfig(bulk_size=10, bulk_flush_interval=60),
+            metadata_config=MagicMock(),
+        )
+        sink.metadata.create_or_update_many.side_effect = lambda requests, **_: [
+            MagicMock() for _ in requests
+        ]
+
+        sink.write_record(table_request())
+        sink.metadata.create_or_update_many.assert_not_called()
+
+        sink.write_record(
+            AddLineageRequest(
+                edge=EntitiesEdge(
+                    fromEntity=EntityReference(id=uuid.uuid4(), type="table"),
+                    toEntity=EntityReference(id=uuid.uuid4(), type="table"),
+                )
+            )
+        )
+        self.assertEqual(
+            [call[0] for call in sink.metadata.method_calls],
+            ["create_or_update_many", "add_lineage"],
+        )
+        self.assertFalse(sink.bulk_buffer)
+
+    @patch("metadata.ingestion.sink.metadata_rest.OpenMetadata")
+    def test_unchanged_tables_are_acked(self, _):
+        """Skipped tables are handed back, and written if deleted in OpenMetadata"""
+        table = Table(
+            id=uuid.uuid4(),
+            name="table",
+            fullyQualifiedName="service.db.schema.table",
+            columns=[Column(name="id", dataType=DataType.INT)],
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sink = MetadataRestSink(
+                MetadataRestSinkConfig(
+                    fingerprint_store=os.path.join(tmp_dir, "fingerprints.db")
+                ),
+                metadata_config=MagicMock(),
+            )
+            sink.metadata.get_entity_from_create.return_value = Table
+            sink.metadata.create_or_update.return_value = table
+            acks = []
+            sink.register_ack_callback(lambda record, entity: acks.append(entity))
+
+            sink.write_record(table_request())
+            sink.metadata.list_all_entities.return_value = [table]
+            sink.write_record(table_request())
+            self.assertEqual(sink.metadata.create_or_update.call_count, 1)
+            self.assertEqual(acks, [table, table])
+
+            sink.existing_tables.clear()
+            sink.metadata.list_all_entities.return_value = []
+            sink.write_record(table_request())
+            self.assertEqual(sink.metadata.create_or_update.call_count, 2)
+            sink.close()
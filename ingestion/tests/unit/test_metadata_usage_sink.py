@@ -0,0 +1,97 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the Metadata Usage bulk sink
+"""
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from metadata.generated.schema.api.data.createQuery import CreateQueryRequest
+from metadata.generated.schema.entity.data.table import Column, DataType, Table
+from metadata.generated.schema.type.tableUsageCount import (
+    TableColumn,
+    TableColumnJoin,
+    TableUsageCount,
+)
+from metadata.ingestion.bulksink.metadata_usage import (
+    MetadataUsageBulkSink,
+    MetadataUsageSinkConfig,
+)
+
+
+def table_entity(name: str) -> Table:
+    return Table(
+        id=uuid4(),
+        name=name,
+        fullyQualifiedName=f"service.db.schema.{name}",
+        columns=[
+            Column(
+                name="id",
+                dataType=DataType.INT,
+                fullyQualifiedName=f"service.db.schema.{name}.id",
+            )
+        ],
+    )
+
+
+TABLES = {name: table_entity(name) for name in ("orders", "users")}
+
+
+class MetadataUsageBulkSinkTest(TestCase):
+    """Validate how the usage of the staging files is published"""
+
+    @patch(
+        "metadata.ingestion.bulksink.metadata_usage.get_table_entities_from_query",
+        side_effect=lambda table_name, **_: [TABLES[table_name]],
+    )
+    @patch("metadata.ingestion.bulksink.metadata_usage.OpenMetadata")
+    def test_usage_is_published_once_per_table(self, *_):
+        """The batches of the same day are published together"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "service_1")
+            with open(path, "w", encoding="utf-8") as file:
+                for query in ("SELECT 1", "SELECT 2", "SELECT 3"):
+                    usage = TableUsageCount(
+                        table="orders",
+                        date="1672531200",
+                        serviceName="service",
+                        count=1,
+                        databaseName="db",
+                        databaseSchema="schema",
+                        joins=[
+                            TableColumnJoin(
+                                tableColumn=TableColumn(table="orders", column="id"),
+                                joinedWith=[TableColumn(table="users", column="id")],
+                            )
+                        ],
+                        sqlQueries=[CreateQueryRequest(query=query)],
+                    )
+                    file.write(usage.json() + "\n")
+
+            sink = MetadataUsageBulkSink(
+                MetadataUsageSinkConfig(filename=tmp_dir), MagicMock()
+            )
+            sink.write_records()
+
+        sink.metadata.publish_table_usage.assert_called_once()
+        self.assertEqual(sink.metadata.publish_table_usage.call_args[0][1].count, 3)
+
+        sink.metadata.publish_frequently_joined_with.assert_called_once()
+        joins = sink.metadata.publish_frequently_joined_with.call_args[0][1]
+        self.assertEqual(len(joins.columnJoins), 1)
+        self.assertEqual(joins.columnJoins[0].joinedWith[0].joinCount, 3)
+
+        sink.metadata.ingest_entity_queries_data.assert_called_once()
+        queries = sink.metadata.ingest_entity_queries_data.call_args[1]["queries"]
+        self.assertEqual(len(queries), 3)
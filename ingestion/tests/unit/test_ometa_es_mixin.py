@@ -0,0 +1,86 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the ES searches of the OpenMetadata client
+"""
+import uuid
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.generated.schema.entity.teams.user import User
+from metadata.ingestion.ometa.mixins.es_mixin import ESMixin
+
+
+class ESClient(ESMixin):
+    """ESMixin with mocked API calls"""
+
+    def __init__(self, hits):
+        self.client = MagicMock()
+        self.client.get.return_value = {"hits": {"hits": hits}}
+        self.get_by_name = MagicMock(
+            side_effect=lambda entity, fqn, fields: f"fetched {fqn}"
+        )
+
+
+def user_source(name: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": name,
+        "fullyQualifiedName": name,
+        "email": f"{name}@open-metadata.org",
+        "suggest": [{"input": name, "weight": 5}],
+    }
+
+
+class ESMixinTest(TestCase):
+    """Validate how we turn ES hits into entities"""
+
+    def test_fetch_hits_by_name(self):
+        """Each hit is fetched from the API"""
+        client = ESClient([{"_source": user_source("aaron")}])
+
+        res = client.es_search_from_fqn(User, "aaron")
+
+        self.assertEqual(res, ["fetched aaron"])
+        client.get_by_name.assert_called_once()
+
+    def test_entities_from_source(self):
+        """Hits are turned into entities without calling the API"""
+        client = ESClient([{"_source": user_source("aaron")}])
+
+        res = client.es_search_from_fqn(User, "aaron", fields=[], from_source=True)
+
+        self.assertEqual(res[0].email.__root__, "aaron@open-metadata.org")
+        client.get_by_name.assert_not_called()
+        self.assertIn(
+            "include_source_fields=email", client.client.get.call_args.args[0]
+        )
+
+    def test_invalid_source_is_fetched(self):
+        """Documents that are not valid entities are fetched from the API"""
+        source = user_source("aaron")
+        source.pop("email")
+        client = ESClient([{"_source": source}])
+
+        res = client.es_search_from_fqn(User, "aaron", from_source=True)
+
+        self.assertEqual(res, ["fetched aaron"])
+
+    def test_searches_are_cached(self):
+        """The same search only hits ES once"""
+        client = ESClient([{"_source": user_source("aaron")}])
+
+        for _ in range(3):
+            client.es_search_from_fqn(User, "aaron", fields=["teams"])
+
+        client.client.get.assert_called_once()
+        self.assertEqual(client.es_cache.hits, 2)
+        self.assertEqual(client.es_cache.misses, 1)
@@ -27,6 +27,7 @@ from metadata.generated.schema.metadataIngestion.workflow import (
 from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.source.database.datalake.metadata import DatalakeSource
 from metadata.mixins.pandas.pandas_mixin import PandasInterfaceMixin
+from metadata.profiler.metrics.accumulator import DataFrameChunks
 
 from .topology.database.test_datalake import mock_datalake_config
 
@@ -76,8 +77,10 @@ class TestStringMethods(unittest.TestCase):
                 profile_sample_config=None,
             )
 
-            assert resp == method_resp_file
-            assert type(resp) == list
+            assert isinstance(resp, DataFrameChunks)
+            assert list(resp) == method_resp_file
+            # The file is read again on each pass over the chunks
+            assert list(resp) == method_resp_file
 
     @patch(
         "metadata.ingestion.source.database.database_service.DatabaseServiceSource.test_connection"
@@ -0,0 +1,74 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the pool of processes parsing queries
+"""
+import time
+from functools import partial
+from unittest import TestCase
+
+from metadata.ingestion.lineage.models import Dialect
+from metadata.ingestion.lineage.parser_pool import ParserPool
+from metadata.ingestion.lineage.sql_lineage import get_query_lineage
+
+
+def slow_square(number: int) -> int:
+    if number < 0:
+        time.sleep(10)
+    return number * number
+
+
+class ParserPoolTest(TestCase):
+    """Validate the results of the pool"""
+
+    def test_results_in_order(self):
+        """Results come back in the order of the items"""
+        pool = ParserPool(processes=2)
+        try:
+            self.assertEqual(
+                pool.map(slow_square, list(range(20))),
+                [number * number for number in range(20)],
+            )
+        finally:
+            pool.close()
+
+    def test_timeout(self):
+        """Items timing out are skipped without losing the rest"""
+        pool = ParserPool(processes=2, timeout_seconds=1)
+        try:
+            self.assertEqual(pool.map(slow_square, [1, -1, 2, 3]), [1, None, 4, 9])
+            self.assertEqual(pool.map(slow_square, [4]), [16])
+        finally:
+            pool.close()
+
+    def test_spawned_workers(self):
+        """Workers are not forked from the threads of the workflow"""
+        pool = ParserPool(processes=2)
+        try:
+            # pylint: disable=protected-access
+            self.assertEqual(pool.pool._ctx.get_start_method(), "spawn")
+        finally:
+            pool.close()
+
+    def test_query_lineage(self):
+        """The lineage parsed in the pool is the same as in this process"""
+        queries = [
+            "insert into target select * from source",
+            "create table new_table as select a, b from old_table",
+        ]
+        parse = partial(get_query_lineage, dialect=Dialect.ANSI)
+        pool = ParserPool(processes=2)
+        try:
+            lineages = pool.map(parse, queries)
+        finally:
+            pool.close()
+        self.assertEqual(lineages, [parse(query) for query in queries])
+        self.assertTrue(all(lineage.target_tables for lineage in lineages))
@@ -0,0 +1,152 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the cache of parsed query shapes
+"""
+import os
+import tempfile
+from unittest import TestCase
+
+from metadata.ingestion.lineage.models import Dialect, QueryTables
+from metadata.ingestion.lineage.parser_pool import ParserPool
+from metadata.ingestion.lineage.query_cache import (
+    ParsedQueryCache,
+    get_query_cache_key,
+    normalize_query,
+)
+
+
+class QueryCacheTest(TestCase):
+    """Validate the query fingerprints and the parsed results cache"""
+
+    def setUp(self) -> None:
+        self.calls = []
+
+    def parse(self, query: str) -> QueryTables:
+        self.calls.append(query)
+        return QueryTables(tables=[query.split()[-1]], joins={})
+
+    def test_normalize_query(self):
+        """Literals, comments and whitespace do not change the shape"""
+        self.assertEqual(
+            normalize_query("SELECT * FROM orders WHERE id = 1 AND name = 'a'"),
+            normalize_query(
+                "SELECT *  -- all columns\n FROM orders\n"
+                "WHERE id = 42 /* id */ AND name = 'it''s'"
+            ),
+        )
+        self.assertEqual(
+            normalize_query("SELECT a FROM t WHERE id IN (1, 2, 3)"),
+            normalize_query("SELECT a FROM t WHERE id IN (4)"),
+        )
+        self.assertNotEqual(
+            normalize_query('SELECT a FROM "t1"'), normalize_query('SELECT a FROM "t2"')
+        )
+        self.assertNotEqual(
+            normalize_query("SELECT a FROM t1"), normalize_query("SELECT a FROM t2")
+        )
+
+    def test_normalize_identifiers(self):
+        """Numbers and quotes within identifiers are not literals"""
+        self.assertNotEqual(
+            normalize_query("SELECT * FROM db.2023_sales"),
+            normalize_query("SELECT * FROM db.2024_sales"),
+        )
+        self.assertNotEqual(
+            normalize_query("SELECT * FROM sales_2023"),
+            normalize_query("SELECT * FROM sales_2024"),
+        )
+        # In standard SQL, 'x\' is a whole string
+        self.assertEqual(
+            normalize_query("SELECT 'x\\' FROM t1 WHERE a = 'b'"),
+            "SELECT ? FROM t1 WHERE a = ?",
+        )
+        self.assertNotEqual(
+            normalize_query("SELECT 'x\\' FROM t1 WHERE a = 'b'"),
+            normalize_query("SELECT 'x\\' FROM t2 WHERE a = 'b'"),
+        )
+        self.assertEqual(
+            normalize_query("SELECT 'it\\'s' FROM t1", Dialect.MYSQL),
+            "SELECT ? FROM t1",
+        )
+
+    def test_query_cache_key(self):
+        """The key depends on the dialect and the default database and schema"""
+        query = "SELECT a FROM t"
+        key = get_query_cache_key(query, Dialect.ANSI, "db", "schema")
+        self.assertEqual(
+            key, get_query_cache_key(query + " ", Dialect.ANSI, "db", "schema")
+        )
+        self.assertNotEqual(
+            key, get_query_cache_key(query, Dialect.POSTGRES, "db", "schema")
+        )
+        self.assertNotEqual(key, get_query_cache_key(query, Dialect.ANSI, "db", "s2"))
+
+    def test_parse_once_per_shape(self):
+        """Queries with the same key are parsed once, and results keep the order"""
+        cache = ParsedQueryCache(QueryTables)
+        queries = ["SELECT 1 FROM a", "SELECT 2 FROM a", "SELECT 1 FROM b"]
+        keys = [get_query_cache_key(query, Dialect.ANSI) for query in queries]
+
+        res = cache.parse(ParserPool(1), self.parse, queries, keys)
+        self.assertEqual([tables.tables for tables in res], [["a"], ["a"], ["b"]])
+        self.assertEqual(self.calls, ["SELECT 1 FROM a", "SELECT 1 FROM b"])
+
+        cache.parse(ParserPool(1), self.parse, ["SELECT 3 FROM b"], keys[2:])
+        self.assertEqual(len(self.calls), 2)
+
+    def test_reuse_stored_results(self):
+        """Results stored in a file are reused, including queries without tables"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "queries.db")
+            cache = ParsedQueryCache(QueryTables, path=path)
+            cache.put("parsed", QueryTables(tables=["a"], joins={}))
+            cache.put("no_tables", None)
+            cache.close()
+
+            cache = ParsedQueryCache(QueryTables, path=path)
+            try:
+                res = cache.parse(
+                    ParserPool(1),
+                    self.parse,
+                    ["SELECT a FROM a", "SELECT 1", "SELECT c FROM c"],
+                    ["parsed", "no_tables", "missing"],
+                )
+            finally:
+                cache.close()
+
+            self.assertEqual(res[0].tables, ["a"])
+            self.assertIsNone(res[1])
+            self.assertEqual(res[2].tables, ["c"])
+            self.assertEqual(self.calls, ["SELECT c FROM c"])
+
+    def test_failures_not_cached(self):
+        """Queries failing in the parser pool are parsed again"""
+
+        def parse(query: str) -> QueryTables:
+            self.calls.append(query)
+            if len(self.calls) == 1:
+                raise TimeoutError("Parsing took too long")
+            return QueryTables(tables=["a"], joins={})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "queries.db")
+            cache = ParsedQueryCache(QueryTables, path=path)
+            try:
+                res = cache.parse(ParserPool(1), parse, ["SELECT a FROM a"], ["key"])
+                self.assertEqual(res, [None])
+                self.assertEqual(cache._lookup("key"), {})
+
+                res = cache.parse(ParserPool(1), parse, ["SELECT a FROM a"], ["key"])
+                self.assertEqual(res[0].tables, ["a"])
+                self.assertEqual(len(self.calls), 2)
+            finally:
+                cache.close()
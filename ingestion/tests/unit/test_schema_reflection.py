@@ -0,0 +1,125 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the schema level bulk reflection
+"""
+from collections import namedtuple
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.ingestion.source.database.schema_reflection import (
+    EMPTY_PK_CONSTRAINT,
+    SchemaInspector,
+    SchemaReflector,
+    constraints_from_key_column_usage,
+)
+
+ConstraintRow = namedtuple(
+    "ConstraintRow",
+    [
+        "table_name",
+        "constraint_name",
+        "constraint_type",
+        "column_name",
+        "referred_schema",
+        "referred_table",
+        "referred_column",
+    ],
+)
+
+CONSTRAINT_ROWS = [
+    ConstraintRow("orders", "orders_pk", "PRIMARY KEY", "id", None, None, None),
+    ConstraintRow(
+        "orders", "orders_user_fk", "FOREIGN KEY", "user_id", "shop", "users", "id"
+    ),
+    ConstraintRow(
+        "orders", "orders_user_fk", "FOREIGN KEY", "user_org", "shop", "users", "org"
+    ),
+    ConstraintRow("users", "users_email_uq", "UNIQUE", "email", None, None, None),
+]
+
+
+class MockReflector(SchemaReflector):
+    def __init__(self):
+        self.calls = 0
+
+    def get_schema_columns(self, inspector, schema):
+        self.calls += 1
+        return {"orders": [{"name": "id"}]}
+
+    def get_schema_constraints(self, inspector, schema):
+        return constraints_from_key_column_usage(CONSTRAINT_ROWS)
+
+
+class SchemaReflectionTest(TestCase):
+    """
+    Validate the SchemaInspector against the wrapped inspector
+    """
+
+    def test_constraints_from_key_column_usage(self):
+        constraints = constraints_from_key_column_usage(CONSTRAINT_ROWS)
+
+        self.assertEqual(
+            constraints["pk_constraints"]["orders"],
+            {"constrained_columns": ["id"], "name": "orders_pk"},
+        )
+        self.assertEqual(
+            constraints["foreign_keys"]["orders"],
+            [
+                {
+                    "name": "orders_user_fk",
+                    "constrained_columns": ["user_id", "user_org"],
+                    "referred_schema": "shop",
+                    "referred_table": "users",
+                    "referred_columns": ["id", "org"],
+                    "options": {},
+                }
+            ],
+        )
+        self.assertEqual(
+            constraints["unique_constraints"]["users"],
+            [{"column_names": ["email"], "name": "users_email_uq"}],
+        )
+
+    def test_schema_inspector(self):
+        inspector = MagicMock()
+        reflector = MockReflector()
+        schema_inspector = SchemaInspector(inspector, "shop", reflector)
+
+        # Reflected once for the whole schema
+        for _ in range(2):
+            self.assertEqual(
+                schema_inspector.get_columns("orders", "shop"), [{"name": "id"}]
+            )
+        self.assertEqual(reflector.calls, 1)
+        inspector.get_columns.assert_not_called()
+
+        self.assertEqual(
+            schema_inspector.get_pk_constraint("users", "shop"), EMPTY_PK_CONSTRAINT
+        )
+        self.assertEqual(schema_inspector.get_foreign_keys("users", "shop"), [])
+
+        # Missing tables, other schemas and unsupported information use the inspector
+        schema_inspector.get_columns("missing", "shop")
+        inspector.get_columns.assert_called_once_with("missing", "shop")
+        schema_inspector.get_pk_constraint("orders", "other")
+        inspector.get_pk_constraint.assert_called_once_with("orders", "other")
+        schema_inspector.get_table_comment("orders", "shop")
+        inspector.get_table_comment.assert_called_once_with("orders", "shop")
+
+    def test_reflection_error_falls_back(self):
+        inspector = MagicMock()
+        reflector = MockReflector()
+        reflector.get_schema_columns = MagicMock(side_effect=RuntimeError("boom"))
+        schema_inspector = SchemaInspector(inspector, "shop", reflector)
+
+        schema_inspector.get_columns("orders", "shop")
+        inspector.get_columns.assert_called_once_with("orders", "shop")
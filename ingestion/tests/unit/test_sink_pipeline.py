@@ -0,0 +1,80 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the pipelined sink execution
+"""
+import threading
+import time
+from unittest import TestCase
+
+from metadata.ingestion.api.sink_pipeline import SinkPipeline, SinkPipelineException
+
+
+class FakeSink:
+    """
+    Keep track of the written records and of how
+    many of them were in flight at the same time
+    """
+
+    def __init__(self, fail_on=None):
+        self.written = []
+        self.in_flight = set()
+        self.max_in_flight_types = 0
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+
+    def write_record(self, record):
+        with self.lock:
+            self.in_flight.add(record)
+            self.max_in_flight_types = max(
+                self.max_in_flight_types,
+                len({type(rec) for rec in self.in_flight}),
+            )
+        time.sleep(0.01)
+        if record == self.fail_on:
+            raise RuntimeError("boom")
+        with self.lock:
+            self.in_flight.discard(record)
+            self.written.append(record)
+
+
+class SinkPipelineTest(TestCase):
+    """
+    Validate the SinkPipeline ordering and error handling
+    """
+
+    def test_all_records_written(self):
+        sink = FakeSink()
+        with SinkPipeline(sink=sink, thread_count=4, queue_size=2) as pipeline:
+            for idx in range(20):
+                pipeline.put(idx)
+            pipeline.wait()
+
+        self.assertEqual(sorted(sink.written), list(range(20)))
+
+    def test_types_are_not_mixed(self):
+        sink = FakeSink()
+        with SinkPipeline(sink=sink, thread_count=4, queue_size=10) as pipeline:
+            for record in [1, 2, 3, "a", "b", 4, 5]:
+                pipeline.put(record)
+            pipeline.wait()
+
+        self.assertEqual(sink.max_in_flight_types, 1)
+        self.assertEqual(set(sink.written[:3]), {1, 2, 3})
+        self.assertEqual(set(sink.written[3:5]), {"a", "b"})
+
+    def test_worker_error_is_raised(self):
+        sink = FakeSink(fail_on=3)
+        with self.assertRaises(SinkPipelineException):
+            with SinkPipeline(sink=sink, thread_count=2, queue_size=2) as pipeline:
+                for idx in range(10):
+                    pipeline.put(idx)
+                pipeline.wait()
@@ -0,0 +1,111 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Validate the tables of a test suite workflow run concurrently"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from metadata.data_quality.api.workflow import TestSuiteWorkflow
+from metadata.data_quality.source.base_test_suite_source import SharedEngines
+from metadata.generated.schema.entity.data.database import Database
+from metadata.ingestion.api.processor import ProcessorStatus
+
+
+def test_shared_engines():
+    """Tables of the same database share its engine"""
+    engines = SharedEngines()
+    with patch(
+        "metadata.data_quality.source.base_test_suite_source.get_connection",
+        side_effect=lambda _: MagicMock(),
+    ) as get_connection:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            shared = set(pool.map(lambda _: engines.get("db", None), range(10)))
+        other = engines.get("other_db", None)
+
+    assert len(shared) == 1
+    assert other not in shared
+    assert get_connection.call_count == 2
+
+    engines.dispose()
+    other.dispose.assert_called_once()
+
+
+@mark.parametrize("threads", [1, 4])
+def test_run_tables(threads):
+    """Results of every table are yielded, failing tables are recorded"""
+    workflow = TestSuiteWorkflow.__new__(TestSuiteWorkflow)
+    workflow.source_config = MagicMock(tableThreadCount=threads)
+    workflow.status = ProcessorStatus()
+
+    tables = []
+    for idx in range(10):
+        table = MagicMock()
+        table.fullyQualifiedName.__root__ = f"service.db.schema.table_{idx}"
+        tables.append(table)
+
+    def run_table_tests(table):
+        name = table.fullyQualifiedName.__root__
+        if name.endswith("_3"):
+            raise RuntimeError("Connection lost")
+        return [name]
+
+    with patch.object(workflow, "run_table_tests", side_effect=run_table_tests):
+        results = list(workflow.run_tables(tables))
+
+    assert sorted(name for result in results for name in result) == sorted(
+        f"service.db.schema.table_{idx}" for idx in range(10) if idx != 3
+    )
+    assert len(workflow.status.failures) == 1
+
+
+def _entity(fully_qualified_name, service_name=None):
+    entity = MagicMock()
+    entity.fullyQualifiedName.__root__ = fully_qualified_name
+    entity.service.name = service_name
+    return entity
+
+
+def test_get_table_entities_of_service():
+    """Tables of a service are listed by database, other services are skipped"""
+    workflow = TestSuiteWorkflow.__new__(TestSuiteWorkflow)
+    workflow.table_entity = None
+    workflow.source_config = MagicMock()
+    workflow.source_config.entityFullyQualifiedName.__root__ = "service"
+    workflow.processor_config = MagicMock(testCases=None)
+    workflow.metadata = MagicMock()
+
+    def list_all_entities(entity, params, **_):
+        if entity is Database:
+            return [_entity("service.db_1"), _entity("service.db_2")]
+        database = params["database"]
+        return [
+            _entity(f"{database}.schema.table", "service"),
+            _entity(f"other.{database}.schema.table", "other"),
+        ]
+
+    workflow.metadata.list_all_entities.side_effect = list_all_entities
+    tables = list(workflow.get_table_entities())
+
+    assert [table.fullyQualifiedName.__root__ for table in tables] == [
+        "service.db_1.schema.table",
+        "service.db_2.schema.table",
+    ]
+    assert [
+        call.kwargs["params"]
+        for call in workflow.metadata.list_all_entities.call_args_list
+    ] == [
+        {"service": "service"},
+        {"database": "service.db_1"},
+        {"database": "service.db_2"},
+    ]
@@ -19,6 +19,7 @@ from unittest.mock import patch
 
 import pytest
 
+from metadata.data_quality.runner.fused_metrics import FusedMetrics
 from metadata.data_quality.validations.validator import Validator
 from metadata.generated.schema.tests.basic import (
     TestCaseFailureStatusType,
@@ -345,3 +346,56 @@ def test_suite_validation_database(
             == TestCaseFailureStatusType.New
         )
         assert res.testCaseFailureStatus.updatedAt is not None
+
+
+def test_suite_validation_fused_metrics(request, create_sqlite_table):
+    """Metrics of the test cases are computed together, with the same results"""
+    test_cases = [
+        ("test_case_column_value_max_to_be_between", "columnValueMaxToBeBetween"),
+        ("test_case_column_value_mean_to_be_between", "columnValueMeanToBeBetween"),
+        ("test_case_column_value_in_set", "columnValuesToBeInSet"),
+        (
+            "test_case_column_values_missing_count_to_be_equal",
+            "columnValuesMissingCount",
+        ),
+        ("test_case_column_values_to_be_not_null", "columnValuesToBeNotNull"),
+        (
+            "test_case_column_value_median_to_be_between",
+            "columnValueMedianToBeBetween",
+        ),
+        ("test_case_table_row_count_to_be_between", "tableRowCountToBeBetween"),
+    ]
+
+    def validate(test_case, fused_metrics=None):
+        test_case_name, test_case_type = test_case
+        test_type = "TABLE" if test_case_type.startswith("table") else "COLUMN"
+        test_handler = import_test_case_class(
+            test_type, "sqlalchemy", test_case_type
+        )(
+            create_sqlite_table,
+            test_case=request.getfixturevalue(test_case_name),
+            execution_date=EXECUTION_DATE.timestamp(),
+        )
+        test_handler.fused_metrics = fused_metrics
+        return Validator(test_handler).validate()
+
+    expected = [validate(test_case) for test_case in test_cases]
+
+    fused_metrics = FusedMetrics(create_sqlite_table)
+    with patch.object(
+        create_sqlite_table,
+        "dispatch_query_select_first",
+        wraps=create_sqlite_table.dispatch_query_select_first,
+    ) as dispatch:
+        results = dict(
+            fused_metrics.run_in_rounds(
+                test_cases, lambda test_case: validate(test_case, fused_metrics)
+            )
+        )
+
+    for test_case, res in zip(test_cases, expected):
+        assert results[test_case].testCaseStatus == res.testCaseStatus
+        assert results[test_case].testResultValue == res.testResultValue
+    # Median is a window function and runs on its own
+    assert dispatch.call_count == 2
+    assert not fused_metrics.failed
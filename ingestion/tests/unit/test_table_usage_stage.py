@@ -0,0 +1,43 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the Table Usage stage
+"""
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.ingestion.stage.table_usage import TableStageConfig, TableUsageStage
+
+
+class TableUsageStageTest(TestCase):
+    """Validate how the stage resolves the query users"""
+
+    @patch("metadata.ingestion.stage.table_usage.OpenMetadata")
+    def test_users_are_cached(self, _):
+        """Each user name is only looked up once, found or not"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stage = TableUsageStage(TableStageConfig(filename=tmp_dir), MagicMock())
+            stage.metadata.get_by_name.side_effect = lambda entity, fqn: (
+                MagicMock(**{"fullyQualifiedName.__root__": fqn})
+                if fqn == "etl"
+                else None
+            )
+
+            for _ in range(3):
+                self.assertEqual(stage._get_user_entity("etl"), ["etl"])
+                self.assertEqual(stage._get_user_entity("unknown"), [])
+            self.assertEqual(stage._get_user_entity(""), [])
+
+            self.assertEqual(stage.metadata.get_by_name.call_count, 2)
+            self.assertEqual(stage.status.user_cache_misses, 2)
+            self.assertEqual(stage.status.user_cache_hits, 4)
+            stage.close()
@@ -14,6 +14,7 @@
 Usage via query logs tests
 """
 
+from copy import deepcopy
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
@@ -132,3 +133,16 @@ class QueryLogSourceTest(TestCase):
         TableQuery.__eq__ = custom_query_compare
         for index in range(len(queries[0].queries)):
             assert queries[0].queries[index] == EXPECTED_QUERIES[index]
+
+    def test_queries_in_batches(self):
+        """
+        The log file is read in batches of queryBatchSize queries
+        """
+        source_config = deepcopy(mock_query_log_config["source"])
+        source_config["sourceConfig"]["config"]["queryBatchSize"] = 2
+        source = QueryLogUsageSource.create(
+            source_config,
+            self.config.workflowConfig.openMetadataServerConfig,
+        )
+        batches = list(source.get_table_query())
+        assert [len(batch.queries) for batch in batches] == [2, 1]
@@ -0,0 +1,63 @@
+#  Copyright 2021 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Test the watermark used for incremental extraction
+"""
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metadata.generated.schema.entity.services.ingestionPipelines.ingestionPipeline import (
+    PipelineState,
+    PipelineStatus,
+)
+from metadata.workflow.workflow_status_mixin import WorkflowStatusMixin
+
+
+class MockWorkflow(WorkflowStatusMixin):
+    def __init__(self, pipeline_fqn):
+        self.config = MagicMock()
+        self.config.ingestionPipelineFQN = pipeline_fqn
+        self.metadata = MagicMock()
+        self._run_id = "current"
+
+
+def status(run_id: str, state: PipelineState, start: int) -> PipelineStatus:
+    return PipelineStatus(runId=run_id, pipelineState=state, startDate=start)
+
+
+class WorkflowStatusMixinTest(TestCase):
+    """
+    Validate how we pick the last successful run
+    """
+
+    def test_last_successful_run_start(self):
+        workflow = MockWorkflow("service.pipeline")
+        workflow.metadata.get_pipeline_status_between_ts.return_value = [
+            status("old", PipelineState.success, 1_000_000),
+            status("partial", PipelineState.partialSuccess, 2_000_000),
+            status("failed", PipelineState.failed, 3_000_000),
+            status("current", PipelineState.running, 4_000_000),
+        ]
+
+        self.assertEqual(
+            workflow.get_last_successful_run_start(),
+            datetime.fromtimestamp(1_000, tz=timezone.utc),
+        )
+
+    def test_no_previous_run(self):
+        workflow = MockWorkflow("service.pipeline")
+        workflow.metadata.get_pipeline_status_between_ts.return_value = None
+        self.assertIsNone(workflow.get_last_successful_run_start())
+
+        workflow = MockWorkflow(None)
+        self.assertIsNone(workflow.get_last_successful_run_start())
+        workflow.metadata.get_pipeline_status_between_ts.assert_not_called()
@@ -13,7 +13,8 @@
 """
 Unit tests for datalake source
 """
-
+import os
+import tempfile
 from copy import deepcopy
 from types import SimpleNamespace
 from unittest import TestCase
@@ -32,7 +33,9 @@ from metadata.generated.schema.metadataIngestion.workflow import (
 from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.source.database.datalake.metadata import DatalakeSource
 from metadata.utils.datalake.avro_dispatch import read_from_avro
-from metadata.utils.datalake.json_dispatch import read_from_json
+from metadata.utils.datalake.csv_tsv_dispatch import read_from_pandas
+from metadata.utils.datalake.json_dispatch import read_json_chunks
+from metadata.utils.datalake.parquet_dispatch import read_parquet_file
 
 mock_datalake_config = {
     "source": {
@@ -433,17 +436,25 @@ class DatalakeUnitTest(TestCase):
         )
         exp_df_obj = pd.json_normalize(sample_dict)
 
-        actual_df_1 = read_from_json(key="file.json", json_text=EXAMPLE_JSON_TEST_1)[0]
-        actual_df_2 = read_from_json(key="file.json", json_text=EXAMPLE_JSON_TEST_2)[0]
+        actual_df_1 = next(
+            read_json_chunks(key="file.json", json_text=EXAMPLE_JSON_TEST_1)
+        )
+        actual_df_2 = next(
+            read_json_chunks(key="file.json", json_text=EXAMPLE_JSON_TEST_2)
+        )
 
         assert actual_df_1.compare(exp_df_list).empty
         assert actual_df_2.compare(exp_df_obj).empty
 
-        actual_df_3 = read_from_json(key="file.json", json_text=EXAMPLE_JSON_TEST_3)[0]
+        actual_df_3 = next(
+            read_json_chunks(key="file.json", json_text=EXAMPLE_JSON_TEST_3)
+        )
         actual_cols_3 = DatalakeSource.get_columns(actual_df_3)
         self.assertEqual(actual_cols_3, EXAMPLE_JSON_COL_3)
 
-        actual_df_4 = read_from_json(key="file.json", json_text=EXAMPLE_JSON_TEST_4)[0]
+        actual_df_4 = next(
+            read_json_chunks(key="file.json", json_text=EXAMPLE_JSON_TEST_4)
+        )
         actual_cols_4 = DatalakeSource.get_columns(actual_df_4)
         self.assertEqual(actual_cols_4, EXAMPLE_JSON_COL_4)
 
@@ -455,3 +466,58 @@ class DatalakeUnitTest(TestCase):
 
         columns = read_from_avro(AVRO_DATA_FILE)
         assert EXPECTED_AVRO_COL_2 == columns.columns  # pylint: disable=no-member
+
+    def test_parquet_file_read(self):
+        """
+        Parquet files are read by row groups, with column projection
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table({"id": list(range(100)), "name": ["a"] * 100})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "file.parquet")
+            pq.write_table(table, path, row_group_size=10)
+
+            chunks = list(read_parquet_file(path, columns=["id", "missing"]))
+            self.assertEqual(sum(len(chunk) for chunk in chunks), 100)
+            self.assertEqual(list(chunks[0].columns), ["id"])
+
+            chunks = list(read_parquet_file(path, nrows=15))
+            self.assertEqual(sum(len(chunk) for chunk in chunks), 15)
+
+            # 3 of the 10 row groups are read whole
+            chunks = list(read_parquet_file(path, sample_fraction=0.3))
+            ids = [value for chunk in chunks for value in chunk["id"]]
+            self.assertEqual(len(ids), 30)
+            self.assertEqual(len({value // 10 for value in ids}), 3)
+
+            # 25 rows sampled from the 3 row groups holding enough rows
+            chunks = list(read_parquet_file(path, sample_rows=25, seed=1))
+            ids = [value for chunk in chunks for value in chunk["id"]]
+            self.assertEqual(len(set(ids)), 25)
+            self.assertLessEqual(len({value // 10 for value in ids}), 3)
+            # The same seed gives the same sample
+            chunks = list(read_parquet_file(path, sample_rows=25, seed=1))
+            self.assertEqual(
+                sorted(ids), sorted(value for chunk in chunks for value in chunk["id"])
+            )
+
+    def test_csv_file_read(self):
+        """
+        CSV files are read lazily, with column projection
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "file.csv")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("id,name\n")
+                file.writelines(f"{i},a\n" for i in range(100))
+
+            chunks = list(read_from_pandas(path, ",", columns=["name"], nrows=20))
+            self.assertEqual(sum(len(chunk) for chunk in chunks), 20)
+            self.assertEqual(list(chunks[0].columns), ["name"])
+
+            chunks = list(read_from_pandas(path, ",", sample_rows=30, seed=1))
+            ids = [value for chunk in chunks for value in chunk["id"]]
+            self.assertEqual(len(set(ids)), 30)
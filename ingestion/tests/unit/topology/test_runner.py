@@ -12,8 +12,19 @@
 """
 Check that we are properly running nodes and stages
 """
+from typing import Optional
 from unittest import TestCase
+from unittest.mock import MagicMock
 
+from pydantic import BaseModel
+
+from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
+from metadata.generated.schema.api.data.createDatabaseSchema import (
+    CreateDatabaseSchemaRequest,
+)
+from metadata.generated.schema.entity.data.database import Database
+from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+from metadata.generated.schema.type.basic import FullyQualifiedEntityName
 from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
 from metadata.ingestion.models.topology import (
     NodeStage,
@@ -72,6 +83,106 @@ class MockSource(TopologyRunnerMixin):
         yield my_str + str(self.context.numbers)
 
 
+class MockTag(BaseModel):
+    fqn: Optional[FullyQualifiedEntityName]
+    name: str
+
+
+class MockTagTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_tags",
+        stages=[
+            NodeStage(
+                type_=MockTag,
+                context="tags",
+                processor="yield_tag",
+                ack_sink=False,
+                cache_by_fqn=True,
+            )
+        ],
+    )
+
+
+class MockTagSource(TopologyRunnerMixin):
+    topology = MockTagTopology()
+    context = create_source_context(topology)
+
+    @staticmethod
+    def get_tags():
+        yield MockTag(fqn="service.db.schema.table", name="PII")
+        yield MockTag(fqn="service.db.schema.table", name="Sensitive")
+        yield MockTag(fqn=None, name="Tier1")
+
+    @staticmethod
+    def yield_tag(tag: MockTag):
+        yield tag
+
+
+MOCK_DATABASE = Database(
+    id="2aaa012e-099a-11ed-861d-0242ac120002",
+    name="db",
+    fullyQualifiedName="service.db",
+    service={"id": "85811038-099a-11ed-861d-0242ac120002", "type": "databaseService"},
+)
+
+
+class MockDatabaseTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_databases",
+        stages=[
+            NodeStage(
+                type_=Database,
+                context="database",
+                processor="yield_database",
+            )
+        ],
+    )
+
+
+class MockThreadsTopology(ServiceTopology):
+    root = TopologyNode(
+        producer="get_schemas",
+        stages=[
+            NodeStage(
+                type_=DatabaseSchema,
+                context="database_schema",
+                processor="yield_database_schema",
+                ack_sink=False,
+            )
+        ],
+        threads=True,
+    )
+
+
+class MockThreadsSource(TopologyRunnerMixin):
+    topology = MockThreadsTopology()
+    context = create_source_context(topology)
+
+    def get_threads(self) -> int:
+        return 4
+
+    def get_schemas(self):
+        yield from (f"schema_{idx}" for idx in range(10))
+
+    def yield_database_schema(self, name: str):
+        yield CreateDatabaseSchemaRequest(name=name, database="service.db")
+
+
+class MockDatabaseSource(TopologyRunnerMixin):
+    topology = MockDatabaseTopology()
+    context = create_source_context(topology)
+
+    def __init__(self):
+        self.metadata = MagicMock()
+        self.metadata.config = None
+
+    def get_databases(self):
+        yield "db"
+
+    def yield_database(self, name: str):
+        yield CreateDatabaseRequest(name=name, service="service")
+
+
 class TopologyRunnerTest(TestCase):
     """
     Validate filter patterns
@@ -81,3 +192,43 @@ class TopologyRunnerTest(TestCase):
         source = MockSource()
         processed = list(source.next_record())
         assert processed == [2, "abc2", "def2", 3, "abc3", "def3"]
+
+    def test_cache_by_fqn(self):
+        source = MockTagSource()
+        list(source.next_record())
+        tags = source.context.tags
+        assert [tag.name for tag in tags["service.db.schema.table"]] == [
+            "PII",
+            "Sensitive",
+        ]
+        assert [tag.name for tag in tags[None]] == ["Tier1"]
+
+    def test_acked_entity_skips_get(self):
+        source = MockDatabaseSource()
+        for record in source.next_record():
+            self.assertTrue(source.is_ack_pending())
+            source.ack(record, MOCK_DATABASE)
+
+        self.assertFalse(source.is_ack_pending())
+        self.assertEqual(source.context.database, MOCK_DATABASE)
+        source.metadata.get_by_name.assert_not_called()
+
+    def test_get_without_ack(self):
+        source = MockDatabaseSource()
+        source.metadata.get_by_name.return_value = MOCK_DATABASE
+        records = list(source.next_record())
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(source.context.database, MOCK_DATABASE)
+        source.metadata.get_by_name.assert_called_once()
+
+    def test_threads(self):
+        source = MockThreadsSource()
+        records = list(source.next_record())
+
+        self.assertEqual(
+            sorted(record.name.__root__ for record in records),
+            sorted(f"schema_{idx}" for idx in range(10)),
+        )
+        # The threads do not update the source context
+        self.assertIsNone(source.context.database_schema)